@@ -2,410 +2,809 @@
 """
 Simplified Real API Integration Test
 Tests all 6 MCP servers with actual API calls
+
+The six service tests hit independent hosts, so they run concurrently and
+the total wall time is bounded by the slowest single service.
 """
 
+import asyncio
+import hashlib
+import importlib.util
+import json
 import os
+import random
+import re
 import sys
+import threading
+import time
+import types
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
-# Load environment
+# Load environment (skip importing dotenv entirely when there is no .env)
 PROJECT_ROOT = Path(__file__).parent
-load_dotenv(PROJECT_ROOT / ".env")
+if (PROJECT_ROOT / ".env").exists():
+    from dotenv import load_dotenv
+    load_dotenv(PROJECT_ROOT / ".env")
+
+# One canonical run timestamp, shared by every check so their posts,
+# messages and log lines correlate
+NOW = datetime.now()
+NOW_ISO = NOW.isoformat()
+NOW_DATE = NOW.strftime("%Y-%m-%d")
+NOW_HUMAN = NOW.strftime("%Y-%m-%d %H:%M:%S")
+
+# Every environment key the checks read, snapshotted once after .env loads
+SERVICES: dict[str, tuple[str, ...]] = {
+    "twitter": (
+        "TWITTER_API_KEY",
+        "TWITTER_API_SECRET",
+        "TWITTER_ACCESS_TOKEN",
+        "TWITTER_ACCESS_TOKEN_SECRET",
+    ),
+    "linkedin": ("LINKEDIN_ACCESS_TOKEN", "LINKEDIN_PAGE_ID"),
+    "meta": ("META_ACCESS_TOKEN",),
+    "whatsapp": ("WHATSAPP_ACCESS_TOKEN", "WHATSAPP_PHONE_NUMBER_ID", "TEST_WHATSAPP_PHONE"),
+    "odoo": ("ODOO_DB", "ODOO_USER", "ODOO_API_KEY"),
+}
+OPTIONAL_KEYS = (
+    "TEST_EMAIL_RECIPIENT",
+    "FACEBOOK_PAGE_ID",
+    "INSTAGRAM_BUSINESS_ACCOUNT_ID",
+    "ODOO_URL",
+)
+CONFIG = types.MappingProxyType({
+    k: os.environ.get(k)
+    for k in (*(k for keys in SERVICES.values() for k in keys), *OPTIONAL_KEYS)
+})
+ENABLED = {name: all(CONFIG[k] for k in keys) for name, keys in SERVICES.items()}
+
+# One keep-alive session shared by the LinkedIn, Meta and WhatsApp checks so
+# repeat calls to the same host skip the TCP + TLS handshake. Retries are
+# left to retry() below: the checks are POSTs, which urllib3 never retries.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+
+class RateLimitedClient:
+    """Per-host admission control in front of a requests.Session.
+
+    Proactively keeps each host under a sliding-window requests-per-minute
+    budget, reactively pauses on Retry-After / low X-RateLimit-Remaining,
+    and adapts per-host concurrency with AIMD (+0.5 on success, x0.5 on
+    429/5xx).
+    """
+
+    WINDOW_SECONDS = 60.0
+    LOW_REMAINING_RATIO = 0.1
+    MAX_PAUSE_SECONDS = 60.0
+
+    def __init__(self, session: requests.Session, rpm: int = 60, max_concurrency: float = 4.0):
+        self.session = session
+        self.rpm = rpm
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._windows: dict[str, deque] = defaultdict(deque)
+        self._paused_until: dict[str, float] = defaultdict(float)
+        self._concurrency: dict[str, float] = defaultdict(lambda: max_concurrency)
+        self._in_flight: dict[str, int] = defaultdict(int)
+
+    def wait_if_throttled(self, host: str) -> None:
+        """Block until a request slot for host is admissible, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                window = self._windows[host]
+                while window and now - window[0] >= self.WINDOW_SECONDS:
+                    window.popleft()
+
+                wait = self._paused_until[host] - now
+                if len(window) >= self.rpm:
+                    wait = max(wait, window[0] + self.WINDOW_SECONDS - now)
+                if self._in_flight[host] >= max(1, int(self._concurrency[host])):
+                    wait = max(wait, 0.05)
+
+                if wait <= 0:
+                    window.append(now)
+                    self._in_flight[host] += 1
+                    return
+            time.sleep(wait)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        host = urlsplit(url).hostname or url
+        self.wait_if_throttled(host)
+        try:
+            response = self.session.post(url, **kwargs)
+        finally:
+            with self._lock:
+                self._in_flight[host] -= 1
+        self._observe(host, response)
+        return response
+
+    def _observe(self, host: str, response: requests.Response) -> None:
+        """Update AIMD concurrency and pauses from the response status/headers."""
+        status = response.status_code
+        headers = response.headers
+        pause = 0.0
+
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                pause = float(retry_after)
+            except ValueError:
+                pause = 1.0
+
+        try:
+            limit = int(headers.get("X-RateLimit-Limit", 0))
+            remaining = int(headers.get("X-RateLimit-Remaining", limit))
+        except ValueError:
+            limit = remaining = 0
+        if limit and remaining < limit * self.LOW_REMAINING_RATIO:
+            try:
+                reset = float(headers.get("X-RateLimit-Reset", 1))
+            except ValueError:
+                reset = 1.0
+            # Providers send either seconds-until-reset or an epoch timestamp
+            if reset > 1e9:
+                reset -= time.time()
+            pause = max(pause, reset)
+
+        with self._lock:
+            if status == 429 or status >= 500:
+                self._concurrency[host] = max(1.0, self._concurrency[host] * 0.5)
+            else:
+                self._concurrency[host] = min(self.max_concurrency, self._concurrency[host] + 0.5)
+            if pause > 0:
+                pause = min(pause, self.MAX_PAUSE_SECONDS)
+                self._paused_until[host] = max(self._paused_until[host], time.monotonic() + pause)
+
+
+CLIENT = RateLimitedClient(SESSION)
+
+# Endpoints hit by the HTTP checks. All Meta-family calls share one host.
+GRAPH_API = "https://graph.facebook.com/v18.0"
+LINKEDIN_POSTS_URL = "https://api.linkedin.com/v2/ugcPosts"
+
+
+def fb_feed_url(page_id: str) -> str:
+    return f"{GRAPH_API}/{page_id}/feed"
+
+
+def ig_media_url(instagram_id: str) -> str:
+    return f"{GRAPH_API}/{instagram_id}/media"
+
+
+def wa_messages_url(phone_number_id: str) -> str:
+    return f"{GRAPH_API}/{phone_number_id}/messages"
+
+# Checks only need the created object's "id" (near the start of the JSON) or
+# a short error snippet, so responses are streamed and capped at a prelude.
+PRELUDE_BYTES = 2048
+_ID_RE = re.compile(rb'"id"\s*:\s*"([^"]+)"')
+
+
+def _read_prelude(response: requests.Response) -> bytes:
+    """Read at most PRELUDE_BYTES of a streamed body and release the connection."""
+    try:
+        return response.raw.read(PRELUDE_BYTES, decode_content=True) or b""
+    finally:
+        response.close()
+
+
+def _extract_id(body: bytes, default: str | None = None) -> str | None:
+    match = _ID_RE.search(body)
+    return match.group(1).decode() if match else default
+
+
+THROTTLE_WEIGHT = 4.0   # how much harder a fully-throttled endpoint backs off
+THROTTLE_ALPHA = 0.3    # EWMA smoothing for the per-endpoint 429 rate
+_throttle_rate: dict[str, float] = defaultdict(float)
+_throttle_lock = threading.Lock()
+
+
+def _never_sent(exc: Exception) -> bool:
+    """True if exc is a connection failure raised before the request went out."""
+    if isinstance(exc, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(exc, requests.exceptions.ConnectionError) and exc.args:
+        reason = getattr(exc.args[0], "reason", exc.args[0])
+        return isinstance(reason, NewConnectionError)
+    return False
+
+
+def retry(fn, *, key: str, attempts: int = 3, base: float = 0.25, cap: float = 4.0):
+    """Call fn, retrying only when a retry cannot publish a duplicate.
+
+    Every call wrapped here creates something (a tweet, a post, a message),
+    so a 5xx is never retried: a gateway error can arrive after the object
+    was already created. Retried are 429s, which the API rejected outright,
+    and connection failures raised before the request was sent.
+
+    fn may return a response or raise an exception carrying one (as tweepy
+    does). 429s honour Retry-After; otherwise the delay is drawn uniformly
+    from [0, min(cap, base * 2**n)] and stretched by (1 + k*r), where r is
+    the endpoint's recent 429 rate, so contended endpoints back off harder.
+    """
+    for n in range(attempts):
+        error = None
+        try:
+            result = fn()
+            response = result
+        except Exception as e:
+            response = getattr(e, "response", None)
+            if response is None:
+                if not _never_sent(e) or n == attempts - 1:
+                    raise
+                time.sleep(random.uniform(0, min(cap, base * 2 ** n)))
+                continue
+            result, error = None, e
 
-print("\n" + "╔" + "="*78 + "╗")
-print("║" + " "*20 + "REAL API INTEGRATION TEST" + " "*33 + "║")
-print("║" + " "*15 + "Testing All 6 Services with Real APIs" + " "*26 + "║")
-print("╚" + "="*78 + "╝\n")
+        status = getattr(response, "status_code", 200)
+        with _throttle_lock:
+            rate = (1 - THROTTLE_ALPHA) * _throttle_rate[key] + THROTTLE_ALPHA * (status == 429)
+            _throttle_rate[key] = rate
+
+        if status != 429 or n == attempts - 1:
+            if error is not None:
+                raise error
+            return result
+
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()  # release a streamed connection before retrying
+
+        delay = random.uniform(0, min(cap, base * 2 ** n)) * (1 + THROTTLE_WEIGHT * rate)
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        time.sleep(min(delay, RateLimitedClient.MAX_PAUSE_SECONDS))
+
+# Per-user cache for identities that are stable for a given set of credentials
+CACHE_DIR = Path.home() / ".cache" / "zoya"
+TWITTER_IDENTITY_TTL = 24 * 3600
+
+
+def _cache_key(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _read_cache(name: str) -> dict:
+    try:
+        return json.loads((CACHE_DIR / name).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(name: str, data: dict) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (CACHE_DIR / name).write_text(json.dumps(data))
+    except OSError:
+        pass
 
-# Test counters
-tests_passed = 0
-tests_failed = 0
 
 # ============================================================================
 # TEST 1: Gmail API
 # ============================================================================
-print("📧 TEST 1: Gmail API - Sending Real Email")
-print("-" * 80)
-try:
-    import pickle
-    import base64
-    from email.mime.text import MIMEText
-    from google.auth.transport.requests import Request
-    from google.oauth2.credentials import Credentials
-    from google_auth_oauthlib.flow import InstalledAppFlow
-    from googleapiclient.discovery import build
-
-    credentials_file = PROJECT_ROOT / "credentials.json"
-    token_file = PROJECT_ROOT / "token.json"
-    SCOPES = ['https://www.googleapis.com/auth/gmail.send']
-
-    credentials = None
-    if token_file.exists():
-        with open(token_file, 'rb') as token:
-            credentials = pickle.load(token)
-
-    if credentials and credentials.expired:
-        credentials.refresh(Request())
-
-    if not credentials and not credentials_file.exists():
-        print("⚠️  Gmail credentials.json not found - skipping Gmail test")
-        tests_failed += 1
-    elif credentials or credentials_file.exists():
-        if not credentials:
-            flow = InstalledAppFlow.from_client_secrets_file(str(credentials_file), SCOPES)
-            credentials = flow.run_local_server(port=0)
-            with open(token_file, 'wb') as token:
-                pickle.dump(credentials, token)
-
-        service = build('gmail', 'v1', credentials=credentials)
-
-        message = MIMEText("This is a test email from Zoya AI Employee System")
-        message['to'] = os.getenv("TEST_EMAIL_RECIPIENT", "test@example.com")
-        message['subject'] = f"Zoya Test - {datetime.now().isoformat()}"
-
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
-        send_message = {'raw': raw}
-
-        result = service.users().messages().send(userId='me', body=send_message).execute()
-
-        if result and result.get('id'):
-            print(f"✅ Email sent successfully! Message ID: {result['id']}")
-            tests_passed += 1
+def check_gmail() -> tuple[int, int, list[str]]:
+    """Send a real email through the Gmail API."""
+    passed, failed = 0, 0
+    out = ["📧 TEST 1: Gmail API - Sending Real Email", "-" * 80]
+    try:
+        import base64
+
+        credentials_file = PROJECT_ROOT / "credentials.json"
+        token_file = PROJECT_ROOT / "token.json"
+        SCOPES = ['https://www.googleapis.com/auth/gmail.send']
+
+        if not token_file.exists() and not credentials_file.exists():
+            out.append("⚠️  Gmail credentials.json not found - skipping Gmail test")
+            failed += 1
         else:
-            print("❌ Email sent but no ID returned")
-            tests_failed += 1
+            # Google SDKs are only imported once the Gmail test will really run
+            from google.auth.transport.requests import Request
+            from google.oauth2.credentials import Credentials
+            from google_auth_oauthlib.flow import InstalledAppFlow
+            from googleapiclient.discovery import build
+
+            credentials = None
+            if token_file.exists():
+                credentials = Credentials.from_authorized_user_file(str(token_file), SCOPES)
+
+            if credentials and credentials.expired and credentials.refresh_token:
+                credentials.refresh(Request())
+                token_file.write_text(credentials.to_json())
+
+            if not credentials or not credentials.valid:
+                flow = InstalledAppFlow.from_client_secrets_file(str(credentials_file), SCOPES)
+                credentials = flow.run_local_server(port=0)
+                token_file.write_text(credentials.to_json())
+
+            service = build('gmail', 'v1', credentials=credentials)
+
+            # Fixed-shape plain-text message: no need for the email.generator
+            # machinery, the headers are ASCII and the body is UTF-8.
+            to = CONFIG["TEST_EMAIL_RECIPIENT"] or "test@example.com"
+            raw_bytes = (
+                f"To: {to}\r\n"
+                f"Subject: Zoya Test - {NOW_ISO}\r\n"
+                "MIME-Version: 1.0\r\n"
+                "Content-Type: text/plain; charset=utf-8\r\n"
+                "\r\n"
+                "This is a test email from Zoya AI Employee System"
+            ).encode("utf-8")
+
+            raw = base64.urlsafe_b64encode(raw_bytes).decode("ascii")
+            send_message = {'raw': raw}
+
+            result = service.users().messages().send(userId='me', body=send_message).execute()
+
+            if result and result.get('id'):
+                out.append(f"✅ Email sent successfully! Message ID: {result['id']}")
+                passed += 1
+            else:
+                out.append("❌ Email sent but no ID returned")
+                failed += 1
+
+    except ImportError as e:
+        out.append(f"⚠️  Skipping Gmail test (dependency missing: {e})")
+        failed += 1
+    except Exception as e:
+        out.append(f"❌ Gmail test failed: {e}")
+        failed += 1
+
+    return passed, failed, out
 
-except ImportError as e:
-    print(f"⚠️  Skipping Gmail test (dependency missing: {e})")
-    tests_failed += 1
-except Exception as e:
-    print(f"❌ Gmail test failed: {e}")
-    tests_failed += 1
 
 # ============================================================================
 # TEST 2: Twitter API v2
 # ============================================================================
-print("\n🐦 TEST 2: Twitter/X API v2 - Posting Real Tweet")
-print("-" * 80)
-try:
-    import tweepy
-
-    api_key = os.getenv("TWITTER_API_KEY")
-    api_secret = os.getenv("TWITTER_API_SECRET")
-    access_token = os.getenv("TWITTER_ACCESS_TOKEN")
-    access_secret = os.getenv("TWITTER_ACCESS_TOKEN_SECRET")
-
-    if not all([api_key, api_secret, access_token, access_secret]):
-        print("⚠️  Twitter credentials not configured - skipping Twitter test")
-        tests_failed += 1
-    else:
-        client = tweepy.Client(
-            consumer_key=api_key,
-            consumer_secret=api_secret,
-            access_token=access_token,
-            access_token_secret=access_secret,
-            wait_on_rate_limit=True
-        )
-
-        me = client.get_me()
-        if me:
-            tweet_text = f"🤖 Zoya AI Test Tweet - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} #AI #Automation"
-            response = client.create_tweet(text=tweet_text)
-
-            if response and response.data:
-                print(f"✅ Tweet posted successfully! Tweet ID: {response.data['id']}")
-                tests_passed += 1
-            else:
-                print("❌ Tweet creation returned no data")
-                tests_failed += 1
+def check_twitter() -> tuple[int, int, list[str]]:
+    """Post a real tweet through the Twitter/X API v2."""
+    passed, failed = 0, 0
+    out = ["🐦 TEST 2: Twitter/X API v2 - Posting Real Tweet", "-" * 80]
+    try:
+        if not ENABLED["twitter"]:
+            out.append("⚠️  Twitter credentials not configured - skipping Twitter test")
+            failed += 1
+        elif importlib.util.find_spec("tweepy") is None:
+            out.append("⚠️  Skipping Twitter test (dependency missing)")
+            failed += 1
         else:
-            print("❌ Failed to authenticate with Twitter")
-            tests_failed += 1
+            import tweepy
+
+            client = tweepy.Client(
+                consumer_key=CONFIG["TWITTER_API_KEY"],
+                consumer_secret=CONFIG["TWITTER_API_SECRET"],
+                access_token=CONFIG["TWITTER_ACCESS_TOKEN"],
+                access_token_secret=CONFIG["TWITTER_ACCESS_TOKEN_SECRET"],
+                wait_on_rate_limit=True
+            )
+
+            # The authenticated identity is fixed for a set of credentials, so
+            # the get_me() probe is cached for a day and skipped on repeat runs.
+            key = _cache_key(CONFIG["TWITTER_API_KEY"], CONFIG["TWITTER_ACCESS_TOKEN"])
+            identity_cache = _read_cache("twitter_identity.json")
+            cached = identity_cache.get(key, {})
+            user_id = None
+            if time.time() - cached.get("cached_at", 0) < TWITTER_IDENTITY_TTL:
+                user_id = cached.get("user_id")
+
+            def authenticate():
+                me = client.get_me()
+                if not me or not me.data:
+                    return None
+                identity_cache[key] = {"user_id": str(me.data.id), "cached_at": time.time()}
+                _write_cache("twitter_identity.json", identity_cache)
+                return str(me.data.id)
+
+            from_cache = user_id is not None
+            if not from_cache:
+                user_id = authenticate()
+
+            if user_id:
+                tweet_text = f"🤖 Zoya AI Test Tweet - {NOW_HUMAN} #AI #Automation"
+                try:
+                    response = retry(lambda: client.create_tweet(text=tweet_text), key="twitter")
+                except tweepy.Unauthorized:
+                    if not from_cache:
+                        raise
+                    # Credentials changed since the identity was cached
+                    identity_cache.pop(key, None)
+                    _write_cache("twitter_identity.json", identity_cache)
+                    if not authenticate():
+                        raise
+                    response = retry(lambda: client.create_tweet(text=tweet_text), key="twitter")
+
+                if response and response.data:
+                    out.append(f"✅ Tweet posted successfully! Tweet ID: {response.data['id']}")
+                    passed += 1
+                else:
+                    out.append("❌ Tweet creation returned no data")
+                    failed += 1
+            else:
+                out.append("❌ Failed to authenticate with Twitter")
+                failed += 1
+
+    except ImportError as e:
+        out.append(f"⚠️  Skipping Twitter test (dependency missing)")
+        failed += 1
+    except Exception as e:
+        out.append(f"❌ Twitter test failed: {e}")
+        failed += 1
+
+    return passed, failed, out
 
-except ImportError as e:
-    print(f"⚠️  Skipping Twitter test (dependency missing)")
-    tests_failed += 1
-except Exception as e:
-    print(f"❌ Twitter test failed: {e}")
-    tests_failed += 1
 
 # ============================================================================
 # TEST 3: LinkedIn API v2
 # ============================================================================
-print("\n💼 TEST 3: LinkedIn API v2 - Posting to Company Page")
-print("-" * 80)
-try:
-    import requests
+def check_linkedin() -> tuple[int, int, list[str]]:
+    """Create a real post through the LinkedIn API v2."""
+    passed, failed = 0, 0
+    out = ["💼 TEST 3: LinkedIn API v2 - Posting to Company Page", "-" * 80]
+    try:
+        if not ENABLED["linkedin"]:
+            out.append("⚠️  LinkedIn credentials not configured - skipping LinkedIn test")
+            failed += 1
+        else:
+            headers = {"Authorization": f"Bearer {CONFIG['LINKEDIN_ACCESS_TOKEN']}"}
+
+            post_content = {
+                "commentary": {
+                    "text": f"🚀 Zoya AI Test Post - {NOW_ISO} #AI #Automation"
+                },
+                "visibility": {
+                    "com.linkedin.ugc.visibility.MemberNetworkVisibility": "PUBLIC"
+                },
+                "lifecycleState": "PUBLISHED",
+                "distribution": {
+                    "feedDistribution": "FOLLOWERS"
+                }
+            }
+
+            response = retry(
+                lambda: CLIENT.post(LINKEDIN_POSTS_URL, json=post_content, headers=headers, timeout=10, stream=True),
+                key="linkedin",
+            )
+
+            body = _read_prelude(response)
+            if response.status_code in [200, 201]:
+                post_id = _extract_id(body, 'unknown')
+                out.append(f"✅ LinkedIn post created! Post ID: {post_id}")
+                passed += 1
+            else:
+                out.append(f"❌ LinkedIn API error: {response.status_code} - {body[:100].decode(errors='replace')}")
+                failed += 1
 
-    linkedin_token = os.getenv("LINKEDIN_ACCESS_TOKEN")
-    linkedin_page_id = os.getenv("LINKEDIN_PAGE_ID")
+    except Exception as e:
+        out.append(f"❌ LinkedIn test failed: {e}")
+        failed += 1
 
-    if not linkedin_token or not linkedin_page_id:
-        print("⚠️  LinkedIn credentials not configured - skipping LinkedIn test")
-        tests_failed += 1
-    else:
-        headers = {
-            "Authorization": f"Bearer {linkedin_token}",
-            "Content-Type": "application/json"
-        }
-
-        post_content = {
-            "commentary": {
-                "text": f"🚀 Zoya AI Test Post - {datetime.now().isoformat()} #AI #Automation"
-            },
-            "visibility": {
-                "com.linkedin.ugc.visibility.MemberNetworkVisibility": "PUBLIC"
-            },
-            "lifecycleState": "PUBLISHED",
-            "distribution": {
-                "feedDistribution": "FOLLOWERS"
-            }
-        }
+    return passed, failed, out
 
-        url = f"https://api.linkedin.com/v2/ugcPosts"
-        response = requests.post(url, json=post_content, headers=headers, timeout=10)
 
-        if response.status_code in [200, 201]:
-            post_id = response.json().get('id', 'unknown')
-            print(f"✅ LinkedIn post created! Post ID: {post_id}")
-            tests_passed += 1
+# ============================================================================
+# TEST 4: Meta Graph API (Facebook + Instagram)
+# ============================================================================
+def check_meta() -> tuple[int, int, list[str]]:
+    """Create a real Facebook post and Instagram media container."""
+    passed, failed = 0, 0
+    out = ["📱 TEST 4: Meta Graph API - Facebook & Instagram", "-" * 80]
+    try:
+        meta_token = CONFIG["META_ACCESS_TOKEN"]
+        facebook_page_id = CONFIG["FACEBOOK_PAGE_ID"]
+        instagram_id = CONFIG["INSTAGRAM_BUSINESS_ACCOUNT_ID"]
+
+        if not ENABLED["meta"]:
+            out.append("⚠️  Meta credentials not configured - skipping Meta test")
+            failed += 1
         else:
-            print(f"❌ LinkedIn API error: {response.status_code} - {response.text[:100]}")
-            tests_failed += 1
+            def test_facebook() -> tuple[int, int, list[str]]:
+                if not facebook_page_id:
+                    return 0, 1, ["  ⚠️  Facebook page ID not configured"]
+                lines = ["  • Testing Facebook posting..."]
+                payload = {
+                    "message": f"🤖 Zoya Test Post - {NOW_ISO} #AI",
+                    "access_token": meta_token
+                }
+                response = retry(lambda: CLIENT.post(
+                    fb_feed_url(facebook_page_id),
+                    json=payload,
+                    timeout=10,
+                    stream=True,
+                ), key="facebook")
+
+                body = _read_prelude(response)
+                if response.status_code in [200, 201]:
+                    post_id = _extract_id(body)
+                    lines.append(f"    ✅ Facebook post created! ID: {post_id}")
+                    return 1, 0, lines
+                lines.append(f"    ❌ Facebook error: {response.status_code}")
+                return 0, 1, lines
+
+            def test_instagram() -> tuple[int, int, list[str]]:
+                if not instagram_id:
+                    return 0, 1, ["  ⚠️  Instagram ID not configured"]
+                lines = ["  • Testing Instagram posting..."]
+                image_url = "https://via.placeholder.com/1080x1080?text=Zoya+Test"
+                container_payload = {
+                    "image_url": image_url,
+                    "caption": f"🤖 Zoya Test - {NOW_ISO} #AI #Automation",
+                    "access_token": meta_token
+                }
+
+                response = retry(lambda: CLIENT.post(
+                    ig_media_url(instagram_id),
+                    json=container_payload,
+                    timeout=10,
+                    stream=True,
+                ), key="instagram")
+
+                body = _read_prelude(response)
+                if response.status_code in [200, 201]:
+                    creation_id = _extract_id(body)
+                    lines.append(f"    ✅ Instagram media created! ID: {creation_id}")
+                    return 1, 0, lines
+                lines.append(f"    ❌ Instagram error: {response.status_code}")
+                return 0, 1, lines
+
+            # The two posts are independent, so fire them concurrently
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                futures = [pool.submit(test_facebook), pool.submit(test_instagram)]
+                for name, future in zip(("Facebook", "Instagram"), futures):
+                    try:
+                        p, f, lines = future.result()
+                    except Exception as e:
+                        p, f, lines = 0, 1, [f"    ❌ {name} error: {e}"]
+                    passed += p
+                    failed += f
+                    out.extend(lines)
+
+    except Exception as e:
+        out.append(f"❌ Meta test failed: {e}")
+        failed += 1
+
+    return passed, failed, out
 
-except ImportError:
-    print("⚠️  Skipping LinkedIn test (requests not available)")
-    tests_failed += 1
-except Exception as e:
-    print(f"❌ LinkedIn test failed: {e}")
-    tests_failed += 1
 
 # ============================================================================
-# TEST 4: Meta Graph API (Facebook + Instagram)
+# TEST 5: WhatsApp Cloud API
 # ============================================================================
-print("\n📱 TEST 4: Meta Graph API - Facebook & Instagram")
-print("-" * 80)
-try:
-    import requests
-
-    meta_token = os.getenv("META_ACCESS_TOKEN")
-    facebook_page_id = os.getenv("FACEBOOK_PAGE_ID")
-    instagram_id = os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID")
-
-    if not meta_token:
-        print("⚠️  Meta credentials not configured - skipping Meta test")
-        tests_failed += 1
-    else:
-        # Test Facebook
-        if facebook_page_id:
-            print("  • Testing Facebook posting...")
+def check_whatsapp() -> tuple[int, int, list[str]]:
+    """Send a real WhatsApp message through the Cloud API."""
+    passed, failed = 0, 0
+    out = ["💬 TEST 5: WhatsApp Cloud API - Sending Message", "-" * 80]
+    try:
+        if not ENABLED["whatsapp"]:
+            out.append("⚠️  WhatsApp credentials not configured - skipping WhatsApp test")
+            failed += 1
+        else:
             payload = {
-                "message": f"🤖 Zoya Test Post - {datetime.now().isoformat()} #AI",
-                "access_token": meta_token
+                "messaging_product": "whatsapp",
+                "to": CONFIG["TEST_WHATSAPP_PHONE"],
+                "type": "text",
+                "text": {
+                    "preview_url": False,
+                    "body": f"🤖 Zoya Test Message - {NOW_ISO}"
+                }
             }
-            response = requests.post(
-                f"https://graph.facebook.com/v18.0/{facebook_page_id}/feed",
-                json=payload,
-                timeout=10
-            )
 
-            if response.status_code in [200, 201]:
-                post_id = response.json().get('id')
-                print(f"    ✅ Facebook post created! ID: {post_id}")
-                tests_passed += 1
-            else:
-                print(f"    ❌ Facebook error: {response.status_code}")
-                tests_failed += 1
-        else:
-            print("  ⚠️  Facebook page ID not configured")
-            tests_failed += 1
-
-        # Test Instagram
-        if instagram_id:
-            print("  • Testing Instagram posting...")
-            image_url = "https://via.placeholder.com/1080x1080?text=Zoya+Test"
-            container_payload = {
-                "image_url": image_url,
-                "caption": f"🤖 Zoya Test - {datetime.now().isoformat()} #AI #Automation",
-                "access_token": meta_token
-            }
+            headers = {"Authorization": f"Bearer {CONFIG['WHATSAPP_ACCESS_TOKEN']}"}
 
-            response = requests.post(
-                f"https://graph.instagram.com/v18.0/{instagram_id}/media",
-                json=container_payload,
-                timeout=10
-            )
+            response = retry(lambda: CLIENT.post(
+                wa_messages_url(CONFIG["WHATSAPP_PHONE_NUMBER_ID"]),
+                json=payload,
+                headers=headers,
+                timeout=10,
+                stream=True,
+            ), key="whatsapp")
 
+            body = _read_prelude(response)
             if response.status_code in [200, 201]:
-                creation_id = response.json().get('id')
-                print(f"    ✅ Instagram media created! ID: {creation_id}")
-                tests_passed += 1
+                # contacts[] only carries "wa_id", so the first "id" is the message's
+                message_id = _extract_id(body)
+                out.append(f"✅ WhatsApp message sent! Message ID: {message_id}")
+                passed += 1
             else:
-                print(f"    ❌ Instagram error: {response.status_code}")
-                tests_failed += 1
-        else:
-            print("  ⚠️  Instagram ID not configured")
-            tests_failed += 1
+                out.append(f"❌ WhatsApp API error: {response.status_code} - {body[:100].decode(errors='replace')}")
+                failed += 1
 
-except ImportError:
-    print("⚠️  Skipping Meta test (requests not available)")
-    tests_failed += 1
-except Exception as e:
-    print(f"❌ Meta test failed: {e}")
-    tests_failed += 1
+    except Exception as e:
+        out.append(f"❌ WhatsApp test failed: {e}")
+        failed += 1
 
-# ============================================================================
-# TEST 5: WhatsApp Cloud API
-# ============================================================================
-print("\n💬 TEST 5: WhatsApp Cloud API - Sending Message")
-print("-" * 80)
-try:
-    import requests
-
-    whatsapp_token = os.getenv("WHATSAPP_ACCESS_TOKEN")
-    phone_number_id = os.getenv("WHATSAPP_PHONE_NUMBER_ID")
-    test_recipient = os.getenv("TEST_WHATSAPP_PHONE")
-
-    if not whatsapp_token or not phone_number_id or not test_recipient:
-        print("⚠️  WhatsApp credentials not configured - skipping WhatsApp test")
-        tests_failed += 1
-    else:
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": test_recipient,
-            "type": "text",
-            "text": {
-                "preview_url": False,
-                "body": f"🤖 Zoya Test Message - {datetime.now().isoformat()}"
-            }
-        }
-
-        headers = {
-            "Authorization": f"Bearer {whatsapp_token}",
-            "Content-Type": "application/json"
-        }
-
-        response = requests.post(
-            f"https://graph.instagram.com/v18.0/{phone_number_id}/messages",
-            json=payload,
-            headers=headers,
-            timeout=10
-        )
-
-        if response.status_code in [200, 201]:
-            message_id = response.json().get('messages', [{}])[0].get('id')
-            print(f"✅ WhatsApp message sent! Message ID: {message_id}")
-            tests_passed += 1
-        else:
-            print(f"❌ WhatsApp API error: {response.status_code} - {response.text[:100]}")
-            tests_failed += 1
+    return passed, failed, out
 
-except ImportError:
-    print("⚠️  Skipping WhatsApp test (requests not available)")
-    tests_failed += 1
-except Exception as e:
-    print(f"❌ WhatsApp test failed: {e}")
-    tests_failed += 1
 
 # ============================================================================
 # TEST 6: Odoo XML-RPC API
 # ============================================================================
-print("\n📋 TEST 6: Odoo XML-RPC - Creating Invoice")
-print("-" * 80)
-try:
-    import xmlrpc.client
-
-    odoo_url = os.getenv("ODOO_URL", "http://localhost:8069")
-    odoo_db = os.getenv("ODOO_DB")
-    odoo_user = os.getenv("ODOO_USER")
-    odoo_password = os.getenv("ODOO_API_KEY")
-
-    if not all([odoo_db, odoo_user, odoo_password]):
-        print("⚠️  Odoo credentials not configured - skipping Odoo test")
-        tests_failed += 1
-    else:
-        common = xmlrpc.client.ServerProxy(f'{odoo_url}/xmlrpc/2/common')
-        uid = common.authenticate(odoo_db, odoo_user, odoo_password, {})
+def check_odoo() -> tuple[int, int, list[str]]:
+    """Create a real partner and invoice in Odoo over XML-RPC."""
+    passed, failed = 0, 0
+    out = ["📋 TEST 6: Odoo XML-RPC - Creating Invoice", "-" * 80]
+    try:
+        odoo_url = CONFIG["ODOO_URL"] or "http://localhost:8069"
+        odoo_db = CONFIG["ODOO_DB"]
+        odoo_user = CONFIG["ODOO_USER"]
+        odoo_password = CONFIG["ODOO_API_KEY"]
+
+        if not ENABLED["odoo"]:
+            out.append("⚠️  Odoo credentials not configured - skipping Odoo test")
+            failed += 1
+        else:
+            import xmlrpc.client
 
-        if uid:
+            common = xmlrpc.client.ServerProxy(f'{odoo_url}/xmlrpc/2/common')
             models = xmlrpc.client.ServerProxy(f'{odoo_url}/xmlrpc/2/object')
 
-            # Create partner
-            partner_id = models.execute_kw(
-                odoo_db, uid, odoo_password,
-                'res.partner', 'create',
-                [{
-                    'name': f'Zoya Test - {datetime.now().isoformat()}',
-                    'email': 'zoya@test.local',
-                    'company_type': 'company'
-                }]
-            )
-
-            # Create invoice
-            invoice_id = models.execute_kw(
-                odoo_db, uid, odoo_password,
-                'account.move', 'create',
-                [{
-                    'move_type': 'out_invoice',
-                    'partner_id': partner_id,
-                    'invoice_date': datetime.now().strftime("%Y-%m-%d"),
-                    'currency_id': 1,
-                    'ref': 'Zoya Test Invoice',
-                    'invoice_line_ids': [(0, 0, {
-                        'product_id': 1,
-                        'name': 'Test Service',
-                        'quantity': 1,
-                        'price_unit': 100.00
-                    })]
-                }]
-            )
-
-            if invoice_id:
-                print(f"✅ Invoice created in Odoo! Invoice ID: {invoice_id}")
-                tests_passed += 1
+            def create_invoice(uid: int) -> int:
+                # Create partner
+                partner_id = models.execute_kw(
+                    odoo_db, uid, odoo_password,
+                    'res.partner', 'create',
+                    [{
+                        'name': f'Zoya Test - {NOW_ISO}',
+                        'email': 'zoya@test.local',
+                        'company_type': 'company'
+                    }]
+                )
+
+                # Create invoice
+                return models.execute_kw(
+                    odoo_db, uid, odoo_password,
+                    'account.move', 'create',
+                    [{
+                        'move_type': 'out_invoice',
+                        'partner_id': partner_id,
+                        'invoice_date': NOW_DATE,
+                        'currency_id': 1,
+                        'ref': 'Zoya Test Invoice',
+                        'invoice_line_ids': [(0, 0, {
+                            'product_id': 1,
+                            'name': 'Test Service',
+                            'quantity': 1,
+                            'price_unit': 100.00
+                        })]
+                    }]
+                )
+
+            # A user's uid never changes, so reuse the one from the last run
+            # and only call authenticate() when there is none or it is rejected.
+            key = _cache_key(odoo_url, odoo_db, odoo_user)
+            uid_cache = _read_cache("odoo_uid.json")
+            uid = uid_cache.get(key)
+            cached = bool(uid)
+            if not uid:
+                uid = common.authenticate(odoo_db, odoo_user, odoo_password, {})
+
+            if uid:
+                try:
+                    invoice_id = create_invoice(uid)
+                except xmlrpc.client.Fault as fault:
+                    if not cached or "Access Denied" not in fault.faultString:
+                        raise
+                    uid = common.authenticate(odoo_db, odoo_user, odoo_password, {})
+                    if not uid:
+                        raise
+                    invoice_id = create_invoice(uid)
+                uid_cache[key] = uid
+                _write_cache("odoo_uid.json", uid_cache)
+
+                if invoice_id:
+                    out.append(f"✅ Invoice created in Odoo! Invoice ID: {invoice_id}")
+                    passed += 1
+                else:
+                    out.append("❌ Invoice creation failed")
+                    failed += 1
             else:
-                print("❌ Invoice creation failed")
-                tests_failed += 1
-        else:
-            print("❌ Failed to authenticate with Odoo")
+                out.append("❌ Failed to authenticate with Odoo")
+                failed += 1
+
+    except ImportError:
+        out.append("⚠️  Skipping Odoo test (xmlrpc not available)")
+        failed += 1
+    except Exception as e:
+        out.append(f"❌ Odoo test failed: {e}")
+        failed += 1
+
+    return passed, failed, out
+
+
+CHECKS = (check_gmail, check_twitter, check_linkedin, check_meta, check_whatsapp, check_odoo)
+
+
+def warm_up(url: str) -> None:
+    """Open a keep-alive TLS connection to url's host; failures are ignored."""
+    try:
+        SESSION.head(url, timeout=5).close()
+    except requests.RequestException:
+        pass
+
+
+async def run_all() -> list:
+    """Run every service test concurrently; blocking SDK calls go to threads."""
+    # Prime the pool so measured POST latency reflects the API, not TLS setup
+    warm = []
+    if ENABLED["linkedin"]:
+        warm.append(LINKEDIN_POSTS_URL)
+    if ENABLED["meta"] or ENABLED["whatsapp"]:
+        warm.append(GRAPH_API)
+    await asyncio.gather(*(asyncio.to_thread(warm_up, url) for url in warm))
+
+    return await asyncio.gather(
+        *(asyncio.to_thread(check) for check in CHECKS),
+        return_exceptions=True,
+    )
+
+
+def main() -> None:
+    # Everything is collected here and written once at the end
+    log: list[str] = []
+    log.append("\n" + "╔" + "="*78 + "╗")
+    log.append("║" + " "*20 + "REAL API INTEGRATION TEST" + " "*33 + "║")
+    log.append("║" + " "*15 + "Testing All 6 Services with Real APIs" + " "*26 + "║")
+    log.append("╚" + "="*78 + "╝\n")
+
+    results = asyncio.run(run_all())
+
+    # Aggregate once, emitting each test's output in declaration order so
+    # concurrent tests never interleave their lines.
+    tests_passed = 0
+    tests_failed = 0
+    for check, result in zip(CHECKS, results):
+        if isinstance(result, BaseException):
+            log.append(f"❌ {check.__name__} crashed: {result}\n")
             tests_failed += 1
+            continue
+        passed, failed, out = result
+        log.append("\n".join(out) + "\n")
+        tests_passed += passed
+        tests_failed += failed
+
+    # ============================================================================
+    # SUMMARY
+    # ============================================================================
+    log.append("="*80)
+    log.append("INTEGRATION TEST SUMMARY")
+    log.append("="*80)
+    log.append(f"\n✅ Tests Passed: {tests_passed}")
+    log.append(f"❌ Tests Failed: {tests_failed}")
+    log.append(f"⏭️  Total Tests:   {tests_passed + tests_failed}")
+
+    if tests_passed >= 4:
+        log.append("\n🎉 SUCCESS! Multiple services are working!")
+        log.append("\nVerify results:")
+        log.append("  • Check your email inbox for the test email")
+        log.append("  • Check your Twitter account for the test tweet")
+        log.append("  • Check your LinkedIn page for the test post")
+        log.append("  • Check your Facebook page for the test post")
+        log.append("  • Check WhatsApp for the test message")
+        log.append("  • Check Odoo for the test invoice")
+    elif tests_passed > 0:
+        log.append(f"\n⚠️  Partial success ({tests_passed} services working)")
+    else:
+        log.append("\n❌ No services successfully tested")
+        log.append("\nChecklist:")
+        log.append("  ✓ Is .env configured with all API credentials?")
+        log.append("  ✓ Are the API keys valid and not expired?")
+        log.append("  ✓ Do the API keys have the right scopes/permissions?")
+        log.append("  ✓ Are the recipient IDs/emails configured?")
 
-except ImportError:
-    print("⚠️  Skipping Odoo test (xmlrpc not available)")
-    tests_failed += 1
-except Exception as e:
-    print(f"❌ Odoo test failed: {e}")
-    tests_failed += 1
+    sys.stdout.write("\n".join(log) + "\n")
+    sys.exit(0 if tests_passed >= 4 else 1)
 
-# ============================================================================
-# SUMMARY
-# ============================================================================
-print("\n" + "="*80)
-print("INTEGRATION TEST SUMMARY")
-print("="*80)
-print(f"\n✅ Tests Passed: {tests_passed}")
-print(f"❌ Tests Failed: {tests_failed}")
-print(f"⏭️  Total Tests:   {tests_passed + tests_failed}")
-
-if tests_passed >= 4:
-    print("\n🎉 SUCCESS! Multiple services are working!")
-    print("\nVerify results:")
-    print("  • Check your email inbox for the test email")
-    print("  • Check your Twitter account for the test tweet")
-    print("  • Check your LinkedIn page for the test post")
-    print("  • Check your Facebook page for the test post")
-    print("  • Check WhatsApp for the test message")
-    print("  • Check Odoo for the test invoice")
-elif tests_passed > 0:
-    print(f"\n⚠️  Partial success ({tests_passed} services working)")
-else:
-    print("\n❌ No services successfully tested")
-    print("\nChecklist:")
-    print("  ✓ Is .env configured with all API credentials?")
-    print("  ✓ Are the API keys valid and not expired?")
-    print("  ✓ Do the API keys have the right scopes/permissions?")
-    print("  ✓ Are the recipient IDs/emails configured?")
-
-sys.exit(0 if tests_passed >= 4 else 1)
+
+if __name__ == "__main__":
+    main()
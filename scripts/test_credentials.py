@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root
@@ -37,7 +38,7 @@ def check_ai_provider() -> tuple[str, bool]:
     elif AI_PROVIDER == "ollama":
         try:
             import requests
-            resp = requests.get(f"{OLLAMA_BASE_URL.replace('/v1', '')}/api/tags", timeout=5)
+            resp = requests.get(f"{OLLAMA_BASE_URL.replace('/v1', '')}/api/tags", timeout=1)
             models = [m["name"] for m in resp.json().get("models", [])]
             if any(OLLAMA_MODEL in m for m in models):
                 return f"AI Provider (Ollama/{OLLAMA_MODEL})", True
@@ -95,13 +96,16 @@ def main() -> None:
     print("=" * 50)
     print()
 
-    checks = [
-        check_ai_provider(),
-        check_gmail(),
-        check_whatsapp(),
-        check_linkedin(),
-        check_vault(),
+    probes = [
+        check_ai_provider,
+        check_gmail,
+        check_whatsapp,
+        check_linkedin,
+        check_vault,
     ]
+    # Independent I/O probes — run them together so a slow one bounds the total
+    with ThreadPoolExecutor(max_workers=len(probes)) as pool:
+        checks = list(pool.map(lambda probe: probe(), probes))
 
     ready = 0
     for label, ok in checks:
@@ -22,16 +22,24 @@ Entry point:
 from __future__ import annotations
 
 import argparse
+import functools
+import http.client
 import json
 import os
+import re
+import select
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Iterator
 
-from src.audit_logger import audit_log, get_period_stats, read_logs
+from src.audit_logger import audit_log, get_period_stats, read_logs, summarize_entries
 from src.config import (
     APPROVED,
     BRIEFINGS,
+    DASHBOARD,
     DONE,
     IN_PROGRESS,
     LOGS,
@@ -49,123 +57,312 @@ logger = setup_logger("audit_generator")
 PROGRESS_LOG = LOGS / "gold_tier_progress.md"
 OWNER_WHATSAPP = os.getenv("OWNER_WHATSAPP_NUMBER", "")   # e.g. "447911123456"
 
+_FM_RE = re.compile(rb"\A---\s*\n(.*?)\n---", re.DOTALL)
+_DEADLINE_RE = re.compile(
+    r"- \[ \] .{0,100}(?:by|due|deadline|before)\s+\S+", re.IGNORECASE
+)
+# CEO briefing section headings; every one must be written for a final briefing
+_SECTION_FINANCIAL = "## 🏦 Financial Summary"
+_SECTION_COMPLETED = "## ✅ Completed This Week"
+_SECTION_BOTTLENECKS = "## 🚧 Bottlenecks"
+_SECTION_SOCIAL = "## 📱 Social Media Performance"
+_SECTION_ALERTS = "## ⚠️ Alerts Requiring Attention"
+_SECTION_SUGGESTIONS = "## 💡 Proactive Suggestions"
+_SECTION_WEEK_AHEAD = "## 📅 Week Ahead"
+REQUIRED_SECTIONS = (
+    _SECTION_FINANCIAL,
+    _SECTION_COMPLETED,
+    _SECTION_BOTTLENECKS,
+    _SECTION_SOCIAL,
+    _SECTION_ALERTS,
+    _SECTION_SUGGESTIONS,
+    _SECTION_WEEK_AHEAD,
+)
+
+# Frontmatter sits at the very top of a Done/ file: the scan reads only this
+# much of each file. Bodies (for the deadline scan) are read on demand and
+# stop at _DONE_READ_CAP, since the first action items sit near the top.
+_DONE_HEAD_BYTES = 4096
+_DONE_READ_CAP = 64 * 1024
+
 
 # ---------------------------------------------------------------------------
 # Data collection
 # ---------------------------------------------------------------------------
 
-def _count(folder: Path) -> int:
-    if not folder.exists():
-        return 0
-    return len([f for f in folder.iterdir() if f.is_file() and f.name != ".gitkeep"])
+class DirListings(dict[Path, list[os.DirEntry]]):
+    """Folder listings for one audit run.
+
+    Every vault folder is read from disk at most once per instance, and the
+    counts and detail scans share the same DirEntry lists. Create a fresh
+    instance per run (run_audit and collect_vault_snapshot do) so long-lived
+    callers never see stale listings.
+    """
 
+    def entries(self, folder: Path) -> list[os.DirEntry]:
+        entries = self.get(folder)
+        if entries is None:
+            try:
+                with os.scandir(folder) as it:
+                    entries = list(it)
+            except FileNotFoundError:
+                entries = []
+            entries = self.setdefault(folder, entries)
+        return entries
+
+
+def _count(folder: Path, dirs: DirListings) -> int:
+    return sum(
+        1 for e in dirs.entries(folder)
+        if e.name != ".gitkeep" and e.is_file(follow_symlinks=False)
+    )
 
-def _read_frontmatter(path: Path) -> dict[str, str]:
-    import re
-    try:
-        text = path.read_text(encoding="utf-8")
-    except OSError:
+
+def _parse_frontmatter(data: bytes) -> dict[str, str]:
+    if not data.startswith(b"---"):
         return {}
-    match = re.search(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+    match = _FM_RE.match(data)
     if not match:
         return {}
     fm: dict[str, str] = {}
-    for line in match.group(1).splitlines():
+    for line in match.group(1).decode("utf-8", "replace").splitlines():
         if ":" in line:
             key, _, value = line.partition(":")
             fm[key.strip()] = value.strip()
     return fm
 
 
-def collect_vault_snapshot() -> dict:
-    """Gather folder counts and key file data from the vault."""
-    now = datetime.now(timezone.utc)
-    week_ago = now - timedelta(days=7)
+def _read_frontmatter(path: str | Path) -> dict[str, str]:
+    try:
+        with open(path, "rb") as fh:
+            data = fh.read()
+    except OSError:
+        return {}
+    return _parse_frontmatter(data)
+
+
+def _iter_md(
+    folder: Path, prefix: str = "", dirs: DirListings | None = None
+) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for folder/<prefix>*.md; nothing if folder is missing.
+
+    Callers work with entry.name / entry.path strings and only build a Path
+    when they need one. Without *dirs* the folder is listed afresh.
+    """
+    if dirs is None:
+        dirs = DirListings()
+    for entry in dirs.entries(folder):
+        name = entry.name
+        if name.endswith(".md") and name.startswith(prefix):
+            yield entry
+
 
-    # Done items this week
-    done_this_week = []
-    invoices_done = []
-    for f in DONE.glob("FILE_*.md"):
-        fm = _read_frontmatter(f)
+def _processed_at(fm: dict[str, str]) -> datetime | None:
+    """Parse a frontmatter processed_at stamp as an aware UTC datetime.
+
+    fromisoformat accepts a trailing "Z" natively on Python 3.11+, so no
+    string rewriting is needed; missing stamps skip the parse entirely.
+    """
+    raw = fm.get("processed_at")
+    if not raw:
+        return None
+    try:
+        processed = datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+    if processed.tzinfo is None:
+        processed = processed.replace(tzinfo=timezone.utc)
+    return processed
+
+
+@dataclass
+class DoneFile:
+    """One Done/FILE_*.md, scanned once and shared by every consumer of the scan.
+
+    Holds only stat and frontmatter; the body is read on first access to
+    ``data``, so memory stays O(files) rather than O(files x body).
+    """
+    path: Path
+    mtime: float
+    fm: dict[str, str]
+
+    @functools.cached_property
+    def data(self) -> bytes:
+        """The first _DONE_READ_CAP bytes of the file, read lazily and kept."""
         try:
-            processed = datetime.fromisoformat(
-                fm.get("processed_at", "").replace("Z", "+00:00")
-            )
-            if processed.tzinfo is None:
-                processed = processed.replace(tzinfo=timezone.utc)
-            if processed >= week_ago:
-                done_this_week.append({
-                    "name": fm.get("original_name", f.name),
-                    "type": fm.get("type", "other"),
-                    "source": fm.get("source", "file_drop"),
-                    "priority": fm.get("priority", "low"),
-                    "processed_at": fm.get("processed_at", "")[:19],
-                    "approval_status": fm.get("approval_status", "auto"),
-                })
-                if fm.get("type") == "invoice":
-                    invoices_done.append(fm)
-        except (ValueError, TypeError):
+            with open(self.path, "rb") as fh:
+                return fh.read(_DONE_READ_CAP)
+        except OSError:
+            return b""
+
+
+def _scan_done_files(dirs: DirListings | None = None) -> list[DoneFile]:
+    """Stat and read the frontmatter of every Done/FILE_*.md in one scandir pass.
+
+    Only the head of each file is read; a frontmatter block longer than
+    _DONE_HEAD_BYTES is read on up to _DONE_READ_CAP.
+    """
+    files: list[DoneFile] = []
+    for entry in _iter_md(DONE, "FILE_", dirs):
+        try:
+            mtime = entry.stat().st_mtime
+            with open(entry.path, "rb") as fh:
+                head = fh.read(_DONE_HEAD_BYTES)
+                fm = _parse_frontmatter(head)
+                if not fm and len(head) == _DONE_HEAD_BYTES and head.startswith(b"---"):
+                    fm = _parse_frontmatter(head + fh.read(_DONE_READ_CAP - _DONE_HEAD_BYTES))
+        except OSError:
             continue
+        files.append(DoneFile(Path(entry.path), mtime, fm))
+    return files
+
 
-    # Pending approval items
+def _collect_approval_pending(dirs: DirListings) -> list[dict]:
     approval_pending = []
-    for f in PENDING_APPROVAL.glob("*.md"):
-        fm = _read_frontmatter(f)
+    for entry in _iter_md(PENDING_APPROVAL, dirs=dirs):
+        fm = _read_frontmatter(entry.path)
         requested = fm.get("approval_requested_at", fm.get("created_at", ""))
         approval_pending.append({
-            "name": f.name,
+            "name": entry.name,
             "type": fm.get("type", "other"),
             "requested_at": requested[:19] if requested else "",
         })
+    return approval_pending
+
 
-    # Overdue items: still in Needs_Action / Pending_Approval for > 48h
+def _collect_overdue(now: datetime, dirs: DirListings) -> list[dict]:
+    """Items still in Needs_Action / Pending_Approval for > 48h."""
     overdue = []
-    cutoff_48h = now - timedelta(hours=48)
+    now_ts = now.timestamp()
+    cutoff_ts = now_ts - 48 * 3600
     for folder in (NEEDS_ACTION, PENDING_APPROVAL):
-        for f in folder.glob("*.md"):
-            mtime = datetime.fromtimestamp(f.stat().st_mtime, tz=timezone.utc)
-            if mtime < cutoff_48h:
+        for entry in _iter_md(folder, dirs=dirs):
+            mtime = entry.stat().st_mtime
+            if mtime < cutoff_ts:
                 overdue.append({
-                    "name": f.name,
+                    "name": entry.name,
                     "folder": folder.name,
-                    "age_hours": round((now - mtime).total_seconds() / 3600, 1),
+                    "age_hours": round((now_ts - mtime) / 3600, 1),
                 })
+    return overdue
 
-    # Failed tasks in quarantine
+
+def _collect_quarantine_items(dirs: DirListings) -> list[dict]:
     quarantine_items = []
-    for f in QUARANTINE.glob("*.md"):
-        fm = _read_frontmatter(f)
+    for entry in _iter_md(QUARANTINE, dirs=dirs):
+        fm = _read_frontmatter(entry.path)
         quarantine_items.append({
-            "name": fm.get("original_name", f.name),
+            "name": fm.get("original_name", entry.name),
             "reason": fm.get("reason", "unknown"),
         })
+    return quarantine_items
+
+
+def collect_vault_snapshot(
+    done_files: list[DoneFile] | None = None,
+    dirs: DirListings | None = None,
+) -> dict:
+    """Gather folder counts and key file data from the vault.
+
+    The folder scans are independent and I/O-bound, so they run concurrently
+    on a small thread pool.
+
+    Args:
+        done_files: Result of _scan_done_files(), to share one Done/ scan with
+                    generate_ceo_briefing. Scanned here when omitted.
+        dirs:       Folder listings shared with the rest of the audit run;
+                    a fresh set is taken when omitted.
+    """
+    if dirs is None:
+        dirs = DirListings()
+    now = datetime.now(timezone.utc)
+    week_ago = now - timedelta(days=7)
+    two_weeks_ago = now - timedelta(days=14)
+    count_folders = {
+        "inbox": VAULT_PATH / "Inbox",
+        "needs_action": NEEDS_ACTION,
+        "in_progress": IN_PROGRESS,
+        "done": DONE,
+        "quarantine": QUARANTINE,
+        "pending_approval": PENDING_APPROVAL,
+        "approved": APPROVED,
+        "contacts": VAULT_PATH / "Contacts",
+        "briefings": BRIEFINGS,
+    }
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        count_futures = {
+            key: pool.submit(_count, folder, dirs) for key, folder in count_folders.items()
+        }
+        pending_future = pool.submit(_collect_approval_pending, dirs)
+        overdue_future = pool.submit(_collect_overdue, now, dirs)
+        quarantine_future = pool.submit(_collect_quarantine_items, dirs)
+        if done_files is None:
+            done_files = pool.submit(_scan_done_files, dirs).result()
+
+        # Done items this week
+        done_this_week = []
+        invoices_done = []
+        prior_week_done = 0
+        for df in done_files:
+            fm = df.fm
+            processed = _processed_at(fm)
+            if processed is None:
+                continue
+            if two_weeks_ago <= processed < week_ago:
+                prior_week_done += 1
+            elif processed >= week_ago:
+                done_this_week.append({
+                    "name": fm.get("original_name", df.path.name),
+                    "type": fm.get("type", "other"),
+                    "source": fm.get("source", "file_drop"),
+                    "priority": fm.get("priority", "low"),
+                    "processed_at": fm.get("processed_at", "")[:19],
+                    "approval_status": fm.get("approval_status", "auto"),
+                })
+                if fm.get("type") == "invoice":
+                    invoices_done.append(fm)
+
+        counts = {key: future.result() for key, future in count_futures.items()}
+        approval_pending = pending_future.result()
+        overdue = overdue_future.result()
+        quarantine_items = quarantine_future.result()
 
     return {
         "counts": {
-            "inbox": _count(VAULT_PATH / "Inbox"),
-            "needs_action": _count(NEEDS_ACTION),
-            "in_progress": _count(IN_PROGRESS),
-            "done": _count(DONE),
+            "inbox": counts["inbox"],
+            "needs_action": counts["needs_action"],
+            "in_progress": counts["in_progress"],
+            "done": counts["done"],
             "done_this_week": len(done_this_week),
-            "quarantine": _count(QUARANTINE),
-            "pending_approval": _count(PENDING_APPROVAL),
-            "approved": _count(APPROVED),
-            "contacts": _count(VAULT_PATH / "Contacts"),
-            "briefings": _count(BRIEFINGS),
+            "done_prior_week": prior_week_done,
+            "quarantine": counts["quarantine"],
+            "pending_approval": counts["pending_approval"],
+            "approved": counts["approved"],
+            "contacts": counts["contacts"],
+            "briefings": counts["briefings"],
         },
         "done_this_week": done_this_week[:20],
         "invoices_done": invoices_done,
         "approval_pending": approval_pending,
         "overdue": overdue,
         "quarantine_items": quarantine_items,
+        "done_files": done_files,
     }
 
 
-def collect_social_metrics() -> dict:
+def collect_social_metrics(
+    dirs: DirListings | None = None,
+    entries: list[dict] | None = None,
+) -> dict:
     """Collect available social media metrics from Done/ logs.
 
     In production this would call the Twitter/Meta APIs directly.
     For now we aggregate from audit logs and DONE social post files.
+
+    Args:
+        dirs:    Folder listings shared with the rest of the audit run.
+        entries: This week's audit log entries, if the caller already read them.
     """
     metrics: dict[str, dict] = {
         "twitter": {"posts": 0, "impressions": 0, "mentions": 0},
@@ -174,15 +371,16 @@ def collect_social_metrics() -> dict:
         "instagram": {"posts": 0, "followers_delta": 0, "top_post": ""},
     }
 
-    for f in DONE.glob("TWITTER_*.md"):
-        metrics["twitter"]["posts"] += 1
-
-    for f in DONE.glob("LINKEDIN_*.md"):
-        metrics["linkedin"]["posts"] += 1
+    # One pass over Done/ for both platforms' post files
+    for entry in _iter_md(DONE, dirs=dirs):
+        if entry.name.startswith("TWITTER_"):
+            metrics["twitter"]["posts"] += 1
+        elif entry.name.startswith("LINKEDIN_"):
+            metrics["linkedin"]["posts"] += 1
 
     # Check audit logs for social posts this week
     try:
-        stats = get_period_stats(days=7)
+        stats = get_period_stats(days=7, entries=entries)
         # Rough split — in production each platform would have its own log action
         social_total = stats["social_posts"]
         metrics["twitter"]["posts"] = max(metrics["twitter"]["posts"], social_total // 3)
@@ -229,17 +427,26 @@ def generate_ceo_briefing(
     prior_stats: dict | None = None,
     report_date: datetime | None = None,
     dry_run: bool = False,
+    done_files: list[DoneFile] | None = None,
+    dirs: DirListings | None = None,
 ) -> Path:
     """Generate the Monday Morning CEO Briefing with the exact required sections.
 
     Args:
         prior_stats: Stats from the previous 7-day period for week-over-week comparison.
         report_date: Override the current datetime (used with --date CLI flag).
+        done_files:  Shared result of _scan_done_files(); defaults to the list
+                     carried in vault_snapshot["done_files"].
+        dirs:        Folder listings shared with the rest of the audit run.
 
     Returns path to the saved briefing file.
     """
     BRIEFINGS.mkdir(parents=True, exist_ok=True)
     now = report_date or datetime.now(timezone.utc)
+    if done_files is None:
+        done_files = vault_snapshot.get("done_files")
+    if done_files is None:
+        done_files = _scan_done_files(dirs)
     date_str = now.strftime("%Y-%m-%d")
     day_name = now.strftime("%A")
 
@@ -273,22 +480,8 @@ def generate_ceo_briefing(
     prior = prior_stats or {}
     counts = vault_snapshot["counts"]
 
-    # Count prior-week Done items (processed 7–14 days ago)
-    week_ago = now - timedelta(days=7)
-    two_weeks_ago = now - timedelta(days=14)
-    prior_week_done = 0
-    for _f in DONE.glob("FILE_*.md"):
-        _fm = _read_frontmatter(_f)
-        try:
-            _processed = datetime.fromisoformat(
-                _fm.get("processed_at", "").replace("Z", "+00:00")
-            )
-            if _processed.tzinfo is None:
-                _processed = _processed.replace(tzinfo=timezone.utc)
-            if two_weeks_ago <= _processed < week_ago:
-                prior_week_done += 1
-        except (ValueError, TypeError):
-            continue
+    # Prior-week Done items (processed 7–14 days ago), counted in the snapshot pass
+    prior_week_done = counts["done_prior_week"]
 
     def _delta(a: int, b: int) -> str:
         if b == 0:
@@ -380,44 +573,54 @@ def generate_ceo_briefing(
     # --- Section 7: Week Ahead ---
     # Extract deadlines from recent Done/ action items
     upcoming: list[str] = []
-    import re as _re
-    for f in sorted(DONE.glob("FILE_*.md"), key=lambda p: p.stat().st_mtime, reverse=True)[:15]:
-        try:
-            text = f.read_text(encoding="utf-8")
-            matches = _re.findall(
-                r"- \[ \] .{0,100}(?:by|due|deadline|before)\s+\S+",
-                text, _re.IGNORECASE,
-            )
-            upcoming.extend(matches[:2])
-        except OSError:
+    for df in sorted(done_files, key=lambda d: d.mtime, reverse=True)[:15]:
+        # Bytes probe for the first checkbox, then match on decoded text so
+        # the 100-character bound still counts characters, not UTF-8 bytes.
+        # The probe lands on an ASCII '-', so decoding from there is exact.
+        first = df.data.find(b"- [ ] ")
+        if first < 0:
             continue
+        matches = _DEADLINE_RE.findall(df.data[first:].decode("utf-8", "replace"))
+        upcoming.extend(matches[:2])
     upcoming_text = "\n".join(f"  - {d}" for d in upcoming[:8]) or \
         "  - No upcoming deadlines detected (check Plans/ for active plans)"
 
     # Scheduled social posts
     scheduled_posts: list[str] = []
-    for f in PENDING_APPROVAL.glob("TWITTER_*.md"):
-        fm = _read_frontmatter(f)
+    for entry in _iter_md(PENDING_APPROVAL, "TWITTER_", dirs):
+        fm = _read_frontmatter(entry.path)
         scheduled_for = fm.get("scheduled_for", "")
         if scheduled_for:
-            scheduled_posts.append(f"  - Twitter: {scheduled_for} — {f.name}")
+            scheduled_posts.append(f"  - Twitter: {scheduled_for} — {entry.name}")
     scheduled_text = "\n".join(scheduled_posts) or "  - No scheduled posts pending approval"
 
     # --- Assemble the briefing ---
-    briefing_content = (
+    # Built as a list of chunks; each section heading is recorded as it is
+    # appended so validation does not have to rescan the finished text.
+    parts: list[str] = []
+    sections_written: set[str] = set()
+
+    def _section(heading: str, body: str) -> None:
+        parts.append(f"{heading}\n\n{body}")
+        sections_written.add(heading)
+
+    quarantine_count = len(vault_snapshot["quarantine_items"])
+    parts.append(
         f"---\n"
         f"type: ceo_briefing\n"
         f"generated_at: {now.isoformat()}\n"
         f"period: weekly\n"
-        f"health_score: {max(0, 100 - len(vault_snapshot['quarantine_items']) * 10 - len(overdue_items) * 5)}\n"
+        f"health_score: {max(0, 100 - quarantine_count * 10 - len(overdue_items) * 5)}\n"
         f"---\n\n"
         f"# {day_name} Morning CEO Briefing — {date_str}\n\n"
         f"**Generated:** {now.strftime('%Y-%m-%d %H:%M UTC')} by Zoya AI Employee  \n"
         f"**Period:** Last 7 days  \n"
         f"**Items processed this week:** {counts['done_this_week']}  \n"
-        f"**System health:** {max(0, 100 - len(vault_snapshot['quarantine_items']) * 10)}/100\n\n"
+        f"**System health:** {max(0, 100 - quarantine_count * 10)}/100\n\n"
         f"---\n\n"
-        f"## 🏦 Financial Summary\n\n"
+    )
+    _section(
+        _SECTION_FINANCIAL,
         f"- **Cash Position:** {fin.get('cash_position', 'Pending Odoo connection')}\n"
         f"- **Revenue This Week vs Target:** "
         f"{fin.get('revenue_this_week', 'N/A')} / {fin.get('revenue_target', 'N/A')}\n"
@@ -425,20 +628,26 @@ def generate_ceo_briefing(
         f"- **Top Expense Categories:**\n{expense_rows}\n"
         f"- **Subscription Audit (unused >30 days):**\n{sub_rows}\n"
         f"{wow_table}\n"
-        f"---\n\n"
-        f"## ✅ Completed This Week\n\n"
+        f"---\n\n",
+    )
+    _section(
+        _SECTION_COMPLETED,
         f"{completed_rows}\n\n"
         f"**Total completed:** {counts['done_this_week']} items  \n"
         f"**Auto-processed:** {audit_stats.get('total_entries', 0)} actions  \n"
         f"**Human approvals given:** "
         f"{audit_stats.get('total_entries', 0) - counts['done_this_week']} actions\n\n"
-        f"---\n\n"
-        f"## 🚧 Bottlenecks\n\n"
+        f"---\n\n",
+    )
+    _section(
+        _SECTION_BOTTLENECKS,
         f"{bottleneck_rows}\n\n"
         f"**Items in In_Progress:** {counts['in_progress']}  \n"
         f"**Items in Quarantine:** {counts['quarantine']}\n\n"
-        f"---\n\n"
-        f"## 📱 Social Media Performance\n\n"
+        f"---\n\n",
+    )
+    _section(
+        _SECTION_SOCIAL,
         f"- **Facebook:** reach: {fb.get('reach', 'N/A')}, "
         f"engagement rate: {fb.get('engagement', 'N/A')}\n"
         f"- **Instagram:** followers delta: {ig.get('followers_delta', 'N/A')}, "
@@ -447,34 +656,29 @@ def generate_ceo_briefing(
         f"mentions: {tw.get('mentions', 'N/A')} "
         f"({tw.get('posts', 0)} post(s) this week)\n"
         f"- **LinkedIn:** {li.get('posts', 0)} post(s) this week\n\n"
-        f"---\n\n"
-        f"## ⚠️ Alerts Requiring Attention\n\n"
-        f"{alerts_text}\n\n"
-        f"---\n\n"
-        f"## 💡 Proactive Suggestions\n\n"
-        f"{suggestions_text}\n\n"
-        f"---\n\n"
-        f"## 📅 Week Ahead\n\n"
+        f"---\n\n",
+    )
+    _section(_SECTION_ALERTS, f"{alerts_text}\n\n---\n\n")
+    _section(_SECTION_SUGGESTIONS, f"{suggestions_text}\n\n---\n\n")
+    payment_dues = ", ".join(
+        f"{i.get('client', '?')} ${i.get('amount', '?')}" for i in outstanding[:3]
+    ) or "None detected"
+    _section(
+        _SECTION_WEEK_AHEAD,
         f"**Upcoming deadlines (next 7 days):**\n{upcoming_text}\n\n"
         f"**Scheduled social posts:**\n{scheduled_text}\n\n"
-        f"**Payment dues:** {', '.join(i.get('client', '?') + ' $' + str(i.get('amount', '?')) for i in outstanding[:3]) or 'None detected'}\n\n"
-        f"---\n\n"
-        f"*Generated by Zoya AI Employee — CEO Briefing System*  \n"
-        f"*Data sources: Vault folders, Audit logs, Social metrics*  \n"
+        f"**Payment dues:** {payment_dues}\n\n"
+        f"---\n\n",
+    )
+    parts.append(
+        "*Generated by Zoya AI Employee — CEO Briefing System*  \n"
+        "*Data sources: Vault folders, Audit logs, Social metrics*  \n"
         f"{'*[DRY RUN — no real data fetched]*' if dry_run else ''}\n"
     )
 
-    # Validate all 7 required sections are present
-    REQUIRED_SECTIONS = [
-        "## 🏦 Financial Summary",
-        "## ✅ Completed This Week",
-        "## 🚧 Bottlenecks",
-        "## 📱 Social Media Performance",
-        "## ⚠️ Alerts Requiring Attention",
-        "## 💡 Proactive Suggestions",
-        "## 📅 Week Ahead",
-    ]
-    missing_sections = [s for s in REQUIRED_SECTIONS if s not in briefing_content]
+    # Validate all 7 required sections were appended
+    missing_sections = [h for h in REQUIRED_SECTIONS if h not in sections_written]
+    briefing_content = "".join(parts)
     now_str = now.strftime("%Y%m%d_%H%M%S")
 
     if missing_sections:
@@ -506,8 +710,8 @@ def generate_ceo_briefing(
     briefing_path = BRIEFINGS / briefing_name
     briefing_path.write_text(briefing_content, encoding="utf-8")
 
-    # Overwrite the rolling "latest" pointer for easy reference
-    (BRIEFINGS / "CEO_BRIEFING_LATEST.md").write_text(briefing_content, encoding="utf-8")
+    # Repoint the rolling "latest" file for easy reference
+    _link_latest(briefing_path, briefing_content)
 
     # Update Dashboard.md "Last CEO Briefing" line
     _update_dashboard_briefing_line(briefing_name, now)
@@ -521,10 +725,77 @@ def generate_ceo_briefing(
     return briefing_path
 
 
+def _link_latest(briefing_path: Path, briefing_content: str) -> None:
+    """Make CEO_BRIEFING_LATEST.md a hard link to the new briefing.
+
+    The link is created under a temp name and swapped in with os.replace, so
+    readers never see a missing or half-written LATEST. Falls back to writing
+    a copy where hard links are unsupported.
+    """
+    latest = BRIEFINGS / "CEO_BRIEFING_LATEST.md"
+    tmp = BRIEFINGS / ".CEO_BRIEFING_LATEST.md.tmp"
+    try:
+        tmp.unlink(missing_ok=True)
+        os.link(briefing_path, tmp)
+        os.replace(tmp, latest)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        latest.write_text(briefing_content, encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # WhatsApp summary sender
 # ---------------------------------------------------------------------------
 
+_WA_HOST = "graph.facebook.com"
+_wa_conn: http.client.HTTPSConnection | None = None
+
+
+def _wa_post(path: str, body: bytes) -> tuple[int, bytes]:
+    """POST to the Graph API over a keep-alive connection reused across sends.
+
+    Uses stdlib http.client so the send path still avoids importing
+    requests. A message POST is not idempotent, so it is never re-sent:
+    an idle connection the server has closed is detected and replaced
+    before anything is written, and any error once the request is under
+    way propagates as a failed send.
+    """
+    global _wa_conn
+    headers = {
+        "Authorization": f"Bearer {WHATSAPP_ACCESS_TOKEN}",
+        "Content-Type": "application/json",
+    }
+    if _wa_conn is not None and _wa_stale(_wa_conn):
+        _wa_conn.close()
+        _wa_conn = None
+    if _wa_conn is None:
+        _wa_conn = http.client.HTTPSConnection(_WA_HOST, timeout=30)
+    try:
+        _wa_conn.request("POST", path, body=body, headers=headers)
+        resp = _wa_conn.getresponse()
+        return resp.status, resp.read()   # drain so the connection can be reused
+    except Exception:
+        _wa_conn.close()
+        _wa_conn = None
+        raise
+
+
+def _wa_stale(conn: http.client.HTTPSConnection) -> bool:
+    """True if an idle keep-alive socket has been closed (or written to) by the peer.
+
+    Nothing should arrive on an idle connection, so a readable socket means
+    EOF or a TLS close_notify; either way it cannot carry another request.
+    """
+    sock = conn.sock
+    if sock is None:   # not connected yet; request() will connect
+        return False
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
 def send_whatsapp_summary(briefing_path: Path, dry_run: bool = False) -> bool:
     """Send a concise briefing summary to the owner via WhatsApp.
 
@@ -537,26 +808,28 @@ def send_whatsapp_summary(briefing_path: Path, dry_run: bool = False) -> bool:
         )
         return False
 
+    # Build compact summary (WhatsApp messages should be concise); the file
+    # is streamed so reading stops as soon as ~800 chars have been collected.
+    summary_lines: list[str] = []
+    total_len = -1   # accounts for the "\n" separators of the final join
     try:
-        text = briefing_path.read_text(encoding="utf-8")
+        with briefing_path.open("r", encoding="utf-8") as fh:
+            for raw in fh:
+                line = raw.rstrip("\n")
+                if not line.strip() or line.startswith(("---", "#-", "*Generated")):
+                    continue
+                if line.startswith("#"):
+                    line = line.lstrip("#").strip()
+                elif not line.startswith(("- **", "- 🔴", "- ⚠️", "- ✅")):
+                    continue
+                summary_lines.append(line)
+                total_len += len(line) + 1
+                if total_len > 800:
+                    break
     except OSError:
         logger.error("Could not read briefing for WhatsApp send: %s", briefing_path)
         return False
 
-    # Extract key lines for the summary message
-    import re as _re
-    lines = [l for l in text.splitlines() if l.strip() and not l.startswith(("---", "#-", "*Generated"))]
-
-    # Build compact summary (WhatsApp messages should be concise)
-    summary_lines = []
-    for line in lines:
-        if line.startswith("#"):
-            summary_lines.append(line.lstrip("#").strip())
-        elif line.startswith("- **") or line.startswith("- 🔴") or line.startswith("- ⚠️") or line.startswith("- ✅"):
-            summary_lines.append(line)
-        if len("\n".join(summary_lines)) > 800:
-            break
-
     message = (
         f"📊 *Zoya Weekly Briefing*\n\n"
         + "\n".join(summary_lines[:20])
@@ -576,71 +849,92 @@ def send_whatsapp_summary(briefing_path: Path, dry_run: bool = False) -> bool:
         logger.error("WhatsApp credentials not configured — cannot send briefing summary")
         return False
 
+    payload = {
+        "messaging_product": "whatsapp",
+        "to": OWNER_WHATSAPP,
+        "type": "text",
+        "text": {"body": message[:4000]},  # WhatsApp 4096 char limit
+    }
     try:
-        import requests
-        url = f"https://graph.facebook.com/v18.0/{WHATSAPP_PHONE_NUMBER_ID}/messages"
-        headers = {
-            "Authorization": f"Bearer {WHATSAPP_ACCESS_TOKEN}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "messaging_product": "whatsapp",
-            "to": OWNER_WHATSAPP,
-            "type": "text",
-            "text": {"body": message[:4000]},  # WhatsApp 4096 char limit
-        }
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
-        if resp.status_code == 200:
-            logger.info("WhatsApp briefing summary sent to %s", OWNER_WHATSAPP)
-            audit_log(
-                "whatsapp_sent",
-                OWNER_WHATSAPP,
-                actor="claude_code",
-                approval_status="auto",
-                parameters={"briefing": briefing_path.name},
-            )
-            return True
-        else:
-            logger.error("WhatsApp send failed: %d %s", resp.status_code, resp.text[:200])
-            return False
+        status, body = _wa_post(
+            f"/v18.0/{WHATSAPP_PHONE_NUMBER_ID}/messages",
+            json.dumps(payload).encode("utf-8"),
+        )
     except Exception:
         logger.exception("WhatsApp send exception")
         return False
 
+    if status == 200:
+        logger.info("WhatsApp briefing summary sent to %s", OWNER_WHATSAPP)
+        audit_log(
+            "whatsapp_sent",
+            OWNER_WHATSAPP,
+            actor="claude_code",
+            approval_status="auto",
+            parameters={"briefing": briefing_path.name},
+        )
+        return True
+    logger.error(
+        "WhatsApp send failed: %d %s", status, body[:200].decode("utf-8", "replace")
+    )
+    return False
+
 
 # ---------------------------------------------------------------------------
 # Progress log
 # ---------------------------------------------------------------------------
 
+_progress_buffer: list[str] = []
+
+
 def _log_progress(event: str, detail: str = "") -> None:
-    """Append a line to /Vault/Logs/gold_tier_progress.md."""
-    LOGS.mkdir(parents=True, exist_ok=True)
+    """Queue a line for /Vault/Logs/gold_tier_progress.md (see _flush_progress)."""
     now = datetime.now(timezone.utc)
-    line = f"- [{now.strftime('%Y-%m-%d %H:%M UTC')}] **{event}** {detail}\n"
+    _progress_buffer.append(
+        f"- [{now.strftime('%Y-%m-%d %H:%M UTC')}] **{event}** {detail}\n"
+    )
+
+
+def _flush_progress() -> None:
+    """Append all queued progress lines with a single open/write."""
+    if not _progress_buffer:
+        return
+    LOGS.mkdir(parents=True, exist_ok=True)
     with open(PROGRESS_LOG, "a", encoding="utf-8") as f:
-        f.write(line)
+        f.writelines(_progress_buffer)
+    _progress_buffer.clear()
 
 
 def _update_dashboard_briefing_line(briefing_name: str, ts: datetime) -> None:
     """Update (or insert) the Last CEO Briefing line in Dashboard.md."""
-    import re as _re
     if not DASHBOARD.exists():
         return
-    text = DASHBOARD.read_text(encoding="utf-8")
+    lines = DASHBOARD.read_text(encoding="utf-8").splitlines(keepends=True)
     new_line = (
         f"**Last CEO Briefing:** {ts.strftime('%Y-%m-%d %H:%M UTC')} "
         f"— [{briefing_name}](Briefings/{briefing_name})"
     )
-    if "**Last CEO Briefing:**" in text:
-        text = _re.sub(r"\*\*Last CEO Briefing:\*\*.*", new_line, text)
-    else:
+    marker = "**Last CEO Briefing:**"
+    replaced = False
+    for i, line in enumerate(lines):
+        pos = line.find(marker)
+        if pos != -1:
+            ending = line[len(line.rstrip("\r\n")):]
+            lines[i] = line[:pos] + new_line + ending
+            replaced = True
+    if not replaced:
         # Insert after the "Last updated" line
-        text = _re.sub(
-            r"(\*\*Last updated:\*\*[^\n]*)",
-            r"\1\n" + new_line,
-            text,
-        )
-    DASHBOARD.write_text(text, encoding="utf-8")
+        for i, line in enumerate(lines):
+            if "**Last updated:**" in line:
+                if not line.endswith("\n"):
+                    lines[i] = line + "\n"
+                    lines.insert(i + 1, new_line)
+                else:
+                    lines.insert(i + 1, new_line + "\n")
+                break
+        else:
+            return
+    DASHBOARD.write_text("".join(lines), encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -661,36 +955,46 @@ def run_audit(dry_run: bool = False, report_date: datetime | None = None) -> Pat
     Returns:
         Path to the generated briefing.
     """
+    try:
+        return _run_audit(dry_run, report_date)
+    finally:
+        _flush_progress()
+
+
+def _run_audit(dry_run: bool, report_date: datetime | None) -> Path:
     logger.info("Starting weekly audit (dry_run=%s)", dry_run)
     _log_progress("audit_started", f"dry_run={dry_run}")
     run_start = datetime.now(timezone.utc)
 
-    # Step 1: Collect data
-    vault_snapshot = collect_vault_snapshot()
-    social_metrics = collect_social_metrics()
-    financial = collect_financial_summary()
-    audit_stats = get_period_stats(days=7)
-
-    # Step 2: Prior-week stats for week-over-week comparison
+    # Step 1: Collect data (the snapshot carries the Done/ scan to the briefing).
+    # The collectors are independent read-only I/O, so they run side by side.
+    # They share this run's folder listings; Done/ is listed up front so the
+    # snapshot and social metrics count the same files.
+    # Both audit-stat windows come from one 14-day log read, split below.
     ref_date = report_date or datetime.now(timezone.utc)
-    prior_week_end = ref_date - timedelta(days=7)
-    prior_entries = read_logs(date=prior_week_end, days=7)
-    prior_stats = {
-        "total_entries": len(prior_entries),
-        "social_posts": sum(
-            1 for e in prior_entries
-            if "social_post" in e.get("action_type", "")
-            or e.get("action_type", "").startswith(("twitter_", "linkedin_", "facebook_", "instagram_"))
-        ),
-        "emails_sent": sum(
-            1 for e in prior_entries
-            if e.get("action_type") == "email_send" and e.get("result") == "success"
-        ),
-        "failures": sum(1 for e in prior_entries if e.get("result") == "failure"),
-    }
-    prior_stats["failure_rate"] = round(
-        prior_stats["failures"] / max(prior_stats["total_entries"], 1) * 100, 1
-    )
+    dirs = DirListings()
+    dirs.entries(DONE)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        snapshot_future = pool.submit(collect_vault_snapshot, dirs=dirs)
+        financial_future = pool.submit(collect_financial_summary)
+        logs_future = pool.submit(read_logs, date=ref_date, days=14)
+        vault_snapshot = snapshot_future.result()
+        financial = financial_future.result()
+        entries = logs_future.result()
+
+    # Step 2: Split into this week / prior week for week-over-week comparison
+    week_start = (ref_date - timedelta(days=6)).strftime("%Y-%m-%d")
+    current_entries: list[dict] = []
+    prior_entries: list[dict] = []
+    for e in entries:
+        if e.get("timestamp", "")[:10] >= week_start:
+            current_entries.append(e)
+        else:
+            prior_entries.append(e)
+    audit_stats = summarize_entries(current_entries)
+    prior_stats = summarize_entries(prior_entries)
+    # Social metrics reuse this week's entries rather than re-reading the logs
+    social_metrics = collect_social_metrics(dirs, entries=current_entries)
 
     # Step 3: Generate CEO briefing
     briefing_path = generate_ceo_briefing(
@@ -701,6 +1005,7 @@ def run_audit(dry_run: bool = False, report_date: datetime | None = None) -> Pat
         prior_stats=prior_stats,
         report_date=report_date,
         dry_run=dry_run,
+        dirs=dirs,
     )
     _log_progress("briefing_generated", briefing_path.name)
 
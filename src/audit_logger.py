@@ -15,6 +15,11 @@ Log format (JSON-lines, one entry per line):
 
 Storage:
   - Logs saved to AI_Employee_Vault/Logs/YYYY-MM-DD.json
+  - Opt-in binary file_* records in AI_Employee_Vault/Logs/YYYY-MM-DD.bin
+    (audit_log_binary(); merged back in by read_logs())
+  - Days before yesterday are gzipped to YYYY-MM-DD.json.gz by rotate_closed_days()
+    (run by purge_old_logs() and by the src/log_janitor.py cron job)
+  - Per-day stats cached in AI_Employee_Vault/Logs/.stats/YYYY-MM-DD.json
   - Retention: 90 days minimum (old logs auto-purged)
   - Weekly summary appended to Dashboard.md every Sunday
 
@@ -24,19 +29,45 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import gzip
 import json
-import re
+import mmap
+import os
+import shutil
+import struct
+import threading
+import time
+import zlib
+from collections import Counter, deque
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from heapq import nlargest
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
 
 from src.config import DASHBOARD, LOGS, VAULT_PATH
 from src.utils import setup_logger
 
+try:
+    import orjson  # optional: several times faster than stdlib json
+except ImportError:
+    orjson = None
+
 logger = setup_logger("audit_logger")
 
 LOG_RETENTION_DAYS = 90
 
+# The weekly summary block in Dashboard.md sits between these markers so it
+# can be replaced with two str.find() calls. Blocks written before the
+# markers existed always ran to the end of the file.
+_SUMMARY_START = "<!-- WEEKLY_AUDIT_SUMMARY_START -->"
+_SUMMARY_END = "<!-- WEEKLY_AUDIT_SUMMARY_END -->"
+_LEGACY_SUMMARY_HEAD = "\n---\n\n## 📊 Weekly Audit Summary"
+
 # All recognised action types — for documentation / validation
 ACTION_TYPES = frozenset({
     # Document processing
@@ -84,6 +115,10 @@ def audit_log(
 ) -> None:
     """Append a structured audit entry to today's JSON-lines log.
 
+    The entry is queued in memory and written by a background flusher within
+    ~50 ms (see flush()); read_logs() flushes first, so in-process readers
+    always see it.
+
     Args:
         action_type:     What happened (see ACTION_TYPES for valid values).
         target:          The recipient, file path, or system affected.
@@ -94,7 +129,6 @@ def audit_log(
         result:          "success" | "failure" | "pending".
         error:           Error message string, or None on success.
     """
-    LOGS.mkdir(parents=True, exist_ok=True)
     now = datetime.now(timezone.utc)
     today = now.strftime("%Y-%m-%d")
     log_file = LOGS / f"{today}.json"
@@ -111,14 +145,277 @@ def audit_log(
         "error": error,
     }
 
-    with open(log_file, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+    _QUEUE.append((log_file, _fit_line(entry)))
+    _start_flusher()
+    if len(_QUEUE) >= _FLUSH_BATCH:
+        _WAKE.set()
+
+
+# ---------------------------------------------------------------------------
+# Buffered writer: audit_log() only enqueues; a daemon thread appends each
+# day's queued lines every _FLUSH_INTERVAL seconds.
+#
+# Several processes (orchestrator, watchers, ralph) append to the same day
+# file. Writes go through a raw O_APPEND fd in chunks of at most PIPE_BUF
+# bytes, each made of whole lines, so concurrent writers never interleave
+# inside a line and no file locking is needed.
+# ---------------------------------------------------------------------------
+
+_FLUSH_INTERVAL = 0.05     # seconds between background flushes
+_FLUSH_BATCH = 256         # flush early once this many entries are queued
+
+_QUEUE: deque[tuple[Path, bytes]] = deque()
+_PIPE_BUF = 4096           # POSIX minimum; Linux's actual value
+_MAX_ERROR_CHARS = 512
+
+_LOCK = threading.Lock()   # serialises flushes and guards _FDS
+_WAKE = threading.Event()
+_FDS: dict[Path, int] = {}
+_FLUSHER: threading.Thread | None = None
+
+
+def _dumps_line(entry: dict[str, Any]) -> bytes:
+    """Serialise one entry as a UTF-8 JSON line (orjson when installed)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass   # e.g. ints beyond 64 bits — let stdlib json handle it
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+def _fit_line(entry: dict[str, Any]) -> bytes:
+    """Serialise an entry, trimming oversized fields so the line fits PIPE_BUF."""
+    line = _dumps_line(entry)
+    if len(line) < _PIPE_BUF:
+        return line
+    entry = {**entry, "parameters": {"_truncated": True, "size": len(line)}}
+    if entry["error"]:
+        entry["error"] = entry["error"][:_MAX_ERROR_CHARS]
+    line = _dumps_line(entry)
+    if len(line) >= _PIPE_BUF:
+        entry["target"] = entry["target"][:_MAX_ERROR_CHARS]
+        line = _dumps_line(entry)
+    return line
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _start_flusher() -> None:
+    global _FLUSHER
+    if _FLUSHER is not None:
+        return
+    with _LOCK:
+        if _FLUSHER is None:
+            _FLUSHER = threading.Thread(
+                target=_flush_loop, name="audit-log-flusher", daemon=True
+            )
+            _FLUSHER.start()
+
+
+def _flush_loop() -> None:
+    while True:
+        _WAKE.wait(_FLUSH_INTERVAL)
+        _WAKE.clear()
+        try:
+            flush()
+        except Exception:
+            logger.exception("Audit log flush failed")
+
+
+def _fd_for(log_file: Path) -> int:
+    """Return the cached O_APPEND fd for a day file (caller holds _LOCK).
+
+    Only the current day's files (.json and, if used, .bin) keep an fd:
+    opening a new day's file closes the previous day's, so fds rotate at
+    UTC midnight.
+    """
+    fd = _FDS.get(log_file)
+    if fd is None:
+        day = log_file.name[:10]
+        for stale in [p for p in _FDS if p.name[:10] != day]:
+            os.close(_FDS.pop(stale))
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = _FDS[log_file] = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    return fd
+
+
+def _close_fds() -> None:
+    while _FDS:
+        os.close(_FDS.popitem()[1])
+
+
+def _write_lines(fd: int, lines: list[bytes]) -> None:
+    """Append whole lines with one os.write() per chunk of <= PIPE_BUF bytes."""
+    chunk: list[bytes] = []
+    size = 0
+    for line in lines:
+        if chunk and size + len(line) > _PIPE_BUF:
+            os.write(fd, b"".join(chunk))
+            chunk, size = [], 0
+        chunk.append(line)
+        size += len(line)
+    if chunk:
+        os.write(fd, b"".join(chunk))
+
+
+def flush() -> None:
+    """Write every queued audit entry to disk now.
+
+    Called by the background thread, at interpreter exit, and by read_logs()
+    so entries logged in this process are always visible to readers.
+    """
+    with _LOCK:
+        if not _QUEUE:
+            return
+        batches: dict[Path, list[bytes]] = {}
+        while _QUEUE:
+            log_file, line = _QUEUE.popleft()
+            batches.setdefault(log_file, []).append(line)
+        for log_file, lines in batches.items():
+            _write_lines(_fd_for(log_file), lines)
+
+
+def _shutdown() -> None:
+    flush()
+    with _LOCK:
+        _close_fds()
+
+
+atexit.register(_shutdown)
+
+
+# ---------------------------------------------------------------------------
+# Binary log: opt-in fixed-width records for high-volume file_* events.
+# Each record is 48 bytes: ns timestamp, four enum bytes (action, actor,
+# approval, result), the target truncated to 32 UTF-8 bytes, and a CRC32 of
+# the parameters. Records go to Logs/YYYY-MM-DD.bin through the same queue
+# and flusher as the JSONL log, and read_logs() merges them back in.
+# ---------------------------------------------------------------------------
+
+_BIN_RECORD = struct.Struct("<QBBBB32sI")
+_BIN_SUFFIX = ".bin"
+
+# Enum tables: a value's index is its on-disk id. Append only, never reorder.
+BINARY_ACTION_TYPES = (
+    "file_queued", "file_claimed", "file_done", "file_retry", "file_quarantined",
+    "file_routed_to_approval", "file_approved", "file_rejected",
+)
+_BIN_ACTORS = ("claude_code", "human", "watcher")
+_BIN_APPROVALS = ("auto", "human_approved", "human_rejected")
+_BIN_RESULTS = ("success", "failure", "pending")
+_BIN_ACTION_IDS = {v: i for i, v in enumerate(BINARY_ACTION_TYPES)}
+_BIN_ACTOR_IDS = {v: i for i, v in enumerate(_BIN_ACTORS)}
+_BIN_APPROVAL_IDS = {v: i for i, v in enumerate(_BIN_APPROVALS)}
+_BIN_RESULT_IDS = {v: i for i, v in enumerate(_BIN_RESULTS)}
+
+
+def audit_log_binary(
+    action_type: str,
+    target: str,
+    *,
+    actor: str = "claude_code",
+    parameters: dict[str, Any] | None = None,
+    approval_status: str = "auto",
+    result: str = "success",
+) -> None:
+    """Append a fixed-width binary record to today's .bin log.
+
+    Meant for machine-generated per-file events (BINARY_ACTION_TYPES) where
+    the JSONL line costs more than the event is worth. Only a CRC32 of
+    *parameters* is kept and the target is cut to 32 bytes, so anything a
+    human reviews, or whose parameters matter, belongs in audit_log().
+    Values outside the enum tables are written with audit_log() instead.
+    """
+    ids = (
+        _BIN_ACTION_IDS.get(action_type),
+        _BIN_ACTOR_IDS.get(actor),
+        _BIN_APPROVAL_IDS.get(approval_status),
+        _BIN_RESULT_IDS.get(result),
+    )
+    if None in ids:
+        audit_log(action_type, target, actor=actor, parameters=parameters,
+                  approval_status=approval_status, result=result)
+        return
+
+    now_ns = time.time_ns()
+    day = datetime.fromtimestamp(now_ns / 1e9, timezone.utc).strftime("%Y-%m-%d")
+    param_hash = zlib.crc32(json.dumps(parameters, sort_keys=True).encode()) if parameters else 0
+    record = _BIN_RECORD.pack(now_ns, *ids, target.encode("utf-8")[:32], param_hash)
+    _QUEUE.append((LOGS / f"{day}{_BIN_SUFFIX}", record))
+    _start_flusher()
+    if len(_QUEUE) >= _FLUSH_BATCH:
+        _WAKE.set()
+
+
+def _enum(table: tuple[str, ...], i: int) -> str:
+    return table[i] if i < len(table) else "unknown"
+
+
+def decode_binary_log(path: Path) -> list[dict[str, Any]]:
+    """Decode a .bin log into entries shaped like read_logs() results.
+
+    A trailing partial record (e.g. from a crash mid-write) is ignored.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return []
+    entries = []
+    usable = len(data) - len(data) % _BIN_RECORD.size
+    for ts_ns, action, actor, approval, result, target, param_hash in _BIN_RECORD.iter_unpack(
+        memoryview(data)[:usable]
+    ):
+        approval_status = _enum(_BIN_APPROVALS, approval)
+        entries.append({
+            "timestamp": datetime.fromtimestamp(ts_ns / 1e9, timezone.utc).isoformat(),
+            "action_type": _enum(BINARY_ACTION_TYPES, action),
+            "actor": _enum(_BIN_ACTORS, actor),
+            "target": target.rstrip(b"\0").decode("utf-8", "ignore"),
+            "parameters": {"crc32": param_hash} if param_hash else {},
+            "approval_status": approval_status,
+            "approved_by": "auto_rule" if approval_status == "auto" else "human",
+            "result": _enum(_BIN_RESULTS, result),
+            "error": None,
+        })
+    return entries
 
 
 # ---------------------------------------------------------------------------
 # Log reader
 # ---------------------------------------------------------------------------
 
+_MMAP_MIN_BYTES = 4 * 1024 * 1024   # closed days at least this big are mmapped
+
+
+def _open_day_log(day: str) -> BinaryIO | None:
+    """Open a day's log for binary line iteration: plain, else gzip-rotated."""
+    try:
+        return open(LOGS / f"{day}.json", "rb")
+    except FileNotFoundError:
+        pass
+    try:
+        return gzip.open(LOGS / f"{day}{_GZ_SUFFIX}", "rb")
+    except FileNotFoundError:
+        return None
+
+
+def _filter_probes(*values: str | None) -> list[bytes]:
+    """Byte substrings every line matching the given filter values must contain.
+
+    A value is probed as its quoted JSON string, which appears verbatim with
+    both json.dumps and orjson spacing. Values that either serialiser might
+    escape (quotes, backslashes, non-ASCII) get no probe and fall back to the
+    post-parse check.
+    """
+    probes = []
+    for value in values:
+        if value and value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+            probes.append(b'"' + value.encode("ascii") + b'"')
+    return probes
+
+
 def read_logs(
     date: datetime | None = None,
     days: int = 1,
@@ -138,41 +435,98 @@ def read_logs(
     Returns:
         List of log entry dicts, chronologically ordered.
     """
+    flush()
     end = (date or datetime.now(timezone.utc)).replace(
         hour=0, minute=0, second=0, microsecond=0
     )
     entries: list[dict] = []
-
-    for i in range(days):
-        day = end - timedelta(days=i)
-        log_file = LOGS / f"{day.strftime('%Y-%m-%d')}.json"
-        if not log_file.exists():
+    probes = _filter_probes(action_type_filter, result_filter, actor_filter)
+
+    for i in range(days - 1, -1, -1):   # oldest day first
+        day_str = (end - timedelta(days=i)).strftime("%Y-%m-%d")
+        day_entries = [
+            e for e in chain(
+                _iter_day_jsonl(day_str, probes),
+                decode_binary_log(LOGS / f"{day_str}{_BIN_SUFFIX}"),
+            )
+            if (not action_type_filter or e.get("action_type") == action_type_filter)
+            and (not result_filter or e.get("result") == result_filter)
+            and (not actor_filter or e.get("actor") == actor_filter)
+        ]
+        # Lines are not strictly in time order: audit_log() entries land up to
+        # _FLUSH_INTERVAL late while utils.log_action() writes immediately,
+        # several processes share the file, and .bin records are merged in.
+        # Timsort is ~linear on this nearly sorted input; days are already
+        # read oldest first.
+        day_entries.sort(key=_timestamp)
+        entries.extend(day_entries)
+
+    return entries
+
+
+def _iter_day_jsonl(day: str, probes: list[bytes]) -> Iterator[dict[str, Any]]:
+    """Parse a day's JSONL log, skipping lines that miss any byte probe."""
+    for line in _day_lines(day):
+        line = line.strip()
+        if not line:
             continue
-        for line in log_file.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if action_type_filter and entry.get("action_type") != action_type_filter:
-                continue
-            if result_filter and entry.get("result") != result_filter:
-                continue
-            if actor_filter and entry.get("actor") != actor_filter:
-                continue
-            entries.append(entry)
-
-    return sorted(entries, key=lambda e: e.get("timestamp", ""))
+        # Cheap byte search first: most lines fail a filter, and this
+        # skips their JSON parse. read_logs' dict checks stay authoritative.
+        if probes and not all(p in line for p in probes):
+            continue
+        try:
+            yield _loads(line)
+        except ValueError:   # JSONDecodeError (json and orjson) or bad UTF-8
+            continue
+
+
+def _day_lines(day: str) -> Iterator[bytes]:
+    """Yield a day's raw log lines; memory stays O(line), not O(file size).
+
+    Large closed days (plain .json, not today) are mmapped and split with
+    mm.find(), which skips the buffered reader's copy into its own buffer.
+    Today's file is still being appended to, so it is always streamed.
+    """
+    path = LOGS / f"{day}.json"
+    try:
+        size = os.stat(path).st_size
+    except FileNotFoundError:
+        size = 0
+    if size >= _MMAP_MIN_BYTES and day < datetime.now(timezone.utc).strftime("%Y-%m-%d"):
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos, end = 0, len(mm)
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                if nl < 0:
+                    nl = end
+                yield mm[pos:nl]
+                pos = nl + 1
+        return
+    f = _open_day_log(day)
+    if f is None:
+        return
+    with f:
+        yield from f
+
+
+def _timestamp(entry: dict[str, Any]) -> str:
+    return entry.get("timestamp", "")
 
 
 # ---------------------------------------------------------------------------
 # Retention: purge logs older than 90 days
 # ---------------------------------------------------------------------------
 
+def _is_day_stem(stem: str) -> bool:
+    """True if stem looks like YYYY-MM-DD (so it sorts like the date it names)."""
+    return (
+        len(stem) == 10 and stem[4] == "-" and stem[7] == "-"
+        and stem[:4].isdigit() and stem[5:7].isdigit() and stem[8:].isdigit()
+    )
+
+
 def purge_old_logs(retention_days: int = LOG_RETENTION_DAYS) -> int:
-    """Delete log files older than retention_days.
+    """Delete log files older than retention_days, then gzip closed days.
 
     Args:
         retention_days: Minimum age in days before a log file is deleted.
@@ -180,76 +534,101 @@ def purge_old_logs(retention_days: int = LOG_RETENTION_DAYS) -> int:
     Returns:
         Number of files deleted.
     """
-    if not LOGS.exists():
+    # ISO dates order like strings, so the cutoff check is a plain str compare
+    cutoff_str = (datetime.now(timezone.utc) - timedelta(days=retention_days)).strftime("%Y-%m-%d")
+
+    # Pick candidates from the filenames alone (YYYY-MM-DD.json); no stat needed
+    to_delete: list[Path] = []
+    try:
+        with os.scandir(LOGS) as it:
+            for entry in it:
+                stem = (
+                    entry.name.removesuffix(_GZ_SUFFIX).removesuffix(".json")
+                    .removesuffix(_BIN_SUFFIX)
+                )
+                if stem == entry.name:
+                    continue
+                if stem <= cutoff_str and _is_day_stem(stem):
+                    to_delete.append(Path(entry.path))
+    except FileNotFoundError:
         return 0
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
-    deleted = 0
+    def _purge(log_file: Path) -> None:
+        log_file.unlink()
+        _stats_path(log_file.name[:10]).unlink(missing_ok=True)
+        logger.info("Purged old log: %s", log_file.name)
 
-    for log_file in LOGS.glob("*.json"):
-        # Parse the date from the filename (YYYY-MM-DD.json)
-        try:
-            file_date = datetime.strptime(log_file.stem, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
-        if file_date < cutoff:
-            log_file.unlink()
-            deleted += 1
-            logger.info("Purged old log: %s", log_file.name)
+    # Unlinks are latency-bound, so overlap them on a small pool
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_purge, to_delete))
+    deleted = len(to_delete)
 
     if deleted:
         audit_log("log_purge", "LOGS/", parameters={"files_deleted": deleted, "retention_days": retention_days})
+    rotate_closed_days()
     return deleted
 
 
+def rotate_closed_days() -> int:
+    """Gzip day logs older than yesterday; returns the number rotated.
+
+    Closed days are never appended to again, and JSONL compresses ~10x, which
+    shrinks both the retention footprint and the bytes read_logs() must pull
+    from disk. Today and yesterday stay plain so late writers are unaffected.
+    """
+    keep_from = (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    try:
+        with os.scandir(LOGS) as it:
+            closed = [
+                Path(e.path) for e in it
+                if e.name.endswith(".json") and _is_day_stem(e.name[:-5]) and e.name[:-5] < keep_from
+            ]
+    except FileNotFoundError:
+        return 0
+    for log_file in closed:
+        gz = log_file.with_name(f"{log_file.stem}{_GZ_SUFFIX}")
+        tmp = gz.with_name(f".{gz.name}.{os.getpid()}.tmp")
+        with open(log_file, "rb") as src, gzip.open(tmp, "wb", compresslevel=1) as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(tmp, gz)
+        log_file.unlink()
+    if closed:
+        logger.info("Rotated %d closed day log(s) to gzip", len(closed))
+    return len(closed)
+
+
 # ---------------------------------------------------------------------------
 # Weekly summary builder
 # ---------------------------------------------------------------------------
 
 def weekly_audit_summary(
     append_to_dashboard: bool = True,
+    entries: list[dict[str, Any]] | None = None,
 ) -> str:
     """Generate a markdown weekly summary from the last 7 days of audit logs.
 
     Args:
         append_to_dashboard: If True, appends the summary block to Dashboard.md.
+        entries:             The last 7 days of entries, already read (see
+                             audit_snapshot()); read from the logs when omitted.
 
     Returns:
         The generated markdown summary string.
     """
-    entries = read_logs(days=7)
-
-    # Tally by action_type
-    action_counts: dict[str, int] = {}
-    result_counts: dict[str, int] = {"success": 0, "failure": 0, "pending": 0}
-    actor_counts: dict[str, int] = {"claude_code": 0, "human": 0, "watcher": 0}
-    approval_counts: dict[str, int] = {"auto": 0, "human_approved": 0, "human_rejected": 0}
-    failures: list[dict] = []
-
-    for e in entries:
-        at = e.get("action_type", "unknown")
-        action_counts[at] = action_counts.get(at, 0) + 1
-
-        r = e.get("result", "success")
-        result_counts[r] = result_counts.get(r, 0) + 1
-
-        ac = e.get("actor", "claude_code")
-        actor_counts[ac] = actor_counts.get(ac, 0) + 1
-
-        ap = e.get("approval_status", "auto")
-        approval_counts[ap] = approval_counts.get(ap, 0) + 1
-
-        if r == "failure":
-            failures.append(e)
+    # Closed days come pre-tallied from their stats sidecars; only today's
+    # log is parsed (see get_period_stats).
+    stats = get_period_stats(days=7, entries=entries)
+    total_entries = stats["total_entries"]
+    action_counts = stats["actions"]
+    result_counts = stats["results"]
+    actor_counts = stats["actors"]
+    approval_counts = stats["approvals"]
 
     # Top 10 action types
-    top_actions = sorted(action_counts.items(), key=lambda x: -x[1])[:10]
-    action_table = "\n".join(
-        f"| {at} | {cnt} |" for at, cnt in top_actions
-    ) or "| (none) | 0 |"
+    top_actions = nlargest(10, action_counts.items(), key=itemgetter(1))
 
     # Recent failures (last 5)
-    recent_failures = failures[-5:]
+    recent_failures = stats["recent_failures"][-5:]
     failure_lines = "\n".join(
         f"- `{e.get('timestamp','')[:19]}` [{e.get('action_type')}] "
         f"→ {e.get('target','')[:50]} — {e.get('error','')[:80]}"
@@ -257,78 +636,262 @@ def weekly_audit_summary(
     ) or "_No failures this week_ ✅"
 
     now = datetime.now(timezone.utc)
-    summary = (
-        f"\n---\n\n"
-        f"## 📊 Weekly Audit Summary — {now.strftime('%Y-%m-%d')}\n\n"
-        f"**Period:** Last 7 days ({len(entries)} total log entries)\n\n"
-        f"### Results\n\n"
-        f"| Result | Count |\n|--------|-------|\n"
-        f"| Success | {result_counts['success']} |\n"
-        f"| Failure | {result_counts['failure']} |\n"
-        f"| Pending | {result_counts['pending']} |\n\n"
-        f"### Actor Breakdown\n\n"
-        f"| Actor | Actions |\n|-------|--------|\n"
-        f"| Claude Code (AI) | {actor_counts['claude_code']} |\n"
-        f"| Human | {actor_counts['human']} |\n"
-        f"| Watcher | {actor_counts['watcher']} |\n\n"
-        f"### Approval Breakdown\n\n"
-        f"| Mode | Count |\n|------|-------|\n"
-        f"| Auto | {approval_counts['auto']} |\n"
-        f"| Human Approved | {approval_counts['human_approved']} |\n"
-        f"| Human Rejected | {approval_counts['human_rejected']} |\n\n"
-        f"### Top 10 Action Types\n\n"
-        f"| Action | Count |\n|--------|-------|\n"
-        f"{action_table}\n\n"
-        f"### Recent Failures\n\n"
-        f"{failure_lines}\n\n"
-        f"_Generated by Zoya Audit Logger at {now.isoformat()}_\n"
-    )
+    parts = [
+        f"\n---\n\n## 📊 Weekly Audit Summary — {now:%Y-%m-%d}\n\n",
+        f"**Period:** Last 7 days ({total_entries} total log entries)\n\n",
+        "### Results\n\n",
+        _md_table(("Result", "Count"), (
+            ("Success", result_counts["success"]),
+            ("Failure", result_counts["failure"]),
+            ("Pending", result_counts["pending"]),
+        )),
+        "### Actor Breakdown\n\n",
+        _md_table(("Actor", "Actions"), (
+            ("Claude Code (AI)", actor_counts["claude_code"]),
+            ("Human", actor_counts["human"]),
+            ("Watcher", actor_counts["watcher"]),
+        )),
+        "### Approval Breakdown\n\n",
+        _md_table(("Mode", "Count"), (
+            ("Auto", approval_counts["auto"]),
+            ("Human Approved", approval_counts["human_approved"]),
+            ("Human Rejected", approval_counts["human_rejected"]),
+        )),
+        "### Top 10 Action Types\n\n",
+        _md_table(("Action", "Count"), top_actions or [("(none)", 0)]),
+        "### Recent Failures\n\n",
+        failure_lines,
+        f"\n\n_Generated by Zoya Audit Logger at {now.isoformat()}_\n",
+    ]
+    summary = "".join(parts)
 
     if append_to_dashboard and DASHBOARD.exists():
-        existing = DASHBOARD.read_text(encoding="utf-8")
-        # Remove any previous weekly summary block
-        existing = re.sub(
-            r"\n---\n\n## 📊 Weekly Audit Summary.*",
-            "",
-            existing,
-            flags=re.DOTALL,
-        )
-        DASHBOARD.write_text(existing + summary, encoding="utf-8")
+        _splice_dashboard_summary(summary)
         logger.info("Weekly audit summary appended to Dashboard.md")
-        audit_log("audit_summary_generated", "Dashboard.md", parameters={"entries": len(entries)})
+        audit_log("audit_summary_generated", "Dashboard.md", parameters={"entries": total_entries})
 
     return summary
 
 
+def _md_table(header: tuple[str, str], rows: Iterable[tuple[str, int]]) -> str:
+    """Two-column markdown table followed by a blank line."""
+    left, right = header
+    lines = [f"| {left} | {right} |", f"|{'-' * (len(left) + 2)}|{'-' * (len(right) + 2)}|"]
+    lines += [f"| {name} | {count} |" for name, count in rows]
+    lines.append("\n")
+    return "\n".join(lines)
+
+
+def _splice_dashboard_summary(summary: str) -> None:
+    """Replace (or append) the marked summary block in Dashboard.md atomically."""
+    existing = DASHBOARD.read_text(encoding="utf-8")
+    tail = ""
+    start = existing.find(_SUMMARY_START)
+    if start != -1:
+        head = existing[:start]
+        end = existing.find(_SUMMARY_END, start)
+        if end != -1:
+            tail = existing[end + len(_SUMMARY_END):].removeprefix("\n")
+    else:
+        legacy = existing.find(_LEGACY_SUMMARY_HEAD)
+        head = existing if legacy == -1 else existing[:legacy]
+    if head and not head.endswith("\n"):
+        head += "\n"
+    tmp = DASHBOARD.with_name(f".{DASHBOARD.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        f"{head}{_SUMMARY_START}{summary}{_SUMMARY_END}\n{tail}", encoding="utf-8"
+    )
+    os.replace(tmp, DASHBOARD)
+
+
 # ---------------------------------------------------------------------------
 # Summary stats (used by CEO briefing)
 # ---------------------------------------------------------------------------
 
-def get_period_stats(days: int = 7) -> dict[str, Any]:
-    """Return aggregated stats for the last N days for the CEO briefing.
+_SOCIAL_PREFIXES = ("twitter_", "linkedin_", "facebook_", "instagram_")
+
+# action_type -> (is_social, is_payment). There are only a few dozen distinct
+# action types, so each one's substring/prefix tests run once per process.
+_ACTION_KIND: dict[str, tuple[bool, bool]] = {}
+
+
+def _action_kind(action_type: str) -> tuple[bool, bool]:
+    kind = _ACTION_KIND.get(action_type)
+    if kind is None:
+        kind = _ACTION_KIND[action_type] = (
+            "social_post" in action_type or action_type.startswith(_SOCIAL_PREFIXES),
+            "payment" in action_type,
+        )
+    return kind
+
+
+def summarize_entries(entries: list[dict[str, Any]]) -> dict[str, Any]:
+    """Aggregate already-read log entries into CEO briefing stats in one pass.
 
     Args:
-        days: Number of days to look back.
+        entries: Log entries as returned by read_logs().
 
     Returns:
         Dict with counts and failure details.
     """
-    entries = read_logs(days=days)
-
-    social_posts = [e for e in entries if "social_post" in e.get("action_type", "")
-                    or e.get("action_type", "").startswith(("twitter_", "linkedin_",
-                                                              "facebook_", "instagram_"))]
-    emails_sent = [e for e in entries if e.get("action_type") == "email_send"
-                   and e.get("result") == "success"]
-    payments = [e for e in entries if "payment" in e.get("action_type", "")]
-    failures = [e for e in entries if e.get("result") == "failure"]
+    social_posts = emails_sent = payments = failures = 0
+    recent_failures: deque[dict] = deque(maxlen=10)
+    actions: Counter[str] = Counter()
+    results: Counter[str] = Counter()
+    actors: Counter[str] = Counter()
+    approvals: Counter[str] = Counter()
+    for e in entries:
+        get = e.get
+        action_type = get("action_type", "")
+        result = get("result")
+        actions[action_type or "unknown"] += 1
+        results[result or "success"] += 1
+        actors[get("actor", "claude_code")] += 1
+        approvals[get("approval_status", "auto")] += 1
+        is_social, is_payment = _action_kind(action_type)
+        social_posts += is_social
+        payments += is_payment
+        if action_type == "email_send" and result == "success":
+            emails_sent += 1
+        if result == "failure":
+            failures += 1
+            recent_failures.append(e)
 
     return {
         "total_entries": len(entries),
-        "social_posts": len(social_posts),
-        "emails_sent": len(emails_sent),
-        "payments": len(payments),
-        "failures": len(failures),
-        "failure_rate": round(len(failures) / max(len(entries), 1) * 100, 1),
-        "recent_failures": failures[-10:],
+        "social_posts": social_posts,
+        "emails_sent": emails_sent,
+        "payments": payments,
+        "failures": failures,
+        "failure_rate": round(failures / max(len(entries), 1) * 100, 1),
+        "recent_failures": list(recent_failures),
+        "actions": actions,
+        "results": results,
+        "actors": actors,
+        "approvals": approvals,
     }
+
+
+# Closed days never change, so their stats are cached in a per-day sidecar
+# (Logs/.stats/YYYY-MM-DD.json). A sidecar records the format version and the
+# (mtime_ns, size) of the log it was built from, and is rebuilt whenever
+# either no longer matches.
+_STATS_DIR = ".stats"
+_STATS_VERSION = 2        # 2: per-action/result/actor/approval counters
+_COUNTER_KEYS = ("actions", "results", "actors", "approvals")
+_GZ_SUFFIX = ".json.gz"   # closed days are rotated to YYYY-MM-DD.json.gz
+
+
+def _stats_path(day: str) -> Path:
+    return LOGS / _STATS_DIR / f"{day}.json"
+
+
+def _day_source(day: str) -> list[int] | None:
+    """(mtime_ns, size) of a day's JSONL log and of its .bin log, if any."""
+    source: list[int] = []
+    for suffix in (".json", _GZ_SUFFIX):
+        try:
+            st = os.stat(LOGS / f"{day}{suffix}")
+        except FileNotFoundError:
+            continue
+        source += [st.st_mtime_ns, st.st_size]
+        break
+    try:
+        st = os.stat(LOGS / f"{day}{_BIN_SUFFIX}")
+    except FileNotFoundError:
+        pass
+    else:
+        source += [st.st_mtime_ns, st.st_size]
+    return source or None
+
+
+def _build_daily_stats(day: str, source: list[int]) -> dict[str, Any]:
+    """Summarise one day's log file and write its stats sidecar."""
+    date = datetime.strptime(day, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    stats = summarize_entries(read_logs(date=date, days=1))
+    stats["source"] = [_STATS_VERSION, *source]
+    sidecar = _stats_path(day)
+    sidecar.parent.mkdir(exist_ok=True)
+    tmp = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(stats), encoding="utf-8")
+    os.replace(tmp, sidecar)
+    return stats
+
+
+def _daily_stats(day: str) -> dict[str, Any] | None:
+    """Stats for a closed day from its sidecar, (re)building it when stale."""
+    source = _day_source(day)
+    if source is None:
+        return None
+    try:
+        cached = json.loads(_stats_path(day).read_text(encoding="utf-8"))
+        if cached.get("source") == [_STATS_VERSION, *source]:
+            return cached
+    except (OSError, ValueError):
+        pass
+    return _build_daily_stats(day, source)
+
+
+def _merge_stats(parts: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine per-day stats (oldest first) into one period summary."""
+    total = sum(p["total_entries"] for p in parts)
+    failures = sum(p["failures"] for p in parts)
+    recent_failures: deque[dict] = deque(maxlen=10)
+    counters: dict[str, Counter[str]] = {key: Counter() for key in _COUNTER_KEYS}
+    for p in parts:
+        recent_failures.extend(p["recent_failures"])
+        for key, counter in counters.items():
+            counter.update(p[key])
+    return {
+        "total_entries": total,
+        "social_posts": sum(p["social_posts"] for p in parts),
+        "emails_sent": sum(p["emails_sent"] for p in parts),
+        "payments": sum(p["payments"] for p in parts),
+        "failures": failures,
+        "failure_rate": round(failures / max(total, 1) * 100, 1),
+        "recent_failures": list(recent_failures),
+        **counters,
+    }
+
+
+def get_period_stats(
+    days: int = 7,
+    entries: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Return aggregated stats for the last N days for the CEO briefing.
+
+    Closed days come from their stats sidecars; only today's log is scanned.
+
+    Args:
+        days:    Number of days to look back.
+        entries: The period's entries, already read by the caller; when given
+                 they are summarised directly and no log is touched.
+
+    Returns:
+        Dict with counts and failure details.
+    """
+    if entries is not None:
+        return summarize_entries(entries)
+    if days < 1:
+        return summarize_entries([])
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    parts: list[dict[str, Any]] = []
+    for i in range(days - 1, 0, -1):
+        day = today - timedelta(days=i)
+        stats = _daily_stats(day.strftime("%Y-%m-%d"))
+        if stats is not None:
+            parts.append(stats)
+    parts.append(summarize_entries(read_logs(date=today, days=1)))
+    return _merge_stats(parts)
+
+
+@contextmanager
+def audit_snapshot(days: int = 7) -> Iterator[list[dict[str, Any]]]:
+    """Read the last *days* of logs once for several summaries.
+
+    Usage:
+        with audit_snapshot(days=7) as entries:
+            stats = get_period_stats(entries=entries)
+            summary = weekly_audit_summary(entries=entries)
+    """
+    yield read_logs(days=days)
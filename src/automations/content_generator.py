@@ -6,9 +6,14 @@ based on business context, recent activity, or specified topics.
 
 from __future__ import annotations
 
+import functools
+import heapq
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 from src.config import (
     AI_PROVIDER,
@@ -25,6 +30,9 @@ from src.utils import setup_logger
 
 logger = setup_logger("content_generator")
 
+_ORIGINAL_NAME_RE = re.compile(r"original_name:\s*(.+)")
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+
 # Post templates for different content types
 TEMPLATES = {
     "product_announcement": (
@@ -55,33 +63,63 @@ TEMPLATES = {
 }
 
 
+_DEFAULT_CONTEXT = "Zoya — Personal AI Employee for business automation."
+
+
 def _load_business_context() -> str:
-    """Load business context from Company_Handbook.md if available."""
-    if HANDBOOK.exists():
-        try:
-            return HANDBOOK.read_text(encoding="utf-8")[:2000]
-        except Exception:
-            pass
-    return "Zoya — Personal AI Employee for business automation."
+    """Load business context from Company_Handbook.md if available.
+
+    Cached on the handbook's mtime, so bulk generation reads it once.
+    """
+    try:
+        mtime_ns = HANDBOOK.stat().st_mtime_ns
+    except OSError:
+        return _DEFAULT_CONTEXT
+    return _business_context_cached(str(HANDBOOK), mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _business_context_cached(path: str, mtime_ns: int) -> str:
+    try:
+        return Path(path).read_text(encoding="utf-8")[:2000]
+    except Exception:
+        return _DEFAULT_CONTEXT
 
 
 def _get_recent_activity() -> str:
-    """Summarize recent Done items for content inspiration."""
-    if not DONE.exists():
+    """Summarize recent Done items for content inspiration.
+
+    Cached on the Done/ folder's mtime, which changes whenever a file is
+    moved in or out, so repeated calls skip the scan and file reads.
+    """
+    try:
+        mtime_ns = DONE.stat().st_mtime_ns
+    except OSError:
         return ""
-    done_files = sorted(DONE.glob("FILE_*.md"), key=lambda p: p.stat().st_mtime, reverse=True)[:5]
-    if not done_files:
+    return _recent_activity_cached(str(DONE), mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _recent_activity_cached(done: str, mtime_ns: int) -> str:
+    try:
+        with os.scandir(done) as it:
+            candidates = [
+                (e.stat().st_mtime, e.path) for e in it
+                if e.name.startswith("FILE_") and e.name.endswith(".md")
+            ]
+    except OSError:
         return ""
     summaries = []
-    for f in done_files:
+    for _, path in heapq.nlargest(5, candidates):
         try:
-            text = f.read_text(encoding="utf-8")
-            # Extract original_name from frontmatter
-            match = re.search(r"original_name:\s*(.+)", text)
-            if match:
-                summaries.append(match.group(1).strip())
-        except Exception:
-            pass
+            # original_name sits in the frontmatter, well within the first 512 bytes
+            with open(path, "rb") as f:
+                head = f.read(512).decode("utf-8", "ignore")
+        except OSError:
+            continue
+        match = _ORIGINAL_NAME_RE.search(head)
+        if match:
+            summaries.append(match.group(1).strip())
     return "Recent activity: " + ", ".join(summaries) if summaries else ""
 
 
@@ -128,16 +166,56 @@ def generate_post(
         return _generate_fallback(topic, post_type)
 
 
+def generate_posts(
+    topics: list[str],
+    post_type: str = "general",
+    context: str = "",
+) -> list[str]:
+    """Generate several posts concurrently over the shared provider client.
+
+    Args:
+        topics: One topic per post.
+        post_type: Template applied to every post.
+        context: Additional context shared by every post.
+
+    Returns:
+        Generated post texts, in the same order as *topics*.
+    """
+    if not topics:
+        return []
+    with ThreadPoolExecutor(max_workers=min(4, len(topics))) as pool:
+        return list(pool.map(lambda t: generate_post(t, post_type, context), topics))
+
+
+# One OpenAI-compatible client per provider: the client owns an HTTP
+# connection pool, so reusing it keeps the TCP/TLS connection alive across
+# posts instead of re-handshaking for every generation.
+_CLIENTS: dict[str, Any] = {}
+
+
+def _get_client() -> Any:
+    """Return the cached client for the configured AI_PROVIDER."""
+    client = _CLIENTS.get(AI_PROVIDER)
+    if client is None:
+        from openai import OpenAI
+
+        if AI_PROVIDER == "ollama":
+            client = OpenAI(api_key="ollama", base_url=OLLAMA_BASE_URL)
+        else:
+            client = OpenAI(api_key=DASHSCOPE_API_KEY, base_url=QWEN_BASE_URL)
+        client = _CLIENTS.setdefault(AI_PROVIDER, client)
+    return client
+
+
+def _reset_client() -> None:
+    """Drop cached clients (tests, or after changing provider settings)."""
+    _CLIENTS.clear()
+
+
 def _generate_with_openai_compat(prompt: str) -> str:
     """Generate using OpenAI-compatible API (Ollama or Qwen)."""
-    from openai import OpenAI
-
-    if AI_PROVIDER == "ollama":
-        client = OpenAI(api_key="ollama", base_url=OLLAMA_BASE_URL)
-        model = OLLAMA_MODEL
-    else:
-        client = OpenAI(api_key=DASHSCOPE_API_KEY, base_url=QWEN_BASE_URL)
-        model = QWEN_MODEL
+    client = _get_client()
+    model = OLLAMA_MODEL if AI_PROVIDER == "ollama" else QWEN_MODEL
 
     response = client.chat.completions.create(
         model=model,
@@ -150,7 +228,7 @@ def _generate_with_openai_compat(prompt: str) -> str:
     )
     text = response.choices[0].message.content
     # Strip thinking tags from some models
-    text = re.sub(r"<think>.*?</think>", "", text, flags=re.DOTALL).strip()
+    text = _THINK_RE.sub("", text).strip()
     return text[:1300]  # LinkedIn optimal length
 
 
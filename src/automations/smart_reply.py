@@ -21,21 +21,27 @@ Integration:
 .env:
     SMART_REPLY_ENABLED=true          # Set false to disable entirely
     SMART_REPLY_DRY_RUN=true          # true = log draft only, don't write files
+    SMART_REPLY_AUDIT_SKIPS=true      # false = don't audit low-priority skips (debug log only)
+    SMART_REPLY_MODEL=...             # Anthropic model used for drafts
+    SMART_REPLY_USE_CLI=false         # true = draft via the `claude` CLI instead of the API
+                                      # (also used when ANTHROPIC_API_KEY is unset)
 """
 
 from __future__ import annotations
 
+import errno
+import functools
+import json
 import os
 import re
-import subprocess
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from email.utils import parseaddr
-
-from dotenv import load_dotenv
+from typing import Any
 
 from src.audit_logger import audit_log
 from src.config import (
+    ANTHROPIC_API_KEY,
     DONE,
     HANDBOOK,
     PENDING_APPROVAL,
@@ -44,13 +50,14 @@ from src.config import (
 )
 from src.utils import log_action, setup_logger
 
-load_dotenv(PROJECT_ROOT / ".env")
-
 logger = setup_logger("smart_reply")
 
 CONTACTS_DIR = VAULT_PATH / "Contacts"
 SMART_REPLY_ENABLED = os.getenv("SMART_REPLY_ENABLED", "true").lower() == "true"
 SMART_REPLY_DRY_RUN = os.getenv("SMART_REPLY_DRY_RUN", "true").lower() == "true"
+SMART_REPLY_AUDIT_SKIPS = os.getenv("SMART_REPLY_AUDIT_SKIPS", "true").lower() == "true"
+SMART_REPLY_MODEL = os.getenv("SMART_REPLY_MODEL", "claude-3-5-haiku-20241022")
+SMART_REPLY_USE_CLI = os.getenv("SMART_REPLY_USE_CLI", "false").lower() == "true"
 
 # ---------------------------------------------------------------------------
 # Priority keyword sets
@@ -72,17 +79,95 @@ HIGH_PRIORITY_BODY_KEYWORDS: frozenset[str] = frozenset({
 })
 
 
+def _keyword_re(keywords: frozenset[str]) -> re.Pattern[str]:
+    """One alternation per keyword set: a single C-level scan of the text that
+    stops at the first hit, instead of one substring search per keyword.
+
+    The alternation is shaped as a character trie ("a(?:sap|waiting ...)"), so
+    at each text position the engine branches once per shared prefix rather
+    than trying every keyword in turn.
+    """
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    return re.compile(_trie_pattern(trie))
+
+
+def _trie_pattern(node: dict) -> str:
+    branches = [re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch]
+    if not branches:
+        return ""
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    # A keyword ends here and a longer one continues: the rest is optional
+    return f"(?:{body})?" if "" in node else body
+
+
+_SUBJECT_KEYWORD_RE = _keyword_re(HIGH_PRIORITY_SUBJECT_KEYWORDS)
+_BODY_KEYWORD_RE = _keyword_re(HIGH_PRIORITY_BODY_KEYWORDS)
+# The keywords are ASCII, so the same tries also run over bytes
+_SUBJECT_KEYWORD_BYTES_RE = re.compile(_SUBJECT_KEYWORD_RE.pattern.encode("ascii"))
+_BODY_KEYWORD_BYTES_RE = re.compile(_BODY_KEYWORD_RE.pattern.encode("ascii"))
+
+
+def _has_keyword(text: str, str_re: re.Pattern[str], bytes_re: re.Pattern[bytes]) -> bool:
+    """Case-insensitive keyword check.
+
+    ASCII text (most email) is lowercased as bytes, which is much cheaper
+    than str.casefold and gives the same result; anything else is casefolded.
+    """
+    if text.isascii():
+        return bytes_re.search(text.encode("ascii").lower()) is not None
+    return str_re.search(text.casefold()) is not None
+
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+_EMAIL_CONTENT_RE = re.compile(r"## Email Content\s*\n(.*?)(?=\n##|\Z)", re.DOTALL)
+_TONE_RE = re.compile(
+    r"##\s*(?:tone|communication style|voice|writing style)[^\n]*\n(.*?)(?=\n##|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_EMAIL_ADDR_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+_BARE_ADDR_RE = re.compile(r"[\w.+-]+@[\w.-]+")
+_SAFE_SUBJ_RE = re.compile(r"[^\w]")
+_DRAFT_SECTION_RE = re.compile(r"^[ \t]*## Drafted Reply[ \t]*\n(.*?)(?=\n## |\Z)", re.MULTILINE | re.DOTALL)
+
+# Frontmatter sits at the top of the file; only read past this if it is longer.
+_FRONTMATTER_HEAD_BYTES = 8192
+# Enough bytes to hold the 3000-character body slice in any UTF-8 text.
+_BODY_WINDOW_BYTES = 4 * 3500
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def _read_frontmatter(path: Path) -> dict[str, str]:
-    """Parse YAML-ish frontmatter from a metadata .md file."""
+    """Parse YAML-ish frontmatter from a metadata .md file.
+
+    Only the first _FRONTMATTER_HEAD_BYTES are read unless the block runs
+    past them; the email body below it is never decoded.
+    """
     try:
-        text = path.read_text(encoding="utf-8")
+        with path.open("rb") as fh:
+            head = fh.read(_FRONTMATTER_HEAD_BYTES)
+            if not head.startswith(b"---"):
+                return {}
+            end = head.find(b"\n---", 3)
+            if end == -1:
+                head += fh.read()
+                end = head.find(b"\n---", 3)
     except OSError:
         return {}
-    match = re.search(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+    if end == -1:
+        return {}
+    return _parse_frontmatter(head[: end + 4].decode("utf-8", "replace"))
+
+
+def _parse_frontmatter(text: str) -> dict[str, str]:
+    """Parse the YAML-ish frontmatter block at the top of *text*."""
+    match = _FRONTMATTER_RE.search(text)
     if not match:
         return {}
     fm: dict[str, str] = {}
@@ -95,6 +180,13 @@ def _read_frontmatter(path: Path) -> dict[str, str]:
 
 def _extract_email_address(raw: str) -> str:
     """Extract plain email from 'Name <email@example.com>'."""
+    s = raw.strip()
+    # A plain addr-spec (the common case) needs no RFC 2822 parse; anything
+    # else, e.g. a trailing ';' or a 'mailto:' prefix, goes to parseaddr
+    if _BARE_ADDR_RE.fullmatch(s):
+        return s.lower()
+    from email.utils import parseaddr
+
     _, addr = parseaddr(raw)
     return addr.lower().strip()
 
@@ -102,49 +194,101 @@ def _extract_email_address(raw: str) -> str:
 def _extract_body_from_md(path: Path) -> str:
     """Read the email body from a processed email metadata file."""
     try:
-        text = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
     except OSError:
         return ""
-    # Find '## Email Content' section
-    m = re.search(r"## Email Content\s*\n(.*?)(?=\n##|\Z)", text, re.DOTALL)
-    if m:
-        return m.group(1).strip()[:3000]
-    return text[500:3500]  # fallback: skip frontmatter, take body chunk
+    # Find '## Email Content' section and decode only the window we return
+    start = data.find(b"## Email Content")
+    if start != -1:
+        m = _EMAIL_CONTENT_RE.search(
+            data[start : start + _BODY_WINDOW_BYTES].decode("utf-8", "replace")
+        )
+        if m:
+            return m.group(1).strip()[:3000]
+    # fallback: skip frontmatter, take body chunk
+    return data[:_BODY_WINDOW_BYTES].decode("utf-8", "replace")[500:3500]
 
 
 # ---------------------------------------------------------------------------
 # Known-client detection
 # ---------------------------------------------------------------------------
 
-def _load_known_emails() -> set[str]:
-    """Build a set of known email addresses from Contacts/ and Company_Handbook.md."""
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _load_known_emails() -> frozenset[str]:
+    """Build a set of known email addresses from Contacts/ and Company_Handbook.md.
+
+    Cached on the Contacts/ folder and handbook mtimes, so steady-state calls
+    cost two stat()s. The folder mtime moves when contacts are added or
+    removed, not when one is edited in place.
+    """
+    return _known_emails_cached(
+        str(CONTACTS_DIR), _mtime_ns(CONTACTS_DIR), str(HANDBOOK), _mtime_ns(HANDBOOK)
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _known_emails_cached(
+    contacts_dir: str, contacts_mtime_ns: int, handbook: str, handbook_mtime_ns: int
+) -> frozenset[str]:
     known: set[str] = set()
+    handbook_path = Path(handbook)
 
     # From Contacts/ — each CONTACT_*.md has `identity:` in frontmatter
-    if CONTACTS_DIR.exists():
-        for contact_file in CONTACTS_DIR.glob("CONTACT_*.md"):
-            fm = _read_frontmatter(contact_file)
-            identity = fm.get("identity", "")
-            if "@" in identity:
-                known.add(identity.lower())
+    try:
+        with os.scandir(contacts_dir) as it:
+            for entry in it:
+                if entry.name.startswith("CONTACT_") and entry.name.endswith(".md") and entry.is_file():
+                    identity = _contact_identity(entry.path)
+                    if "@" in identity:
+                        known.add(identity.lower())
+    except OSError:
+        pass
 
     # From Company_Handbook.md — scan for email-shaped strings
-    if HANDBOOK.exists():
+    if handbook_path.exists():
         try:
-            text = HANDBOOK.read_text(encoding="utf-8")
-            emails = re.findall(r"[\w.+-]+@[\w-]+\.[\w.]+", text)
-            known.update(e.lower() for e in emails)
+            text = handbook_path.read_text(encoding="utf-8")
+            known.update(e.lower() for e in _EMAIL_ADDR_RE.findall(text))
         except OSError:
             pass
 
-    return known
+    return frozenset(known)
+
+
+# Contact frontmatter is a handful of lines; larger blocks fall back to a full parse.
+_CONTACT_HEAD_BYTES = 4096
+
+
+def _contact_identity(path: str) -> str:
+    """The `identity:` frontmatter value of a CONTACT_*.md file."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            head = os.read(fd, _CONTACT_HEAD_BYTES)
+        finally:
+            os.close(fd)
+    except OSError:
+        return ""
+    if head.startswith(b"---") and head.find(b"\n---", 3) != -1:
+        fm = _parse_frontmatter(head.decode("utf-8", "replace"))
+    elif len(head) == _CONTACT_HEAD_BYTES:
+        fm = _read_frontmatter(Path(path))
+    else:
+        return ""
+    return fm.get("identity", "")
 
 
 def classify_email(
     from_addr: str,
     subject: str,
     body: str,
-    known_emails: set[str],
+    known_emails: set[str] | frozenset[str],
 ) -> tuple[bool, str, str]:
     """Decide whether to draft a reply and why.
 
@@ -152,12 +296,10 @@ def classify_email(
         (should_draft: bool, priority: str, reason: str)
     """
     from_clean = _extract_email_address(from_addr)
-    subj_lower = subject.lower()
-    body_lower = body.lower()[:2000]
-
     is_vip = from_clean in known_emails
-    subject_hit = any(kw in subj_lower for kw in HIGH_PRIORITY_SUBJECT_KEYWORDS)
-    body_hit    = any(kw in body_lower  for kw in HIGH_PRIORITY_BODY_KEYWORDS)
+    subject_hit = _has_keyword(subject, _SUBJECT_KEYWORD_RE, _SUBJECT_KEYWORD_BYTES_RE)
+    # Slice before folding so only the scanned prefix is copied
+    body_hit    = _has_keyword(body[:2000], _BODY_KEYWORD_RE, _BODY_KEYWORD_BYTES_RE)
 
     if is_vip and (subject_hit or body_hit):
         return True, "high", f"VIP client ({from_clean}) + priority keyword"
@@ -182,10 +324,7 @@ def _load_handbook_tone() -> str:
     try:
         text = HANDBOOK.read_text(encoding="utf-8")
         # Look for a 'Tone' or 'Communication Style' or 'Voice' section
-        m = re.search(
-            r"##\s*(?:tone|communication style|voice|writing style)[^\n]*\n(.*?)(?=\n##|\Z)",
-            text, re.IGNORECASE | re.DOTALL,
-        )
+        m = _TONE_RE.search(text)
         if m:
             return m.group(1).strip()[:500]
     except OSError:
@@ -193,6 +332,75 @@ def _load_handbook_tone() -> str:
     return "Professional, polite, concise, and helpful."
 
 
+_CLIENTS: dict[str, Any] = {}
+
+
+def _get_client() -> Any:
+    """Return the cached Anthropic client (one connection pool per process)."""
+    client = _CLIENTS.get("anthropic")
+    if client is None:
+        from anthropic import Anthropic
+
+        client = _CLIENTS.setdefault("anthropic", Anthropic(api_key=ANTHROPIC_API_KEY))
+    return client
+
+
+def _reset_client() -> None:
+    """Drop the cached client (tests, or after changing API settings)."""
+    _CLIENTS.clear()
+
+
+def _ask_claude_cli(prompt: str) -> str:
+    import subprocess
+
+    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+    result = subprocess.run(
+        ["claude", "--print", "--dangerously-skip-permissions", prompt],
+        capture_output=True,
+        text=True,
+        timeout=90,
+        cwd=str(PROJECT_ROOT),
+        env=env,
+    )
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def _ask_claude(prompt: str, max_tokens: int = 1024) -> str:
+    """Send one prompt to Claude and return the text ("" on an empty reply).
+
+    Uses the Anthropic API over a reused client; the `claude` CLI is only
+    spawned when SMART_REPLY_USE_CLI is set or no API key is configured.
+    """
+    if SMART_REPLY_USE_CLI or not ANTHROPIC_API_KEY:
+        return _ask_claude_cli(prompt)
+    message = _get_client().messages.create(
+        model=SMART_REPLY_MODEL,
+        max_tokens=max_tokens,
+        messages=[{"role": "user", "content": prompt}],
+    )
+    return message.content[0].text.strip() if message.content else ""
+
+
+_PROMPT_TEMPLATE = (
+    "You are Zoya, a professional AI assistant drafting an email reply on behalf of the business owner.\n\n"
+    "**Tone/style:** {tone}\n\n"
+    "**Original email:**\n"
+    "From: {from_addr}\n"
+    "Subject: {subject}\n"
+    "Priority: {priority}\n\n"
+    "Body:\n{body}\n\n"
+    "---\n\n"
+    "Draft a professional, polite email reply. Rules:\n"
+    "1. Do NOT invent facts or make commitments the owner hasn't approved\n"
+    "2. Acknowledge the email and its urgency if high priority\n"
+    "3. Use the tone/style specified above\n"
+    "4. Keep it concise (2-4 short paragraphs)\n"
+    "5. End with a professional sign-off\n"
+    "6. Output ONLY the email body text — no subject line, no metadata\n\n"
+    "Reply:"
+)
+
+
 def generate_reply_with_claude(
     from_addr: str,
     subject: str,
@@ -205,52 +413,39 @@ def generate_reply_with_claude(
 
     Returns the drafted reply text.
     """
-    prompt = (
-        f"You are Zoya, a professional AI assistant drafting an email reply on behalf of the business owner.\n\n"
-        f"**Tone/style:** {tone}\n\n"
-        f"**Original email:**\n"
-        f"From: {from_addr}\n"
-        f"Subject: {subject}\n"
-        f"Priority: {priority}\n\n"
-        f"Body:\n{body[:2000]}\n\n"
-        f"---\n\n"
-        f"Draft a professional, polite email reply. Rules:\n"
-        f"1. Do NOT invent facts or make commitments the owner hasn't approved\n"
-        f"2. Acknowledge the email and its urgency if high priority\n"
-        f"3. Use the tone/style specified above\n"
-        f"4. Keep it concise (2-4 short paragraphs)\n"
-        f"5. End with a professional sign-off\n"
-        f"6. Output ONLY the email body text — no subject line, no metadata\n\n"
-        f"Reply:"
-    )
+    prompt = _PROMPT_TEMPLATE.format_map({
+        "tone": tone,
+        "from_addr": from_addr,
+        "subject": subject,
+        "priority": priority,
+        "body": body[:2000],
+    })
 
     if dry_run:
-        return (
-            f"[DRY RUN DRAFT]\n\n"
-            f"Thank you for your email regarding \"{subject}\".\n\n"
-            f"I have received your message and will get back to you shortly with a full response.\n\n"
-            f"Best regards,\n[Owner Name]"
-        )
-
-    env = {k: v for k, v in os.environ.items() if k != "CLAUDECODE"}
+        return _dry_run_draft(subject)
 
     try:
-        result = subprocess.run(
-            ["claude", "--print", "--dangerously-skip-permissions", prompt],
-            capture_output=True,
-            text=True,
-            timeout=90,
-            cwd=str(PROJECT_ROOT),
-            env=env,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-        else:
-            logger.warning("Claude returned empty/error response — using fallback draft")
+        reply = _ask_claude(prompt)
+        if reply:
+            return reply
+        logger.warning("Claude returned empty/error response — using fallback draft")
     except Exception as exc:
         logger.warning("Claude call failed for smart reply: %s — using fallback", exc)
 
-    # Fallback draft (Claude unavailable)
+    return _fallback_draft(subject, priority)
+
+
+def _dry_run_draft(subject: str) -> str:
+    return (
+        f"[DRY RUN DRAFT]\n\n"
+        f"Thank you for your email regarding \"{subject}\".\n\n"
+        f"I have received your message and will get back to you shortly with a full response.\n\n"
+        f"Best regards,\n[Owner Name]"
+    )
+
+
+def _fallback_draft(subject: str, priority: str) -> str:
+    """Template draft used when Claude is unavailable."""
     return (
         f"Thank you for your email regarding \"{subject}\".\n\n"
         f"I have received your message and will review it promptly. "
@@ -259,10 +454,94 @@ def generate_reply_with_claude(
     )
 
 
+# Emails per batched prompt; keeps N drafts inside one response's token budget.
+_BATCH_SIZE = 8
+
+
+def generate_replies_with_claude(
+    emails: list[dict],
+    tone: str,
+    dry_run: bool = False,
+) -> dict[str, str]:
+    """Draft replies for several emails with one Claude call per _BATCH_SIZE.
+
+    Args:
+        emails: dicts with ``id``, ``from``, ``subject``, ``body`` and ``priority``.
+
+    Returns:
+        {id: draft}. Emails missing from Claude's answer (or every email, if
+        the batch call fails) are drafted one at a time via
+        generate_reply_with_claude.
+    """
+    if dry_run:
+        return {e["id"]: _dry_run_draft(e["subject"]) for e in emails}
+
+    drafts: dict[str, str] = {}
+    for start in range(0, len(emails), _BATCH_SIZE):
+        batch = emails[start:start + _BATCH_SIZE]
+        payload = [
+            {"id": e["id"], "from": e["from"], "subject": e["subject"],
+             "priority": e["priority"], "body": e["body"][:2000]}
+            for e in batch
+        ]
+        prompt = (
+            f"You are Zoya, a professional AI assistant drafting email replies on behalf of the business owner.\n\n"
+            f"**Tone/style:** {tone}\n\n"
+            f"**Original emails (JSON):**\n{json.dumps(payload, ensure_ascii=False, indent=1)}\n\n"
+            f"---\n\n"
+            f"Draft a professional, polite reply to EACH email. Rules:\n"
+            f"1. Do NOT invent facts or make commitments the owner hasn't approved\n"
+            f"2. Acknowledge the email and its urgency if high priority\n"
+            f"3. Use the tone/style specified above\n"
+            f"4. Keep each reply concise (2-4 short paragraphs)\n"
+            f"5. End each reply with a professional sign-off\n"
+            f"6. Output ONLY a JSON array of objects {{\"id\": ..., \"reply\": ...}}, "
+            f"one per email, where reply is the email body text only\n\n"
+            f"JSON:"
+        )
+        try:
+            drafts.update(_parse_batch_replies(_ask_claude(prompt, max_tokens=1024 * len(batch))))
+        except Exception as exc:
+            logger.warning("Batched smart reply call failed: %s — drafting one by one", exc)
+
+    for e in emails:
+        if not drafts.get(e["id"]):
+            drafts[e["id"]] = generate_reply_with_claude(
+                e["from"], e["subject"], e["body"], tone, e["priority"],
+            )
+    return drafts
+
+
+def _parse_batch_replies(text: str) -> dict[str, str]:
+    """Pull the [{"id", "reply"}] array out of Claude's answer ({} if absent)."""
+    start, end = text.find("["), text.rfind("]")
+    if start == -1 or end < start:
+        return {}
+    try:
+        items = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+    return {
+        str(item["id"]): str(item["reply"]).strip()
+        for item in items
+        if isinstance(item, dict) and "id" in item and item.get("reply")
+    }
+
+
 # ---------------------------------------------------------------------------
 # Approval file writer
 # ---------------------------------------------------------------------------
 
+_REPLY_FOOTER = (
+    "---\n\n"
+    "## Instructions\n\n"
+    "- ✅ **Approve:** Move this file to `/Approved/` — Zoya will send via Gmail MCP\n"
+    "- ✏️ **Edit:** Edit the draft above before moving to `/Approved/`\n"
+    "- ❌ **Reject:** Move to `/Rejected/` to discard without sending\n\n"
+    "_Draft generated by Zoya Smart Reply · NEVER auto-sent_\n"
+).encode("utf-8")
+
+
 def _write_reply_approval_file(
     gmail_id: str,
     to: str,
@@ -271,46 +550,48 @@ def _write_reply_approval_file(
     original_file: Path,
     priority: str,
     reason: str,
+    now: datetime | None = None,
+    index: int | None = None,
 ) -> Path:
-    """Create REPLY_*.md in Pending_Approval/ for human review."""
+    """Create REPLY_*.md in Pending_Approval/ for human review.
+
+    Batch callers pass one shared *now* plus a per-draft *index*, which goes
+    into the filename so drafts created in the same second stay distinct.
+    """
     PENDING_APPROVAL.mkdir(parents=True, exist_ok=True)
-    now = datetime.now(timezone.utc)
+    now = now or datetime.now(timezone.utc)
     ts  = now.strftime("%Y%m%d_%H%M%S")
-    safe_subj = re.sub(r"[^\w]", "_", subject)[:40].strip("_")
+    if index is not None:
+        ts = f"{ts}_{index:03d}"
+    safe_subj = _SAFE_SUBJ_RE.sub("_", subject)[:40].strip("_")
     approval_file = PENDING_APPROVAL / f"REPLY_{ts}_{safe_subj}.md"
 
-    approval_file.write_text(
-        f"---\n"
-        f"type: email_reply_draft\n"
-        f"original_email_id: {gmail_id}\n"
-        f"original_file: {original_file.name}\n"
-        f"to: {to}\n"
-        f"subject: Re: {subject}\n"
-        f"priority: {priority}\n"
-        f"draft_reason: {reason}\n"
-        f"suggested_by: claude\n"
-        f"created_at: {now.isoformat()}\n"
-        f"status: pending_approval\n"
-        f"approval_required: true\n"
-        f"action: send_email\n"
-        f"dry_run: {'true' if SMART_REPLY_DRY_RUN else 'false'}\n"
-        f"---\n\n"
-        f"# Email Reply Draft\n\n"
-        f"**To:** {to}  \n"
-        f"**Subject:** Re: {subject}  \n"
-        f"**Priority:** {priority.upper()}  \n"
-        f"**Reason drafted:** {reason}\n\n"
-        f"---\n\n"
-        f"## Drafted Reply\n\n"
-        f"{body_draft}\n\n"
-        f"---\n\n"
-        f"## Instructions\n\n"
-        f"- ✅ **Approve:** Move this file to `/Approved/` — Zoya will send via Gmail MCP\n"
-        f"- ✏️ **Edit:** Edit the draft above before moving to `/Approved/`\n"
-        f"- ❌ **Reject:** Move to `/Rejected/` to discard without sending\n\n"
-        f"_Draft generated by Zoya Smart Reply · NEVER auto-sent_\n",
-        encoding="utf-8",
-    )
+    parts = [
+        "---\n",
+        "type: email_reply_draft\n",
+        "original_email_id: ", gmail_id, "\n",
+        "original_file: ", original_file.name, "\n",
+        "to: ", to, "\n",
+        "subject: Re: ", subject, "\n",
+        "priority: ", priority, "\n",
+        "draft_reason: ", reason, "\n",
+        "suggested_by: claude\n",
+        "created_at: ", now.isoformat(), "\n",
+        "status: pending_approval\n",
+        "approval_required: true\n",
+        "action: send_email\n",
+        "dry_run: ", "true" if SMART_REPLY_DRY_RUN else "false", "\n",
+        "---\n\n",
+        "# Email Reply Draft\n\n",
+        "**To:** ", to, "  \n",
+        "**Subject:** Re: ", subject, "  \n",
+        "**Priority:** ", priority.upper(), "  \n",
+        "**Reason drafted:** ", reason, "\n\n",
+        "---\n\n",
+        "## Drafted Reply\n\n",
+        body_draft, "\n\n",
+    ]
+    approval_file.write_bytes("".join(parts).encode("utf-8") + _REPLY_FOOTER)
     return approval_file
 
 
@@ -332,6 +613,54 @@ def process_email_for_smart_reply(meta_path: Path) -> Path | None:
     if not SMART_REPLY_ENABLED:
         return None
 
+    email = _classify_for_reply(meta_path, _load_known_emails())
+    if email is None:
+        return None
+
+    # Generate reply via Claude
+    draft = generate_reply_with_claude(
+        from_addr=email["from"],
+        subject=email["subject"],
+        body=email["body"],
+        tone=_load_handbook_tone(),
+        priority=email["priority"],
+        dry_run=SMART_REPLY_DRY_RUN,
+    )
+    return _file_reply_draft(email, draft)
+
+
+def process_emails_for_smart_reply_batch(meta_paths: list[Path]) -> list[Path]:
+    """Batch form of process_email_for_smart_reply for an orchestrator backlog.
+
+    Every email is classified first; the ones that warrant a reply are drafted
+    together (one Claude round-trip per batch) and filed for approval.
+
+    Returns:
+        Paths of the REPLY_*.md approval files created, in input order.
+    """
+    if not SMART_REPLY_ENABLED:
+        return []
+
+    known_emails = _load_known_emails()
+    emails = []
+    for meta_path in meta_paths:
+        email = _classify_for_reply(meta_path, known_emails)
+        if email is not None:
+            email["id"] = str(len(emails))
+            emails.append(email)
+    if not emails:
+        return []
+
+    drafts = generate_replies_with_claude(emails, _load_handbook_tone(), SMART_REPLY_DRY_RUN)
+    now = datetime.now(timezone.utc)
+    return [
+        _file_reply_draft(email, drafts[email["id"]], now, index)
+        for index, email in enumerate(emails)
+    ]
+
+
+def _classify_for_reply(meta_path: Path, known_emails: frozenset[str]) -> dict | None:
+    """Read and classify one email; None if it is not a gmail email worth a draft."""
     fm = _read_frontmatter(meta_path)
 
     # Only process gmail emails
@@ -340,23 +669,20 @@ def process_email_for_smart_reply(meta_path: Path) -> Path | None:
 
     from_addr = fm.get("from", fm.get("sender", ""))
     subject   = fm.get("subject", "(no subject)")
-    gmail_id  = fm.get("gmail_id", "")
 
     if not from_addr:
         return None
 
-    # Load email body
     body = _extract_body_from_md(meta_path)
-
-    # Load known clients
-    known_emails = _load_known_emails()
-
-    # Classify
     should_draft, priority, reason = classify_email(
         from_addr, subject, body, known_emails
     )
 
     if not should_draft:
+        # Most mail lands here; without skip auditing it costs one debug line
+        if not SMART_REPLY_AUDIT_SKIPS:
+            logger.debug("Smart reply: skipping %s (%s)", from_addr[:40], reason)
+            return None
         logger.info(
             "Smart reply: LOW PRIORITY — skipping draft for email from %s (%s)",
             from_addr[:40], reason,
@@ -373,27 +699,34 @@ def process_email_for_smart_reply(meta_path: Path) -> Path | None:
         "Smart reply: drafting for email from %s — %s (priority=%s)",
         from_addr[:40], reason, priority,
     )
+    return {
+        "path": meta_path,
+        "gmail_id": fm.get("gmail_id", ""),
+        "from": from_addr,
+        "subject": subject,
+        "body": body,
+        "priority": priority,
+        "reason": reason,
+    }
 
-    # Generate reply via Claude
-    tone = _load_handbook_tone()
-    draft = generate_reply_with_claude(
-        from_addr=from_addr,
-        subject=subject,
-        body=body,
-        tone=tone,
-        priority=priority,
-        dry_run=SMART_REPLY_DRY_RUN,
-    )
 
-    # Write approval file
+def _file_reply_draft(
+    email: dict, draft: str, now: datetime | None = None, index: int | None = None,
+) -> Path:
+    """Write the approval file for a drafted reply and record it."""
+    from_addr, subject = email["from"], email["subject"]
+    priority, reason = email["priority"], email["reason"]
+
     approval_path = _write_reply_approval_file(
-        gmail_id=gmail_id,
+        gmail_id=email["gmail_id"],
         to=from_addr,
         subject=subject,
         body_draft=draft,
-        original_file=meta_path,
+        original_file=email["path"],
         priority=priority,
         reason=reason,
+        now=now,
+        index=index,
     )
 
     audit_log(
@@ -422,6 +755,31 @@ def process_email_for_smart_reply(meta_path: Path) -> Path | None:
 # Approval processor (called when human approves a REPLY_*.md)
 # ---------------------------------------------------------------------------
 
+def _archive(path: Path, folder: Path) -> Path:
+    """Move *path* into *folder*: one rename(2), copying only across devices."""
+    dest = folder / path.name
+    try:
+        path.rename(dest)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.move(str(path), dest)
+    return dest
+
+
+
+def _send_reply(to: str, subject: str, body: str) -> bool:
+    # Delegate to the email MCP send_email logic
+    # (We call the core function directly to avoid subprocess overhead)
+    try:
+        from src.mcp.email_server import send_email as _send
+        result_msg = _send(to=to, subject=subject, body=body)
+        return "approval" in result_msg.lower() or "created" in result_msg.lower()
+    except Exception as exc:
+        logger.error("Failed to send reply to %s: %s", to, exc)
+        return False
+
+
 def process_approved_replies(approved_dir: Path | None = None) -> int:
     """Send approved REPLY_*.md files via the Email MCP.
 
@@ -438,28 +796,22 @@ def process_approved_replies(approved_dir: Path | None = None) -> int:
     approved_dir.mkdir(parents=True, exist_ok=True)
     DONE.mkdir(parents=True, exist_ok=True)
 
-    import shutil
     count = 0
 
     for reply_file in sorted(approved_dir.glob("REPLY_*.md")):
-        fm = _read_frontmatter(reply_file)
-        text = reply_file.read_text(encoding="utf-8")
+        try:
+            text = reply_file.read_text(encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Could not read REPLY file %s: %s — skipping", reply_file.name, exc)
+            continue
+        fm = _parse_frontmatter(text)
 
         to      = fm.get("to", "")
         subject = fm.get("subject", "")
 
         # Extract body from ## Drafted Reply section
-        body = ""
-        in_draft = False
-        for line in text.splitlines():
-            if line.strip() == "## Drafted Reply":
-                in_draft = True
-                continue
-            if in_draft and line.startswith("## "):
-                break
-            if in_draft:
-                body += line + "\n"
-        body = body.strip()
+        m = _DRAFT_SECTION_RE.search(text)
+        body = m.group(1).strip() if m else ""
 
         if not to or not body:
             logger.warning("REPLY file %s missing to/body — skipping", reply_file.name)
@@ -469,21 +821,11 @@ def process_approved_replies(approved_dir: Path | None = None) -> int:
             logger.info("[DRY RUN] Would send email to %s: %s", to, subject)
             success = True
         else:
-            # Delegate to the email MCP send_email logic
-            # (We call the core function directly to avoid subprocess overhead)
-            try:
-                from src.mcp.email_server import send_email as _send
-                result_msg = _send(to=to, subject=subject, body=body)
-                success = "approval" in result_msg.lower() or "created" in result_msg.lower()
-            except Exception as exc:
-                logger.error("Failed to send reply to %s: %s", to, exc)
-                success = False
+            success = _send_reply(to, subject, body)
 
         # Archive to Done/
-        dest = DONE / reply_file.name
-        shutil.move(str(reply_file), dest)
+        dest = _archive(reply_file, DONE)
 
-        status = "sent" if success else "send_failed"
         audit_log(
             "smart_reply_sent" if success else "smart_reply_send_failed",
             dest.name,
@@ -9,8 +9,13 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import os
 import re
 import sys
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -34,19 +39,60 @@ from src.utils import log_action, setup_logger
 
 logger = setup_logger("briefing_generator")
 
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+_DEADLINE_RE = re.compile(r"- \[ \] .{0,80}(?:by|due|deadline|before)\s+\S+", re.IGNORECASE)
+_AMOUNT_RE = re.compile(
+    r"(?:amount|total|invoice\s+total|due)[:\s]+\$?([\d,]+(?:\.\d{2})?)", re.IGNORECASE,
+)
+_GOAL_RE = re.compile(r"Monthly goal:\s*\$?([\d,]+)")
+_MTD_RE = re.compile(r"Current MTD:\s*\$?([\d,]+)")
+
 # ---------------------------------------------------------------------------
 # Frontmatter reader (local copy — avoids importing orchestrator)
 # ---------------------------------------------------------------------------
 
-def _read_frontmatter(path: Path) -> dict[str, str]:
+def _read_text(path: str | os.PathLike) -> str | None:
+    """Whole file as text (undecodable bytes replaced), or None if unreadable."""
+    try:
+        with open(path, "rb") as fh:
+            return fh.read().decode("utf-8", "replace")
+    except OSError:
+        return None
+
+
+# Frontmatter is read in _FM_HEAD_BYTES steps until the closing marker, up to
+# _FM_READ_CAP; the note body after it is never loaded.
+_FM_HEAD_BYTES = 8192
+_FM_READ_CAP = 64 * 1024
+
+
+def _read_frontmatter(path: str | os.PathLike) -> dict[str, str]:
     """Parse YAML-ish frontmatter from a .md file."""
     try:
-        text = path.read_text(encoding="utf-8")
+        with open(path, "rb") as fh:
+            head = fh.read(_FM_HEAD_BYTES)
+            # No opening marker (sidecars, plain notes): nothing to parse
+            if not head.startswith(b"---"):
+                return {}
+            while len(head) < _FM_READ_CAP and head.find(b"\n---", 3) == -1:
+                chunk = fh.read(_FM_HEAD_BYTES)
+                if not chunk:
+                    break
+                head += chunk
     except OSError:
         return {}
-    match = re.search(r"^---\s*\n(.*?)\n---", text, re.DOTALL)
+    return _parse_frontmatter(head.decode("utf-8", "replace"))
+
+
+def _parse_frontmatter(text: str) -> dict[str, str]:
+    """Parse the YAML-ish frontmatter block at the top of *text*."""
+    if not text.startswith("---"):
+        return {}
+    match = _FRONTMATTER_RE.search(text)
     if not match:
         return {}
+    # A plain split/partition loop: the `in` test rejects non-key lines in C,
+    # and it measures faster than a MULTILINE key/value findall plus strip().
     fm: dict[str, str] = {}
     for line in match.group(1).splitlines():
         if ":" in line:
@@ -59,49 +105,170 @@ def _read_frontmatter(path: Path) -> dict[str, str]:
 # Data collection helpers
 # ---------------------------------------------------------------------------
 
-def _count(folder: Path) -> int:
+def _listing(folder: Path) -> list[os.DirEntry]:
+    """All entries of *folder* from one os.scandir ([] if it is missing).
+
+    generate_briefing lists each vault folder once and hands the listing to
+    both the counts and the collectors.
+    """
+    try:
+        with os.scandir(folder) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _iter_md(
+    folder: Path, prefix: str = "", entries: list[os.DirEntry] | None = None,
+) -> Iterator[os.DirEntry]:
+    """Yield the *prefix**.md files in *folder* (nothing if it is missing).
+
+    os.scandir hands back the directory's entries with their file types, so
+    filtering costs no per-file stat() calls.
+    """
+    for entry in _listing(folder) if entries is None else entries:
+        if entry.name.startswith(prefix) and entry.name.endswith(".md") and entry.is_file():
+            yield entry
+
+
+def _count(folder: Path, entries: list[os.DirEntry] | None = None) -> int:
     """Count non-gitkeep files in a folder."""
-    if not folder.exists():
-        return 0
-    return len([f for f in folder.iterdir() if f.is_file() and f.name != ".gitkeep"])
+    return sum(
+        1 for e in (_listing(folder) if entries is None else entries)
+        if e.name != ".gitkeep" and e.is_file()
+    )
+
+
+def _parse_processed_at(value: str) -> datetime | None:
+    """Parse an ISO processed_at stamp as an aware datetime (UTC if naive)."""
+    try:
+        # fromisoformat accepts a trailing "Z" natively (Python 3.11+)
+        processed_at = datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+    if processed_at.tzinfo is None:
+        processed_at = processed_at.replace(tzinfo=timezone.utc)
+    return processed_at
+
+
+# Below this many Done/ files the thread pool costs more than the reads.
+_SCAN_PARALLEL_MIN = 8
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _parse_done_file(entry: os.DirEntry, since: datetime) -> tuple[dict, dict | None] | None:
+    """(item, invoice-or-None) for one Done/ file processed since *since*.
+
+    Done/ is append-mostly, so the parse is cached on (path, mtime_ns, size)
+    and repeat briefings (or the orchestrator's periodic runs) cost one
+    stat() per unchanged file. Copies are returned so callers can't mutate
+    the cached record.
+    """
+    try:
+        st = entry.stat()
+    except OSError:
+        return None
+    record = _done_record(entry.path, st.st_mtime_ns, st.st_size)
+    if record is None:
+        return None
+    processed_at, item, invoice = record
+    if processed_at < since:
+        return None
+    return dict(item), (dict(invoice) if invoice is not None else None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _done_record(
+    path: str, mtime_ns: int, size: int
+) -> tuple[datetime, dict, dict | None] | None:
+    text = _read_text(path)
+    if text is None:
+        return None
+    fm = _parse_frontmatter(text)
+    processed_at_str = fm.get("processed_at", "")
+    if not processed_at_str:
+        return None
+    processed_at = _parse_processed_at(processed_at_str)
+    if processed_at is None:
+        return None
+
+    name = fm.get("original_name", os.path.basename(path))
+    doc_type = fm.get("type", "other")
+    item = {
+        "name": name,
+        "type": doc_type,
+        "source": fm.get("source", "file_drop"),
+        "priority": fm.get("priority", "low"),
+        "processed_at": processed_at_str[:19],
+        "approval_status": fm.get("approval_status", "auto"),
+    }
+    if doc_type not in ("invoice", "receipt"):
+        return processed_at, item, None
+
+    # Try to extract amount from body
+    amt_match = _AMOUNT_RE.search(text)
+    payment_state = fm.get("payment_state", fm.get("payment_status", ""))
+    invoice = {
+        "name": name,
+        "amount": float(amt_match.group(1).replace(",", "")) if amt_match else 0.0,
+        "paid": payment_state in ("paid", "in_payment", "approved"),
+        "date": processed_at_str[:10],
+    }
+    return processed_at, item, invoice
+
+
+def _scan_done(
+    since: datetime, entries: list[os.DirEntry] | None = None,
+) -> tuple[list[dict], dict]:
+    """One pass over Done/ for the briefing period.
+
+    Each FILE_*.md is read at most once, and not at all while its cached
+    parse is still current; its frontmatter feeds the completed-items list
+    and, for invoices and receipts, the same text is searched for the
+    amount. From _SCAN_PARALLEL_MIN files up, the reads run on a thread
+    pool so slow or network-backed vaults overlap their I/O latency.
+
+    Returns:
+        (done_items, revenue_data) — see _collect_done_in_period and
+        _extract_revenue_from_done.
+    """
+    files = list(_iter_md(DONE, "FILE_", entries))
+    if len(files) >= _SCAN_PARALLEL_MIN:
+        with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(files))) as pool:
+            parsed = list(pool.map(lambda f: _parse_done_file(f, since), files))
+    else:
+        parsed = [_parse_done_file(f, since) for f in files]
+
+    items: list[dict] = []
+    invoices: list[dict] = []
+    for result in parsed:
+        if result is None:
+            continue
+        item, invoice = result
+        items.append(item)
+        if invoice is not None:
+            invoices.append(invoice)
+
+    paid_count = sum(1 for i in invoices if i["paid"])
+    revenue = {
+        "total_revenue": sum(i["amount"] for i in invoices),
+        "invoices": sorted(invoices, key=lambda x: x["date"], reverse=True),
+        "paid_count": paid_count,
+        "unpaid_count": len(invoices) - paid_count,
+    }
+    return sorted(items, key=lambda x: x["processed_at"], reverse=True), revenue
 
 
 def _collect_done_in_period(since: datetime) -> list[dict]:
     """Collect Done/ items processed within the briefing period."""
-    if not DONE.exists():
-        return []
-    items = []
-    for f in DONE.glob("FILE_*.md"):
-        fm = _read_frontmatter(f)
-        processed_at_str = fm.get("processed_at", "")
-        if not processed_at_str:
-            continue
-        try:
-            # Parse ISO timestamp (strip timezone if needed)
-            processed_at = datetime.fromisoformat(processed_at_str.replace("Z", "+00:00"))
-            if processed_at.tzinfo is None:
-                processed_at = processed_at.replace(tzinfo=timezone.utc)
-            if processed_at >= since:
-                items.append({
-                    "name": fm.get("original_name", f.name),
-                    "type": fm.get("type", "other"),
-                    "source": fm.get("source", "file_drop"),
-                    "priority": fm.get("priority", "low"),
-                    "processed_at": processed_at_str[:19],
-                    "approval_status": fm.get("approval_status", "auto"),
-                })
-        except (ValueError, TypeError):
-            continue
-    return sorted(items, key=lambda x: x["processed_at"], reverse=True)
+    return _scan_done(since)[0]
 
 
-def _collect_pending() -> list[dict]:
+def _collect_pending(entries: list[os.DirEntry] | None = None) -> list[dict]:
     """Collect items currently waiting in Needs_Action."""
-    if not NEEDS_ACTION.exists():
-        return []
     items = []
-    for f in NEEDS_ACTION.glob("FILE_*.md"):
-        fm = _read_frontmatter(f)
+    for f in _iter_md(NEEDS_ACTION, "FILE_", entries):
+        fm = _read_frontmatter(f.path)
         if fm.get("status") == "pending":
             items.append({
                 "name": fm.get("original_name", f.name),
@@ -113,13 +280,11 @@ def _collect_pending() -> list[dict]:
     return items
 
 
-def _collect_pending_approval() -> list[dict]:
+def _collect_pending_approval(entries: list[os.DirEntry] | None = None) -> list[dict]:
     """Collect items in Pending_Approval/ awaiting human review."""
-    if not PENDING_APPROVAL.exists():
-        return []
     items = []
-    for f in PENDING_APPROVAL.glob("*.md"):
-        fm = _read_frontmatter(f)
+    for f in _iter_md(PENDING_APPROVAL, entries=entries):
+        fm = _read_frontmatter(f.path)
         items.append({
             "name": fm.get("original_name", f.name),
             "type": fm.get("type", "other"),
@@ -129,15 +294,13 @@ def _collect_pending_approval() -> list[dict]:
     return items
 
 
-def _collect_quarantine() -> list[dict]:
+def _collect_quarantine(entries: list[os.DirEntry] | None = None) -> list[dict]:
     """Collect items in Quarantine/ needing manual review."""
-    if not QUARANTINE.exists():
-        return []
     items = []
-    for f in QUARANTINE.glob("*.md"):
+    for f in _iter_md(QUARANTINE, entries=entries):
         if f.name.endswith(".reason.md"):
             continue
-        fm = _read_frontmatter(f)
+        fm = _read_frontmatter(f.path)
         items.append({
             "name": fm.get("original_name", f.name),
             "reason": fm.get("reason", "unknown"),
@@ -146,24 +309,30 @@ def _collect_quarantine() -> list[dict]:
     return items
 
 
-def _extract_deadlines_from_done(since: datetime) -> list[str]:
+def _extract_deadlines_from_done(
+    since: datetime, entries: list[os.DirEntry] | None = None,
+) -> list[str]:
     """Scan recently-done items for action items with deadlines."""
     deadlines = []
-    if not DONE.exists():
-        return deadlines
-    for f in sorted(DONE.glob("FILE_*.md"), key=lambda p: p.stat().st_mtime, reverse=True)[:20]:
+    recent = []
+    for f in _iter_md(DONE, "FILE_", entries):
         try:
-            text = f.read_text(encoding="utf-8")
-            # Look for action items with dates
-            matches = re.findall(
-                r"- \[ \] .{0,80}(?:by|due|deadline|before)\s+\S+",
-                text,
-                re.IGNORECASE,
-            )
-            deadlines.extend(matches[:3])  # max 3 per file
+            recent.append((f.stat().st_mtime, f.path))
         except OSError:
             continue
-    return deadlines[:10]  # max 10 total
+    recent.sort(reverse=True)
+    for _, path in recent[:20]:
+        if len(deadlines) >= 10:  # max 10 total — stop reading files
+            break
+        text = _read_text(path)
+        if text is None:
+            continue
+        # Look for action items with dates, stopping at 3 per file
+        for per_file, match in enumerate(_DEADLINE_RE.finditer(text), 1):
+            deadlines.append(match.group(0))
+            if per_file == 3 or len(deadlines) == 10:
+                break
+    return deadlines
 
 
 def _read_business_goals() -> dict:
@@ -177,11 +346,11 @@ def _read_business_goals() -> dict:
 
     goals: dict = {}
     # Monthly goal
-    goal_match = re.search(r"Monthly goal:\s*\$?([\d,]+)", text)
+    goal_match = _GOAL_RE.search(text)
     if goal_match:
         goals["monthly_goal"] = float(goal_match.group(1).replace(",", ""))
     # Current MTD
-    mtd_match = re.search(r"Current MTD:\s*\$?([\d,]+)", text)
+    mtd_match = _MTD_RE.search(text)
     if mtd_match:
         goals["current_mtd"] = float(mtd_match.group(1).replace(",", ""))
     return goals
@@ -192,81 +361,19 @@ def _extract_revenue_from_done(since: datetime) -> dict:
 
     Returns dict with total_revenue (float) and invoices (list of dicts).
     """
-    if not DONE.exists():
-        return {"total_revenue": 0.0, "invoices": [], "paid_count": 0, "unpaid_count": 0}
-
-    total = 0.0
-    invoices = []
-    paid_count = 0
-    unpaid_count = 0
-
-    for f in DONE.glob("FILE_*.md"):
-        fm = _read_frontmatter(f)
-        doc_type = fm.get("type", "")
-        if doc_type not in ("invoice", "receipt"):
-            continue
-        processed_at_str = fm.get("processed_at", "")
-        if not processed_at_str:
-            continue
-        try:
-            processed_at = datetime.fromisoformat(processed_at_str.replace("Z", "+00:00"))
-            if processed_at.tzinfo is None:
-                processed_at = processed_at.replace(tzinfo=timezone.utc)
-            if processed_at < since:
-                continue
-        except (ValueError, TypeError):
-            continue
+    return _scan_done(since)[1]
 
-        # Try to extract amount from body
-        try:
-            body = f.read_text(encoding="utf-8")
-        except OSError:
-            body = ""
-        amt_match = re.search(
-            r"(?:amount|total|invoice\s+total|due)[:\s]+\$?([\d,]+(?:\.\d{2})?)",
-            body, re.IGNORECASE,
-        )
-        amount = float(amt_match.group(1).replace(",", "")) if amt_match else 0.0
-        total += amount
-
-        payment_state = fm.get("payment_state", fm.get("payment_status", ""))
-        is_paid = payment_state in ("paid", "in_payment", "approved")
-        if is_paid:
-            paid_count += 1
-        else:
-            unpaid_count += 1
-
-        invoices.append({
-            "name": fm.get("original_name", f.name),
-            "amount": amount,
-            "paid": is_paid,
-            "date": processed_at_str[:10],
-        })
-
-    return {
-        "total_revenue": total,
-        "invoices": sorted(invoices, key=lambda x: x["date"], reverse=True),
-        "paid_count": paid_count,
-        "unpaid_count": unpaid_count,
-    }
 
-
-def _source_breakdown(items: list[dict]) -> dict[str, int]:
+def _source_breakdown(items: list[dict]) -> Counter[str]:
     """Count items by source channel."""
-    counts: dict[str, int] = {"file_drop": 0, "gmail": 0, "whatsapp": 0}
-    for item in items:
-        src = item.get("source", "file_drop")
-        counts[src] = counts.get(src, 0) + 1
+    counts: Counter[str] = Counter({"file_drop": 0, "gmail": 0, "whatsapp": 0})
+    counts.update(item.get("source", "file_drop") for item in items)
     return counts
 
 
-def _type_breakdown(items: list[dict]) -> dict[str, int]:
+def _type_breakdown(items: list[dict]) -> Counter[str]:
     """Count items by document type."""
-    counts: dict[str, int] = {}
-    for item in items:
-        t = item.get("type", "other")
-        counts[t] = counts.get(t, 0) + 1
-    return counts
+    return Counter(item.get("type", "other") for item in items)
 
 
 # ---------------------------------------------------------------------------
@@ -292,168 +399,176 @@ def generate_briefing(period: str = "daily") -> Path:
         since = now - timedelta(days=1)
         period_label = "Daily"
 
+    # One directory listing per folder, shared by the counts and collectors
+    folders = {
+        "Inbox": INBOX,
+        "Needs_Action": NEEDS_ACTION,
+        "In_Progress": IN_PROGRESS,
+        "Done": DONE,
+        "Quarantine": QUARANTINE,
+        "Pending_Approval": PENDING_APPROVAL,
+        "Plans": PLANS,
+        "Approved": APPROVED,
+        "Rejected": REJECTED,
+        "Briefings": BRIEFINGS,
+    }
+    listings = {name: _listing(folder) for name, folder in folders.items()}
+
     # Collect data
-    done_items = _collect_done_in_period(since)
-    pending_items = _collect_pending()
-    approval_items = _collect_pending_approval()
-    quarantine_items = _collect_quarantine()
-    deadlines = _extract_deadlines_from_done(since)
-    revenue_data = _extract_revenue_from_done(since)
+    done_items, revenue_data = _scan_done(since, listings["Done"])
+    pending_items = _collect_pending(listings["Needs_Action"])
+    approval_items = _collect_pending_approval(listings["Pending_Approval"])
+    quarantine_items = _collect_quarantine(listings["Quarantine"])
+    deadlines = _extract_deadlines_from_done(since, listings["Done"])
     business_goals = _read_business_goals()
 
     # Current queue counts
-    queue_counts = {
-        "Inbox": _count(INBOX),
-        "Needs_Action": _count(NEEDS_ACTION),
-        "In_Progress": _count(IN_PROGRESS),
-        "Done": _count(DONE),
-        "Quarantine": _count(QUARANTINE),
-        "Pending_Approval": _count(PENDING_APPROVAL),
-        "Plans": _count(PLANS),
-        "Approved": _count(APPROVED),
-        "Rejected": _count(REJECTED),
-        "Briefings": _count(BRIEFINGS),
-    }
+    queue_counts = {name: _count(folders[name], entries) for name, entries in listings.items()}
 
     # Build source breakdown for processed items
     src_counts = _source_breakdown(done_items)
     type_counts = _type_breakdown(done_items)
 
+    # System health score (0-100)
+    health_score = _compute_health_score(queue_counts, quarantine_items, approval_items)
+
+    # Revenue figures
+    monthly_goal = business_goals.get("monthly_goal", 0)
+    current_mtd = business_goals.get("current_mtd", 0) + revenue_data["total_revenue"]
+    pct_of_goal = (current_mtd / monthly_goal * 100) if monthly_goal > 0 else 0
+    revenue_trend = "On track" if pct_of_goal >= 40 else "Behind target"
+
+    date_str = now.strftime("%Y-%m-%d")
+    time_str = now.strftime("%H:%M UTC")
+    briefing_name = f"BRIEFING_{now.strftime('%Y%m%d_%H%M%S')}_{period}.md"
+    briefing_path = BRIEFINGS / briefing_name
+
+    # The document is collected as a list of chunks and written in one go
+    parts: list[str] = [
+        "---\n",
+        "type: briefing\n",
+        f"period: {period}\n",
+        f"generated_at: {now.isoformat()}\n",
+        f"covers_from: {since.isoformat()}\n",
+        f"covers_to: {now.isoformat()}\n",
+        f"health_score: {health_score}\n",
+        f"revenue_period: {revenue_data['total_revenue']:.2f}\n",
+        f"revenue_mtd: {current_mtd:.2f}\n",
+        "---\n\n",
+        f"# {period_label} Briefing — {date_str}\n\n",
+        f"**Generated:** {date_str} at {time_str}  \n",
+        f"**Period:** Last {'24 hours' if period == 'daily' else '7 days'}  \n",
+        f"**System Health:** {health_score}/100\n",
+        # Revenue section
+        "\n## Revenue\n\n",
+        "| Metric | Value |\n|--------|-------|\n",
+        f"| Period revenue | ${revenue_data['total_revenue']:,.2f} |\n",
+        f"| MTD total | ${current_mtd:,.2f} |\n",
+        f"| Monthly goal | ${monthly_goal:,.2f} |\n",
+        f"| Goal progress | {pct_of_goal:.0f}% |\n",
+        f"| Trend | {revenue_trend} |\n",
+        f"| Paid invoices | {revenue_data['paid_count']} |\n",
+        f"| Unpaid invoices | {revenue_data['unpaid_count']} |\n",
+    ]
+    if revenue_data["invoices"]:
+        parts.append(
+            "\n**Recent Invoices:**\n\n"
+            "| File | Amount | Status | Date |\n"
+            "|------|--------|--------|------|\n"
+        )
+        parts.extend(
+            f"| {i['name'][:40]} | ${i['amount']:,.2f} | {'✓ Paid' if i['paid'] else '⏳ Pending'} | {i['date']} |\n"
+            for i in revenue_data["invoices"][:5]
+        )
+
+    parts += [
+        "\n## Summary\n\n",
+        "| Metric | Count |\n|--------|-------|\n",
+        f"| Processed in period | {len(done_items)} |\n",
+        f"| Pending in queue | {len(pending_items)} |\n",
+        f"| Awaiting approval | {len(approval_items)} |\n",
+        f"| In quarantine | {len(quarantine_items)} |\n",
+        f"| Total in Done/ | {queue_counts['Done']} |\n\n",
+        "## Channel Breakdown\n\n",
+        "| Channel | Processed |\n|---------|----------|\n",
+        f"| File Drop | {src_counts.get('file_drop', 0)} |\n",
+        f"| Gmail | {src_counts.get('gmail', 0)} |\n",
+        f"| WhatsApp | {src_counts.get('whatsapp', 0)} |\n\n",
+        "## Document Types\n\n",
+        "| Type | Count |\n|------|-------|\n",
+    ]
+    if type_counts:
+        parts.extend(f"| {t} | {c} |\n" for t, c in sorted(type_counts.items(), key=lambda x: -x[1]))
+    else:
+        parts.append("\n| (none) | 0 |\n")
+
     # Completed items table
-    completed_rows = "\n".join(
+    parts += [
+        "\n## Completed Items\n\n",
+        "| File | Type | Channel | Priority | Approval | Processed |\n",
+        "|------|------|---------|----------|----------|-----------|\n",
+    ]
+    parts.extend(
         f"| {i['name'][:40]} | {i['type']} | {i['source']} | "
-        f"{i['priority']} | {i.get('approval_status','auto')} | {i['processed_at'][:16]} |"
+        f"{i['priority']} | {i.get('approval_status','auto')} | {i['processed_at'][:16]} |\n"
         for i in done_items[:15]
-    ) or "| No items completed in this period | | | | | |"
+    )
+    if not done_items:
+        parts.append("| No items completed in this period | | | | | |\n")
 
     # Pending items table
-    pending_rows = "\n".join(
-        f"| {i['name'][:40]} | {i['type']} | {i['source']} | {i['priority']} | {i['queued_at'][:16]} |"
+    parts += [
+        "\n## Pending Items\n\n",
+        "| File | Type | Channel | Priority | Queued |\n",
+        "|------|------|---------|----------|--------|\n",
+    ]
+    parts.extend(
+        f"| {i['name'][:40]} | {i['type']} | {i['source']} | {i['priority']} | {i['queued_at'][:16]} |\n"
         for i in pending_items[:10]
-    ) or "| No pending items | | | | |"
+    )
+    if not pending_items:
+        parts.append("| No pending items | | | | |\n")
 
     # Awaiting approval table
-    approval_rows = "\n".join(
-        f"| {i['name'][:40]} | {i['type']} | {i['source']} | {i['requested_at'][:16]} |"
+    parts += [
+        "\n## Awaiting Human Approval\n\n",
+        "| File | Type | Channel | Requested |\n",
+        "|------|------|---------|----------|\n",
+    ]
+    parts.extend(
+        f"| {i['name'][:40]} | {i['type']} | {i['source']} | {i['requested_at'][:16]} |\n"
         for i in approval_items[:10]
-    ) or "| No items awaiting approval | | | |"
+    )
+    if not approval_items:
+        parts.append("| No items awaiting approval | | | |\n")
 
     # Quarantine alerts
-    quarantine_section = ""
     if quarantine_items:
-        q_lines = "\n".join(
-            f"- **{i['name']}** — {i['reason']} (retried {i['retries']}x)"
+        parts.append("\n## ⚠️ Attention Required\n\n")
+        parts.extend(
+            f"- **{i['name']}** — {i['reason']} (retried {i['retries']}x)\n"
             for i in quarantine_items
         )
-        quarantine_section = f"\n## ⚠️ Attention Required\n\n{q_lines}\n"
 
     # Deadlines section
-    deadline_section = ""
     if deadlines:
-        d_lines = "\n".join(f"- {d}" for d in deadlines)
-        deadline_section = f"\n## Upcoming Deadlines\n\n{d_lines}\n"
+        parts.append("\n## Upcoming Deadlines\n\n")
+        parts.extend(f"- {d}\n" for d in deadlines)
 
     # Weekly trend note
-    trend_section = ""
     if period == "weekly":
-        total_done_ever = _count(DONE)
         avg_per_day = len(done_items) / 7 if done_items else 0
-        trend_section = (
-            f"\n## Weekly Trends\n\n"
-            f"- Items processed this week: {len(done_items)}\n"
-            f"- Daily average: {avg_per_day:.1f}\n"
-            f"- Total archived in Done/: {total_done_ever}\n"
-        )
+        parts += [
+            "\n## Weekly Trends\n\n",
+            f"- Items processed this week: {len(done_items)}\n",
+            f"- Daily average: {avg_per_day:.1f}\n",
+            f"- Total archived in Done/: {queue_counts['Done']}\n",
+        ]
 
-    # System health score (0-100)
-    health_score = _compute_health_score(queue_counts, quarantine_items, approval_items)
-
-    # Revenue section
-    monthly_goal = business_goals.get("monthly_goal", 0)
-    current_mtd = business_goals.get("current_mtd", 0) + revenue_data["total_revenue"]
-    pct_of_goal = (current_mtd / monthly_goal * 100) if monthly_goal > 0 else 0
-    revenue_trend = "On track" if pct_of_goal >= 40 else "Behind target"
-
-    revenue_section = (
-        f"\n## Revenue\n\n"
-        f"| Metric | Value |\n|--------|-------|\n"
-        f"| Period revenue | ${revenue_data['total_revenue']:,.2f} |\n"
-        f"| MTD total | ${current_mtd:,.2f} |\n"
-        f"| Monthly goal | ${monthly_goal:,.2f} |\n"
-        f"| Goal progress | {pct_of_goal:.0f}% |\n"
-        f"| Trend | {revenue_trend} |\n"
-        f"| Paid invoices | {revenue_data['paid_count']} |\n"
-        f"| Unpaid invoices | {revenue_data['unpaid_count']} |\n"
-    )
-    if revenue_data["invoices"]:
-        inv_rows = "\n".join(
-            f"| {i['name'][:40]} | ${i['amount']:,.2f} | {'✓ Paid' if i['paid'] else '⏳ Pending'} | {i['date']} |"
-            for i in revenue_data["invoices"][:5]
-        )
-        revenue_section += (
-            f"\n**Recent Invoices:**\n\n"
-            f"| File | Amount | Status | Date |\n"
-            f"|------|--------|--------|------|\n"
-            f"{inv_rows}\n"
-        )
-
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M UTC")
-    briefing_name = f"BRIEFING_{now.strftime('%Y%m%d_%H%M%S')}_{period}.md"
-    briefing_path = BRIEFINGS / briefing_name
-
-    content = (
-        f"---\n"
-        f"type: briefing\n"
-        f"period: {period}\n"
-        f"generated_at: {now.isoformat()}\n"
-        f"covers_from: {since.isoformat()}\n"
-        f"covers_to: {now.isoformat()}\n"
-        f"health_score: {health_score}\n"
-        f"revenue_period: {revenue_data['total_revenue']:.2f}\n"
-        f"revenue_mtd: {current_mtd:.2f}\n"
-        f"---\n\n"
-        f"# {period_label} Briefing — {date_str}\n\n"
-        f"**Generated:** {date_str} at {time_str}  \n"
-        f"**Period:** Last {'24 hours' if period == 'daily' else '7 days'}  \n"
-        f"**System Health:** {health_score}/100\n"
-        f"{revenue_section}\n"
-        f"## Summary\n\n"
-        f"| Metric | Count |\n|--------|-------|\n"
-        f"| Processed in period | {len(done_items)} |\n"
-        f"| Pending in queue | {len(pending_items)} |\n"
-        f"| Awaiting approval | {len(approval_items)} |\n"
-        f"| In quarantine | {len(quarantine_items)} |\n"
-        f"| Total in Done/ | {queue_counts['Done']} |\n\n"
-        f"## Channel Breakdown\n\n"
-        f"| Channel | Processed |\n|---------|----------|\n"
-        f"| File Drop | {src_counts.get('file_drop', 0)} |\n"
-        f"| Gmail | {src_counts.get('gmail', 0)} |\n"
-        f"| WhatsApp | {src_counts.get('whatsapp', 0)} |\n\n"
-        f"## Document Types\n\n"
-        f"| Type | Count |\n|------|-------|\n"
-        + "\n".join(f"| {t} | {c} |" for t, c in sorted(type_counts.items(), key=lambda x: -x[1]))
-        + ("\n| (none) | 0 |" if not type_counts else "")
-        + f"\n\n"
-        f"## Completed Items\n\n"
-        f"| File | Type | Channel | Priority | Approval | Processed |\n"
-        f"|------|------|---------|----------|----------|-----------|\n"
-        f"{completed_rows}\n"
-        f"\n## Pending Items\n\n"
-        f"| File | Type | Channel | Priority | Queued |\n"
-        f"|------|------|---------|----------|--------|\n"
-        f"{pending_rows}\n"
-        f"\n## Awaiting Human Approval\n\n"
-        f"| File | Type | Channel | Requested |\n"
-        f"|------|------|---------|----------|\n"
-        f"{approval_rows}\n"
-        f"{quarantine_section}"
-        f"{deadline_section}"
-        f"{trend_section}"
-        f"\n---\n*Generated by Zoya AI Employee — {period_label} Briefing System*\n"
-    )
+    parts.append(f"\n---\n*Generated by Zoya AI Employee — {period_label} Briefing System*\n")
 
-    briefing_path.write_text(content, encoding="utf-8")
+    with briefing_path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.writelines(parts)
     log_action("briefing_generated", str(briefing_path), {"period": period, "health_score": health_score})
     logger.info("Briefing generated: %s (health=%d)", briefing_name, health_score)
     return briefing_path
@@ -117,14 +117,27 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 
 
+def _subdir_names(parent: Path) -> set[str]:
+    """Names of the directories directly inside *parent* (empty if missing)."""
+    try:
+        with os.scandir(parent) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return set()
+
+
 def validate_config() -> list[str]:
     """Return a list of config warnings/errors. Empty list = all OK."""
     issues = []
-    # Check vault folders exist
+    # Check vault folders exist — one directory listing per parent folder
+    # (the vault root, Business/) instead of a stat() per folder
+    subdirs: dict[Path, set[str]] = {}
     for folder in [INBOX, NEEDS_ACTION, IN_PROGRESS, DONE, QUARANTINE, LOGS,
                    PLANS, APPROVED, REJECTED, BRIEFINGS, PENDING_APPROVAL, CONTACTS,
                    BUSINESS_TASKS, CLIENTS]:
-        if not folder.is_dir():
+        if folder.parent not in subdirs:
+            subdirs[folder.parent] = _subdir_names(folder.parent)
+        if folder.name not in subdirs[folder.parent]:
             issues.append(f"Missing vault folder: {folder.name}")
 
     # Check AI provider config
@@ -14,6 +14,10 @@ Cron schedule (Sunday 23:30 local — 30 min after audit_generator):
 Files this module will DELETE (matching YYYY-MM-DD.json pattern):
   - AI_Employee_Vault/Logs/2025-10-01.json  (if older than retention days)
   - AI_Employee_Vault/Logs/2025-11-15.json
+  - AI_Employee_Vault/Logs/2025-09-20.json.gz  (gzip-rotated days age out the same way)
+
+Day logs it keeps but that are older than yesterday are gzip-rotated to
+YYYY-MM-DD.json.gz (audit_logger.rotate_closed_days); readers handle both.
 
 Files this module will NEVER delete (no YYYY-MM-DD pattern, or explicitly skipped):
   - gold_tier_progress.md     (permanent progress log)
@@ -37,6 +41,7 @@ import os
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from src.audit_logger import rotate_closed_days
 from src.config import LOGS, VAULT_PATH
 from src.utils import setup_logger
 
@@ -55,10 +60,15 @@ _PROGRESS_LOG = LOGS / "gold_tier_progress.md"
 _DATE_FMT = "%Y-%m-%d"
 
 
+def _day_part(path: Path) -> str:
+    """Filename up to the first dot — ``2025-10-01`` for ``2025-10-01.json.gz``."""
+    return path.name.split(".", 1)[0]
+
+
 def _is_date_log(path: Path) -> bool:
-    """Return True only if the filename stem is exactly YYYY-MM-DD."""
+    """Return True only if the filename (before any suffix) is exactly YYYY-MM-DD."""
     try:
-        datetime.strptime(path.stem, _DATE_FMT)
+        datetime.strptime(_day_part(path), _DATE_FMT)
         return True
     except ValueError:
         return False
@@ -74,15 +84,18 @@ def purge_logs(
         retention_days: Minimum age in days before a log file is eligible.
         dry_run:        If True, log what would be deleted but don't delete.
 
+    Surviving day logs older than yesterday are then gzip-rotated (see
+    audit_logger.rotate_closed_days); dry runs rotate nothing.
+
     Returns:
-        Dict with keys ``deleted``, ``skipped``, ``eligible``.
+        Dict with keys ``deleted``, ``skipped``, ``eligible``, ``rotated``.
     """
     if not LOGS.exists():
         logger.info("Logs folder does not exist yet — nothing to purge")
-        return {"deleted": 0, "skipped": 0, "eligible": 0}
+        return {"deleted": 0, "skipped": 0, "eligible": 0, "rotated": 0}
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
-    stats = {"deleted": 0, "skipped": 0, "eligible": 0}
+    stats = {"deleted": 0, "skipped": 0, "eligible": 0, "rotated": 0}
 
     for log_file in sorted(LOGS.iterdir()):
         if not log_file.is_file():
@@ -100,8 +113,8 @@ def purge_logs(
             stats["skipped"] += 1
             continue
 
-        # Parse the date from the stem
-        file_date = datetime.strptime(log_file.stem, _DATE_FMT).replace(tzinfo=timezone.utc)
+        # Parse the date from the filename (plain .json or rotated .json.gz)
+        file_date = datetime.strptime(_day_part(log_file), _DATE_FMT).replace(tzinfo=timezone.utc)
         if file_date >= cutoff:
             logger.debug("Within retention window — keeping: %s", log_file.name)
             stats["skipped"] += 1
@@ -115,11 +128,15 @@ def purge_logs(
         else:
             try:
                 log_file.unlink()
+                # Drop the day's cached stats too (see audit_logger._STATS_DIR)
+                (LOGS / ".stats" / f"{_day_part(log_file)}.json").unlink(missing_ok=True)
                 logger.info("Deleted: %s (%d days old)", log_file.name, age_days)
                 stats["deleted"] += 1
             except OSError as exc:
                 logger.error("Failed to delete %s: %s", log_file.name, exc)
 
+    if not dry_run:
+        stats["rotated"] = rotate_closed_days()
     return stats
 
 
@@ -131,7 +148,7 @@ def _append_progress(stats: dict[str, int], retention_days: int, dry_run: bool)
     line = (
         f"- [{now.strftime('%Y-%m-%d %H:%M UTC')}] **log_janitor_{action}** "
         f"deleted={stats['deleted']} eligible={stats['eligible']} "
-        f"skipped={stats['skipped']} retention={retention_days}d\n"
+        f"skipped={stats['skipped']} rotated={stats['rotated']} retention={retention_days}d\n"
     )
     with open(_PROGRESS_LOG, "a", encoding="utf-8") as f:
         f.write(line)
@@ -189,7 +206,7 @@ def main() -> None:
     action_word = "Would delete" if args.dry_run else "Deleted"
     print(
         f"Log janitor complete — {action_word} {stats['eligible']} eligible file(s) "
-        f"({stats['deleted']} deleted, {stats['skipped']} skipped)"
+        f"({stats['deleted']} deleted, {stats['skipped']} skipped, {stats['rotated']} gzipped)"
     )
 
 
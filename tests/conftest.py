@@ -18,6 +18,8 @@ def vault(tmp_path: Path, monkeypatch):
     import src.briefing_generator as briefing_mod
     import src.ralph_loop as ralph_mod
     import src.cross_domain_linker as linker_mod
+    import src.audit_logger as audit_logger_mod
+    import src.audit_generator as audit_gen_mod
 
     dirs = {
         "VAULT_PATH": tmp_path / "vault",
@@ -48,7 +50,10 @@ def vault(tmp_path: Path, monkeypatch):
 
     # Patch the already-imported names in consuming modules so they see
     # the tmp_path versions instead of the real vault.
-    all_mods = (utils_mod, watcher_mod, orch_mod, briefing_mod, ralph_mod, linker_mod)
+    all_mods = (
+        utils_mod, watcher_mod, orch_mod, briefing_mod, ralph_mod, linker_mod,
+        audit_logger_mod, audit_gen_mod,
+    )
     for attr, path in dirs.items():
         for mod in all_mods:
             if hasattr(mod, attr):
@@ -64,6 +69,7 @@ def vault(tmp_path: Path, monkeypatch):
             monkeypatch.setattr(mod, "ORCHESTRATOR_LOCK", lock_path)
         if hasattr(mod, "VAULT_PATH"):
             monkeypatch.setattr(mod, "VAULT_PATH", dirs["VAULT_PATH"])
+    monkeypatch.setattr(audit_gen_mod, "PROGRESS_LOG", dirs["LOGS"] / "gold_tier_progress.md")
 
     return dirs
 
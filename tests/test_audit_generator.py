@@ -0,0 +1,367 @@
+"""Tests for src/audit_generator.py — Gold tier Task 6C."""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.audit_generator import (
+    DirListings,
+    _scan_done_files,
+    _update_dashboard_briefing_line,
+    collect_social_metrics,
+    collect_vault_snapshot,
+    generate_ceo_briefing,
+    run_audit,
+    send_whatsapp_summary,
+)
+import src.audit_generator as audit_gen
+
+
+def _done_file(folder, name, processed_at, body="", mtime=None):
+    f = folder / name
+    f.write_text(
+        f"---\noriginal_name: {name}.pdf\ntype: invoice\nsource: gmail\n"
+        f"priority: high\nprocessed_at: {processed_at.isoformat()}\n---\n\n{body}",
+        encoding="utf-8",
+    )
+    if mtime is not None:
+        os.utime(f, (mtime, mtime))
+    return f
+
+
+def _briefing(vault, **kwargs):
+    return generate_ceo_briefing(
+        vault_snapshot=collect_vault_snapshot(),
+        social_metrics=collect_social_metrics(),
+        financial={},
+        audit_stats={},
+        **kwargs,
+    )
+
+
+class TestScanDoneFiles:
+    def test_only_file_markdown(self, vault):
+        now = datetime.now(timezone.utc)
+        _done_file(vault["DONE"], "FILE_a.md", now)
+        (vault["DONE"] / "TWITTER_post.md").write_text("x")
+        (vault["DONE"] / "FILE_a.pdf").write_bytes(b"%PDF")
+        files = _scan_done_files()
+        assert [f.path.name for f in files] == ["FILE_a.md"]
+        assert files[0].fm["type"] == "invoice"
+
+    def test_body_read_lazily(self, vault):
+        _done_file(vault["DONE"], "FILE_a.md", datetime.now(timezone.utc), body="- [ ] pay by Friday\n")
+        (f,) = _scan_done_files()
+        assert "data" not in vars(f)
+        assert b"pay by Friday" in f.data
+        assert "data" in vars(f)
+
+    def test_long_frontmatter(self, vault):
+        (vault["DONE"] / "FILE_long.md").write_text(
+            "---\nnotes: " + "x" * 5000 + "\ntype: receipt\n---\nbody\n"
+        )
+        assert _scan_done_files()[0].fm["type"] == "receipt"
+
+    def test_file_without_frontmatter(self, vault):
+        (vault["DONE"] / "FILE_plain.md").write_text("no frontmatter\n---\nkey: v\n---\n")
+        assert _scan_done_files()[0].fm == {}
+
+    def test_missing_done_folder(self, vault):
+        vault["DONE"].rmdir()
+        assert _scan_done_files() == []
+
+
+class TestCollectVaultSnapshot:
+    def test_done_this_week(self, vault):
+        now = datetime.now(timezone.utc)
+        _done_file(vault["DONE"], "FILE_new.md", now - timedelta(days=1))
+        _done_file(vault["DONE"], "FILE_old.md", now - timedelta(days=10))
+        snap = collect_vault_snapshot()
+        assert snap["counts"]["done_this_week"] == 1
+        assert snap["counts"]["done"] == 2
+        assert snap["counts"]["done_prior_week"] == 1
+        assert snap["done_this_week"][0]["name"] == "FILE_new.md.pdf"
+        assert len(snap["invoices_done"]) == 1
+        assert sorted(f.path.name for f in snap["done_files"]) == ["FILE_new.md", "FILE_old.md"]
+
+    def test_processed_at_formats(self, vault):
+        recent = (datetime.now(timezone.utc) - timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        (vault["DONE"] / "FILE_z.md").write_text(f"---\nprocessed_at: {recent}\n---\n")
+        (vault["DONE"] / "FILE_bad.md").write_text("---\nprocessed_at: yesterday\n---\n")
+        (vault["DONE"] / "FILE_none.md").write_text("---\ntype: other\n---\n")
+        assert collect_vault_snapshot()["counts"]["done_this_week"] == 1
+
+    def test_rescans_folders_on_each_call(self, vault):
+        assert collect_vault_snapshot()["counts"]["needs_action"] == 0
+        (vault["NEEDS_ACTION"] / "FILE_new.md").write_text("x")
+        assert collect_vault_snapshot()["counts"]["needs_action"] == 1
+        (vault["PENDING_APPROVAL"] / "EMAIL_new.md").write_text("---\ntype: email\n---\n")
+        assert [p["name"] for p in collect_vault_snapshot()["approval_pending"]] == ["EMAIL_new.md"]
+
+    def test_overdue_items(self, vault):
+        stale = vault["NEEDS_ACTION"] / "FILE_stale.md"
+        stale.write_text("x")
+        old = (datetime.now(timezone.utc) - timedelta(hours=72)).timestamp()
+        os.utime(stale, (old, old))
+        (vault["NEEDS_ACTION"] / "FILE_fresh.md").write_text("x")
+        overdue = collect_vault_snapshot()["overdue"]
+        assert [o["name"] for o in overdue] == ["FILE_stale.md"]
+        assert overdue[0]["age_hours"] >= 71
+
+
+class TestCollectSocialMetrics:
+    def test_counts_posts_per_platform(self, vault):
+        for name in ("TWITTER_a.md", "TWITTER_b.md", "LINKEDIN_a.md", "FILE_x.md", "TWITTER_c.txt"):
+            (vault["DONE"] / name).write_text("x")
+        metrics = collect_social_metrics()
+        assert metrics["twitter"]["posts"] == 2
+        assert metrics["linkedin"]["posts"] == 1
+
+    def test_sees_files_added_after_a_snapshot(self, vault):
+        collect_vault_snapshot()
+        (vault["DONE"] / "TWITTER_1.md").write_text("x")
+        assert collect_social_metrics()["twitter"]["posts"] == 1
+
+    def test_shared_listing_is_reused(self, vault):
+        dirs = DirListings()
+        assert collect_social_metrics(dirs)["twitter"]["posts"] == 0
+        (vault["DONE"] / "TWITTER_1.md").write_text("x")
+        assert collect_social_metrics(dirs)["twitter"]["posts"] == 0
+
+
+class TestGenerateCeoBriefing:
+    def test_writes_final_and_latest(self, vault):
+        path = _briefing(vault)
+        assert path.name.startswith("CEO_BRIEFING_")
+        latest = vault["BRIEFINGS"] / "CEO_BRIEFING_LATEST.md"
+        assert latest.read_text(encoding="utf-8") == path.read_text(encoding="utf-8")
+
+    def test_latest_repointed_on_rerun(self, vault):
+        first = _briefing(vault, report_date=datetime(2026, 1, 4, 23, 0, tzinfo=timezone.utc))
+        second = _briefing(vault, report_date=datetime(2026, 1, 11, 23, 0, tzinfo=timezone.utc))
+        latest = vault["BRIEFINGS"] / "CEO_BRIEFING_LATEST.md"
+        assert latest.read_text(encoding="utf-8") == second.read_text(encoding="utf-8")
+        assert latest.read_text(encoding="utf-8") != first.read_text(encoding="utf-8")
+        assert not list(vault["BRIEFINGS"].glob(".*.tmp"))
+
+    def test_missing_section_saves_draft(self, vault, monkeypatch):
+        monkeypatch.setattr(
+            audit_gen, "REQUIRED_SECTIONS", audit_gen.REQUIRED_SECTIONS + ("## Extra",)
+        )
+        path = _briefing(vault)
+        assert path.name.startswith("DRAFT_CEO_BRIEFING_")
+        alerts = list(vault["NEEDS_ACTION"].glob("ALERT_BRIEFING_INCOMPLETE_*.md"))
+        assert "`## Extra`" in alerts[0].read_text(encoding="utf-8")
+
+    def test_week_over_week_counts_prior_week(self, vault):
+        now = datetime.now(timezone.utc)
+        _done_file(vault["DONE"], "FILE_this.md", now - timedelta(days=2))
+        _done_file(vault["DONE"], "FILE_prior.md", now - timedelta(days=9))
+        _done_file(vault["DONE"], "FILE_ancient.md", now - timedelta(days=30))
+        text = _briefing(vault).read_text(encoding="utf-8")
+        assert "| Items Completed | 1 | 1 | +0 (+0%) |" in text
+
+    def test_extracts_deadlines(self, vault):
+        now = datetime.now(timezone.utc)
+        _done_file(
+            vault["DONE"], "FILE_plan.md", now,
+            body="- [ ] Send the signed contract by Friday\n- [x] done already by Monday\n",
+        )
+        text = _briefing(vault).read_text(encoding="utf-8")
+        assert "  - - [ ] Send the signed contract by Friday" in text
+
+    def test_deadline_bound_counts_characters_not_bytes(self, vault):
+        now = datetime.now(timezone.utc)
+        task = "معاہدے پر دستخط کروائیں اور کلائنٹ کو بھیجیں " * 2   # ~90 chars, ~165 UTF-8 bytes
+        assert len(task) <= 100 < len(task.encode("utf-8"))
+        _done_file(vault["DONE"], "FILE_urdu.md", now, body=f"- [ ] {task}by Friday\n")
+        text = _briefing(vault).read_text(encoding="utf-8")
+        assert f"  - - [ ] {task}by Friday" in text
+
+    def test_updates_dashboard_line(self, vault):
+        dashboard = vault["VAULT_PATH"] / "Dashboard.md"
+        dashboard.write_text("# Dashboard\n**Last updated:** today\n", encoding="utf-8")
+        path = _briefing(vault)
+        text = dashboard.read_text(encoding="utf-8")
+        assert "**Last CEO Briefing:**" in text
+        assert path.name in text
+
+
+class TestSendWhatsappSummary:
+    def test_dry_run_reads_briefing(self, vault, monkeypatch):
+        monkeypatch.setattr(audit_gen, "OWNER_WHATSAPP", "447911123456")
+        path = _briefing(vault)
+        assert send_whatsapp_summary(path, dry_run=True) is True
+
+    def test_posts_summary_over_one_connection(self, vault, monkeypatch):
+        connections = []
+
+        class FakeResponse:
+            status = 200
+
+            def read(self):
+                return b"{}"
+
+        class FakeConnection:
+            def __init__(self, host, timeout):
+                self.host = host
+                self.sock = None
+                self.sent = []
+                connections.append(self)
+
+            def request(self, method, path, body, headers):
+                self.sent.append((method, path, json.loads(body), headers))
+
+            def getresponse(self):
+                return FakeResponse()
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(audit_gen, "OWNER_WHATSAPP", "447911123456")
+        monkeypatch.setattr(audit_gen, "WHATSAPP_ACCESS_TOKEN", "token")
+        monkeypatch.setattr(audit_gen, "WHATSAPP_PHONE_NUMBER_ID", "123")
+        monkeypatch.setattr(audit_gen, "_wa_conn", None)
+        monkeypatch.setattr(audit_gen.http.client, "HTTPSConnection", FakeConnection)
+        path = _briefing(vault)
+        assert send_whatsapp_summary(path) is True
+        assert send_whatsapp_summary(path) is True
+        assert len(connections) == 1
+        method, url_path, payload, headers = connections[0].sent[0]
+        assert (method, url_path) == ("POST", "/v18.0/123/messages")
+        assert headers["Authorization"] == "Bearer token"
+        assert payload["to"] == "447911123456"
+        assert payload["text"]["body"].startswith("📊 *Zoya Weekly Briefing*")
+
+    def _fake_wa(self, monkeypatch, fail_request=False):
+        connections = []
+
+        class FakeResponse:
+            status = 200
+
+            def read(self):
+                return b"{}"
+
+        class FakeConnection:
+            def __init__(self, host, timeout):
+                self.sock = None
+                self.sent = 0
+                self.closed = False
+                connections.append(self)
+
+            def request(self, method, path, body, headers):
+                self.sent += 1
+                if fail_request:
+                    raise ConnectionResetError("reset after write")
+
+            def getresponse(self):
+                return FakeResponse()
+
+            def close(self):
+                self.closed = True
+
+        monkeypatch.setattr(audit_gen, "OWNER_WHATSAPP", "447911123456")
+        monkeypatch.setattr(audit_gen, "WHATSAPP_ACCESS_TOKEN", "token")
+        monkeypatch.setattr(audit_gen, "WHATSAPP_PHONE_NUMBER_ID", "123")
+        monkeypatch.setattr(audit_gen, "_wa_conn", None)
+        monkeypatch.setattr(audit_gen.http.client, "HTTPSConnection", FakeConnection)
+        return connections
+
+    def test_idle_connection_closed_by_peer_is_replaced_before_sending(self, vault, monkeypatch):
+        import socket
+
+        connections = self._fake_wa(monkeypatch)
+        path = _briefing(vault)
+        assert send_whatsapp_summary(path) is True
+        ours, peer = socket.socketpair()
+        connections[0].sock = ours
+        peer.close()   # server dropped the idle keep-alive
+        try:
+            assert send_whatsapp_summary(path) is True
+        finally:
+            ours.close()
+        assert len(connections) == 2
+        assert connections[0].closed and connections[0].sent == 1
+        assert connections[1].sent == 1
+
+    def test_error_mid_request_is_not_retried(self, vault, monkeypatch):
+        connections = self._fake_wa(monkeypatch, fail_request=True)
+        assert send_whatsapp_summary(_briefing(vault)) is False
+        assert [c.sent for c in connections] == [1]
+        assert audit_gen._wa_conn is None
+
+    def test_missing_briefing(self, vault, monkeypatch):
+        monkeypatch.setattr(audit_gen, "OWNER_WHATSAPP", "447911123456")
+        assert send_whatsapp_summary(vault["BRIEFINGS"] / "nope.md", dry_run=True) is False
+
+
+class TestUpdateDashboardBriefingLine:
+    def test_replaces_existing_line_only(self, vault):
+        dashboard = vault["VAULT_PATH"] / "Dashboard.md"
+        dashboard.write_text(
+            "# Dashboard\n**Last updated:** today\n**Last CEO Briefing:** old\nfooter\n",
+            encoding="utf-8",
+        )
+        _update_dashboard_briefing_line("CEO_BRIEFING_X.md", datetime(2026, 1, 4, 23, 0))
+        lines = dashboard.read_text(encoding="utf-8").splitlines()
+        assert lines[0] == "# Dashboard"
+        assert lines[2].startswith("**Last CEO Briefing:** 2026-01-04 23:00 UTC")
+        assert "(Briefings/CEO_BRIEFING_X.md)" in lines[2]
+        assert lines[3] == "footer"
+
+    def test_inserts_after_last_updated_without_trailing_newline(self, vault):
+        dashboard = vault["VAULT_PATH"] / "Dashboard.md"
+        dashboard.write_text("# Dashboard\n**Last updated:** today", encoding="utf-8")
+        _update_dashboard_briefing_line("CEO_BRIEFING_X.md", datetime(2026, 1, 4, 23, 0))
+        lines = dashboard.read_text(encoding="utf-8").splitlines()
+        assert lines[1] == "**Last updated:** today"
+        assert lines[2].startswith("**Last CEO Briefing:**")
+
+
+class TestRunAudit:
+    def test_dry_run(self, vault):
+        path = run_audit(dry_run=True)
+        assert path.exists()
+        progress = (vault["LOGS"] / "gold_tier_progress.md").read_text(encoding="utf-8")
+        assert "**audit_started**" in progress
+        assert "**audit_complete**" in progress
+
+    def test_week_over_week_audit_stats(self, vault):
+        now = datetime.now(timezone.utc)
+        for day, count in ((now, 2), (now - timedelta(days=8), 1), (now - timedelta(days=20), 5)):
+            log = vault["LOGS"] / f"{day.strftime('%Y-%m-%d')}.json"
+            log.write_text(
+                "".join(
+                    json.dumps({"timestamp": day.isoformat(), "action_type": "file_done"}) + "\n"
+                    for _ in range(count)
+                ),
+                encoding="utf-8",
+            )
+        text = run_audit(dry_run=True).read_text(encoding="utf-8")
+        assert "| Actions Logged | 2 | 1 | +1 (+100%) |" in text
+
+    def test_collectors_share_one_listing(self, vault, monkeypatch):
+        seen = []
+        real_snapshot, real_social = audit_gen.collect_vault_snapshot, audit_gen.collect_social_metrics
+        monkeypatch.setattr(audit_gen, "collect_vault_snapshot",
+                            lambda dirs=None: seen.append(dirs) or real_snapshot(dirs=dirs))
+        monkeypatch.setattr(audit_gen, "collect_social_metrics",
+                            lambda dirs=None, entries=None:
+                            seen.append(dirs) or real_social(dirs, entries=entries))
+        (vault["DONE"] / "TWITTER_1.md").write_text("x")
+        run_audit(dry_run=True)
+        assert len(seen) == 2 and seen[0] is seen[1]
+        assert vault["DONE"] in seen[0]
+
+    def test_progress_flushed_on_failure(self, vault, monkeypatch):
+        def boom(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(audit_gen, "generate_ceo_briefing", boom)
+        with pytest.raises(RuntimeError):
+            run_audit(dry_run=True)
+        progress = (vault["LOGS"] / "gold_tier_progress.md").read_text(encoding="utf-8")
+        assert progress.count("**audit_started**") == 1
+        assert "**audit_complete**" not in progress
@@ -0,0 +1,371 @@
+"""Tests for src/audit_logger.py — Gold tier Task 8."""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+
+import src.audit_logger as audit_logger
+from src.audit_logger import (
+    audit_log,
+    audit_log_binary,
+    audit_snapshot,
+    decode_binary_log,
+    flush,
+    get_period_stats,
+    purge_old_logs,
+    read_logs,
+    weekly_audit_summary,
+)
+
+
+def _today_log(vault):
+    return vault["LOGS"] / f"{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.json"
+
+
+class TestAuditLog:
+    def test_flush_writes_queued_entries(self, vault):
+        audit_log("file_done", "FILE_a.md")
+        audit_log("email_send", "bob@example.com", result="failure", error="smtp")
+        flush()
+        lines = _today_log(vault).read_text(encoding="utf-8").splitlines()
+        assert [json.loads(l)["action_type"] for l in lines] == ["file_done", "email_send"]
+        assert json.loads(lines[1])["error"] == "smtp"
+
+    def test_read_logs_sees_unflushed_entries(self, vault):
+        audit_log("file_done", "FILE_a.md")
+        assert [e["target"] for e in read_logs()] == ["FILE_a.md"]
+
+    def test_stdlib_json_fallback(self, vault, monkeypatch):
+        monkeypatch.setattr(audit_logger, "orjson", None)
+        audit_log("file_done", "Résumé.pdf", parameters={"n": 2**70})
+        entry = read_logs()[0]
+        assert entry["target"] == "Résumé.pdf"
+        assert entry["parameters"]["n"] == 2**70
+
+    def test_queue_is_drained(self, vault):
+        audit_log("file_done", "FILE_a.md")
+        flush()
+        assert not audit_logger._QUEUE
+
+    def test_oversized_entry_fits_pipe_buf(self, vault):
+        audit_log("email_send", "bob@example.com", parameters={"body": "x" * 10_000},
+                  result="failure", error="e" * 10_000)
+        flush()
+        line = _today_log(vault).read_bytes()
+        assert len(line) < audit_logger._PIPE_BUF
+        entry = json.loads(line)
+        assert entry["parameters"]["_truncated"] is True
+        assert entry["error"] == "e" * audit_logger._MAX_ERROR_CHARS
+
+    def test_large_batch_written_in_whole_line_chunks(self, vault, monkeypatch):
+        writes = []
+        real_write = audit_logger.os.write
+        monkeypatch.setattr(audit_logger.os, "write",
+                            lambda fd, data: writes.append(data) or real_write(fd, data))
+        for i in range(200):
+            audit_log("file_done", f"FILE_{i:03}.md")
+        flush()
+        assert len(writes) > 1
+        assert all(len(w) <= audit_logger._PIPE_BUF and w.endswith(b"\n") for w in writes)
+        assert len(read_logs()) == 200
+
+
+class TestBinaryLog:
+    def test_round_trip(self, vault):
+        audit_log_binary("file_done", "Done/FILE_" + "x" * 40 + ".md", actor="watcher",
+                         parameters={"retries": 1})
+        audit_log_binary("file_retry", "FILE_b.md", result="failure")
+        flush()
+        bin_log = _today_log(vault).with_suffix(".bin")
+        assert bin_log.stat().st_size == 2 * 48
+        first, second = decode_binary_log(bin_log)
+        assert first["action_type"] == "file_done"
+        assert first["actor"] == "watcher"
+        assert first["target"] == ("Done/FILE_" + "x" * 40)[:32]
+        assert first["parameters"]["crc32"] != 0
+        assert (second["result"], second["parameters"]) == ("failure", {})
+
+    def test_unknown_values_fall_back_to_jsonl(self, vault):
+        audit_log_binary("email_send", "bob@example.com")
+        flush()
+        assert not _today_log(vault).with_suffix(".bin").exists()
+        assert read_logs()[0]["action_type"] == "email_send"
+
+    def test_read_logs_merges_binary_records(self, vault):
+        audit_log("email_send", "a")
+        audit_log_binary("file_done", "b")
+        audit_log("payment_initiated", "c", result="failure")
+        assert [e["target"] for e in read_logs()] == ["a", "b", "c"]
+        assert [e["target"] for e in read_logs(action_type_filter="file_done")] == ["b"]
+        assert get_period_stats(days=1)["actions"]["file_done"] == 1
+
+    def test_partial_trailing_record_ignored(self, vault):
+        audit_log_binary("file_done", "a")
+        flush()
+        bin_log = _today_log(vault).with_suffix(".bin")
+        with open(bin_log, "ab") as f:
+            f.write(b"\x00" * 10)
+        assert [e["target"] for e in decode_binary_log(bin_log)] == ["a"]
+
+
+class TestReadLogs:
+    def test_filters(self, vault):
+        audit_log("email_send", "a", result="success")
+        audit_log("email_send", "b", result="failure")
+        audit_log("file_done", "c", actor="watcher")
+        assert [e["target"] for e in read_logs(action_type_filter="email_send")] == ["a", "b"]
+        assert [e["target"] for e in read_logs(result_filter="failure")] == ["b"]
+        assert [e["target"] for e in read_logs(actor_filter="watcher")] == ["c"]
+
+    def test_filters_match_both_json_spacings(self, vault):
+        _today_log(vault).write_text(
+            '{"timestamp": "t1", "action_type": "email_send", "result": "success"}\n'
+            '{"timestamp":"t2","action_type":"email_send","result":"success"}\n'
+            '{"timestamp":"t3","action_type":"file_done","target":"email_send"}\n',
+            encoding="utf-8",
+        )
+        found = read_logs(action_type_filter="email_send", result_filter="success")
+        assert [e["timestamp"] for e in found] == ["t1", "t2"]
+
+    def test_days_returned_oldest_first(self, vault):
+        now = datetime.now(timezone.utc)
+        for offset in (0, 2, 1):
+            day = now - timedelta(days=offset)
+            (vault["LOGS"] / f"{day.strftime('%Y-%m-%d')}.json").write_text(
+                json.dumps({"timestamp": day.isoformat(), "action_type": f"d{offset}"}) + "\n",
+                encoding="utf-8",
+            )
+        assert [e["action_type"] for e in read_logs(days=3)] == ["d2", "d1", "d0"]
+
+    def test_chronological_across_writers(self, vault):
+        from src.utils import log_action
+
+        audit_log("first", "a")
+        log_action("second", "b")
+        assert [e["action_type"] for e in read_logs()] == ["first", "second"]
+
+    def test_large_closed_day_read_via_mmap(self, vault, monkeypatch):
+        monkeypatch.setattr(audit_logger, "_MMAP_MIN_BYTES", 1)
+        mapped = []
+        real_mmap = audit_logger.mmap.mmap
+        monkeypatch.setattr(audit_logger.mmap, "mmap",
+                            lambda *a, **kw: mapped.append(a) or real_mmap(*a, **kw))
+        day = datetime.now(timezone.utc) - timedelta(days=1)
+        (vault["LOGS"] / f"{day.strftime('%Y-%m-%d')}.json").write_text(
+            '{"timestamp": "t1", "action_type": "a"}\n\nnot json\n'
+            '{"timestamp": "t2", "action_type": "b"}',   # no trailing newline
+            encoding="utf-8",
+        )
+        audit_log("file_done", "today")
+        found = read_logs(days=2)
+        assert [e["action_type"] for e in found] == ["a", "b", "file_done"]
+        assert len(mapped) == 1   # today's file is streamed, not mapped
+
+    def test_skips_corrupt_lines(self, vault):
+        _today_log(vault).write_text(
+            '{"timestamp": "2026-01-01T00:00:00", "action_type": "x"}\nnot json\n\n',
+            encoding="utf-8",
+        )
+        with open(_today_log(vault), "ab") as f:
+            f.write(b'{"action_type": "\xff"}\n')
+        assert [e["action_type"] for e in read_logs()] == ["x"]
+
+
+class TestGetPeriodStats:
+    def test_counts(self, vault):
+        audit_log("twitter_post", "t")
+        audit_log("social_post_approved", "s")
+        audit_log("email_send", "e")
+        audit_log("payment_initiated", "p", result="failure")
+        stats = get_period_stats(days=7)
+        assert stats["total_entries"] == 4
+        assert stats["social_posts"] == 2
+        assert stats["emails_sent"] == 1
+        assert stats["payments"] == 1
+        assert stats["failures"] == 1
+        assert stats["failure_rate"] == 25.0
+        assert stats["recent_failures"][0]["target"] == "p"
+
+    def test_recent_failures_keeps_last_ten(self, vault):
+        for i in range(15):
+            audit_log("email_send", f"r{i}", result="failure")
+        stats = get_period_stats(days=1)
+        assert stats["failures"] == 15
+        assert [e["target"] for e in stats["recent_failures"]] == [f"r{i}" for i in range(5, 15)]
+
+    def test_action_kind_memoised(self, vault):
+        audit_log("facebook_post", "f")
+        audit_log("payment_error", "p")
+        audit_log("facebook_post", "g")
+        stats = get_period_stats(days=1)
+        assert (stats["social_posts"], stats["payments"]) == (2, 1)
+        assert audit_logger._ACTION_KIND["facebook_post"] == (True, False)
+        assert audit_logger._ACTION_KIND["payment_error"] == (False, True)
+
+
+    def test_closed_days_cached_in_sidecar(self, vault):
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        log = vault["LOGS"] / f"{yesterday.strftime('%Y-%m-%d')}.json"
+        log.write_text(
+            json.dumps({"timestamp": yesterday.isoformat(), "action_type": "email_send",
+                        "result": "success"}) + "\n",
+            encoding="utf-8",
+        )
+        audit_log("file_done", "today")
+        assert get_period_stats(days=7)["total_entries"] == 2
+        sidecar = vault["LOGS"] / ".stats" / log.name
+        assert json.loads(sidecar.read_text())["emails_sent"] == 1
+        assert json.loads(sidecar.read_text())["actions"] == {"email_send": 1}
+        assert not (vault["LOGS"] / ".stats" / _today_log(vault).name).exists()
+
+        # A matching sidecar is trusted as-is ...
+        cached = json.loads(sidecar.read_text())
+        cached["payments"] = 42
+        sidecar.write_text(json.dumps(cached))
+        assert get_period_stats(days=7)["payments"] == 42
+
+        # ... and rebuilt once the log changes underneath it
+        with open(log, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"timestamp": yesterday.isoformat(), "action_type": "x"}) + "\n")
+        stats = get_period_stats(days=7)
+        assert stats["payments"] == 0
+        assert stats["total_entries"] == 3
+
+
+class TestPurgeOldLogs:
+    def test_deletes_only_dated_logs_past_retention(self, vault):
+        now = datetime.now(timezone.utc)
+        old = vault["LOGS"] / f"{(now - timedelta(days=100)).strftime('%Y-%m-%d')}.json"
+        recent = vault["LOGS"] / f"{(now - timedelta(days=10)).strftime('%Y-%m-%d')}.json"
+        for f in (old, recent, vault["LOGS"] / ".seen_hashes.json",
+                  vault["LOGS"] / "gold_tier_progress.md"):
+            f.write_text("{}\n")
+        (vault["LOGS"] / ".stats").mkdir()
+        old_sidecar = vault["LOGS"] / ".stats" / old.name
+        old_sidecar.write_text("{}")
+        assert purge_old_logs(retention_days=90) == 1
+        assert not old.exists() and not old_sidecar.exists()
+        assert recent.with_name(f"{recent.name}.gz").exists()  # kept, but rotated
+        assert (vault["LOGS"] / ".seen_hashes.json").exists()
+
+    def test_missing_logs_folder(self, vault):
+        vault["LOGS"].rmdir()
+        assert purge_old_logs() == 0
+
+    def test_rotates_closed_days_to_gzip(self, vault):
+        now = datetime.now(timezone.utc)
+        days = [(now - timedelta(days=n)).strftime("%Y-%m-%d") for n in (0, 1, 3, 100)]
+        for day in days:
+            (vault["LOGS"] / f"{day}.json").write_text(
+                json.dumps({"timestamp": f"{day}T12:00:00", "action_type": "x"}) + "\n",
+                encoding="utf-8",
+            )
+        (vault["LOGS"] / f"{days[3]}.json").rename(vault["LOGS"] / f"{days[3]}.json.gz")
+        assert purge_old_logs(retention_days=90) == 1
+        assert (vault["LOGS"] / f"{days[0]}.json").exists()
+        assert (vault["LOGS"] / f"{days[1]}.json").exists()
+        assert not (vault["LOGS"] / f"{days[2]}.json").exists()
+        with gzip.open(vault["LOGS"] / f"{days[2]}.json.gz", "rt", encoding="utf-8") as f:
+            assert json.loads(f.readline())["action_type"] == "x"
+        assert not (vault["LOGS"] / f"{days[3]}.json.gz").exists()
+        assert not list(vault["LOGS"].glob(".*.tmp"))
+
+    def test_log_janitor_rotates_too(self, vault, monkeypatch):
+        import src.log_janitor as log_janitor
+
+        monkeypatch.setattr(log_janitor, "LOGS", vault["LOGS"])
+        day = (datetime.now(timezone.utc) - timedelta(days=3)).strftime("%Y-%m-%d")
+        (vault["LOGS"] / f"{day}.json").write_text('{"action_type": "x"}\n')
+        assert log_janitor.purge_logs(dry_run=True)["rotated"] == 0
+        assert log_janitor.purge_logs()["rotated"] == 1
+        assert (vault["LOGS"] / f"{day}.json.gz").exists()
+
+    def test_rotated_days_still_readable(self, vault):
+        day = datetime.now(timezone.utc) - timedelta(days=3)
+        (vault["LOGS"] / f"{day.strftime('%Y-%m-%d')}.json").write_text(
+            json.dumps({"timestamp": day.isoformat(), "action_type": "email_send",
+                        "result": "success"}) + "\n",
+            encoding="utf-8",
+        )
+        purge_old_logs()
+        assert [e["action_type"] for e in read_logs(days=7)] == ["email_send"]
+        assert get_period_stats(days=7)["emails_sent"] == 1
+
+
+class TestWeeklyAuditSummary:
+    def test_tallies(self, vault):
+        audit_log("file_done", "a")
+        audit_log("file_done", "b", actor="watcher")
+        audit_log("email_send", "c", result="failure", error="smtp down",
+                  approval_status="human_approved")
+        summary = weekly_audit_summary(append_to_dashboard=False)
+        assert "(3 total log entries)" in summary
+        assert "| Success | 2 |" in summary
+        assert "| Failure | 1 |" in summary
+        assert "| Watcher | 1 |" in summary
+        assert "| Human Approved | 1 |" in summary
+        assert summary.index("| file_done | 2 |") < summary.index("| email_send | 1 |")
+        assert "smtp down" in summary
+
+    def test_closed_days_tallied_from_sidecars(self, vault):
+        yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+        log = vault["LOGS"] / f"{yesterday.strftime('%Y-%m-%d')}.json"
+        log.write_text(
+            json.dumps({"timestamp": yesterday.isoformat(), "action_type": "email_send",
+                        "actor": "human", "result": "failure", "error": "bounced"}) + "\n",
+            encoding="utf-8",
+        )
+        audit_log("file_done", "today")
+        summary = weekly_audit_summary(append_to_dashboard=False)
+        assert "(2 total log entries)" in summary
+        assert "| Human | 1 |" in summary
+        assert "bounced" in summary
+
+        # The closed day is not re-parsed: its tallies come from the sidecar
+        sidecar = vault["LOGS"] / ".stats" / log.name
+        cached = json.loads(sidecar.read_text())
+        cached["actors"] = {"human": 7}
+        sidecar.write_text(json.dumps(cached))
+        assert "| Human | 7 |" in weekly_audit_summary(append_to_dashboard=False)
+
+    def test_shared_snapshot(self, vault, monkeypatch):
+        audit_log("email_send", "a", result="failure", error="smtp down")
+        audit_log("twitter_post", "b")
+        with audit_snapshot(days=7) as entries:
+            monkeypatch.setattr(audit_logger, "read_logs", None)  # no further reads
+            stats = get_period_stats(entries=entries)
+            summary = weekly_audit_summary(append_to_dashboard=False, entries=entries)
+        assert (stats["total_entries"], stats["social_posts"]) == (2, 1)
+        assert "(2 total log entries)" in summary
+        assert "smtp down" in summary
+
+    def test_replaces_previous_dashboard_block(self, vault):
+        dashboard = vault["VAULT_PATH"] / "Dashboard.md"
+        dashboard.write_text("# Dashboard\n\nStatus table\n", encoding="utf-8")
+        weekly_audit_summary()
+        weekly_audit_summary()
+        text = dashboard.read_text(encoding="utf-8")
+        assert text.startswith("# Dashboard\n\nStatus table\n")
+        assert text.count("## 📊 Weekly Audit Summary") == 1
+
+    def test_keeps_content_after_marked_block(self, vault):
+        dashboard = vault["VAULT_PATH"] / "Dashboard.md"
+        dashboard.write_text("# Dashboard\n", encoding="utf-8")
+        weekly_audit_summary()
+        dashboard.write_text(dashboard.read_text(encoding="utf-8") + "## Notes\nkeep me\n",
+                             encoding="utf-8")
+        weekly_audit_summary()
+        text = dashboard.read_text(encoding="utf-8")
+        assert text.count("## 📊 Weekly Audit Summary") == 1
+        assert text.endswith("<!-- WEEKLY_AUDIT_SUMMARY_END -->\n## Notes\nkeep me\n")
+
+    def test_migrates_unmarked_legacy_block(self, vault):
+        dashboard = vault["VAULT_PATH"] / "Dashboard.md"
+        dashboard.write_text(
+            "# Dashboard\n\n---\n\n## 📊 Weekly Audit Summary — 2026-01-04\n\nold stats\n",
+            encoding="utf-8",
+        )
+        weekly_audit_summary()
+        text = dashboard.read_text(encoding="utf-8")
+        assert "old stats" not in text
+        assert text.startswith("# Dashboard\n<!-- WEEKLY_AUDIT_SUMMARY_START -->")
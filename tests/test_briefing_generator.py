@@ -11,6 +11,7 @@ from src.briefing_generator import (
     _collect_quarantine,
     _compute_health_score,
     _count,
+    _scan_done,
     _source_breakdown,
     _type_breakdown,
     generate_briefing,
@@ -19,6 +20,68 @@ from src.briefing_generator import (
 )
 
 
+class _CountingFile:
+    """Wraps a binary file and records the size of every read()."""
+
+    def __init__(self, fh, sizes):
+        self.fh, self.sizes = fh, sizes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fh.close()
+
+    def read(self, n=-1):
+        self.sizes.append(n)
+        return self.fh.read(n)
+
+
+class TestReadFrontmatter:
+    def test_reads_only_the_head(self, tmp_path, monkeypatch):
+        import builtins
+
+        import src.briefing_generator as bg
+
+        f = tmp_path / "FILE_big.md"
+        f.write_text("---\ntype: invoice\nstatus: pending\n---\n" + "body line\n" * 50_000)
+        sizes = []
+        monkeypatch.setattr(
+            bg, "open", lambda *a, **kw: _CountingFile(builtins.open(*a, **kw), sizes), raising=False,
+        )
+        assert bg._read_frontmatter(f) == {"type": "invoice", "status": "pending"}
+        assert sizes == [bg._FM_HEAD_BYTES]
+
+    def test_no_frontmatter_stops_after_first_chunk(self, tmp_path, monkeypatch):
+        import builtins
+
+        import src.briefing_generator as bg
+
+        f = tmp_path / "notes.md"
+        f.write_text("plain notes\n" * 20_000)
+        sizes = []
+        monkeypatch.setattr(
+            bg, "open", lambda *a, **kw: _CountingFile(builtins.open(*a, **kw), sizes), raising=False,
+        )
+        assert bg._read_frontmatter(f) == {}
+        assert sizes == [bg._FM_HEAD_BYTES]
+        assert bg._parse_frontmatter("intro\n---\na: b\n---\n") == {}
+
+    def test_frontmatter_longer_than_one_chunk(self, tmp_path):
+        import src.briefing_generator as bg
+
+        f = tmp_path / "FILE_long.md"
+        f.write_text("---\nnotes: " + "x" * 20_000 + "\nstatus: pending\n---\nbody\n")
+        assert bg._read_frontmatter(f)["status"] == "pending"
+
+    def test_frontmatter_past_cap_is_ignored(self, tmp_path):
+        import src.briefing_generator as bg
+
+        f = tmp_path / "FILE_huge.md"
+        f.write_text("---\nnotes: " + "x" * (bg._FM_READ_CAP + 10) + "\nstatus: pending\n---\n")
+        assert bg._read_frontmatter(f) == {}
+
+
 class TestCountHelper:
     def test_empty_folder(self, tmp_path):
         assert _count(tmp_path) == 0
@@ -69,6 +132,109 @@ class TestCollectDoneInPeriod:
         assert items == []
 
 
+class TestScanDone:
+    def test_items_and_revenue_from_one_read(self, vault, monkeypatch):
+        done = vault["DONE"]
+        now = datetime.now(timezone.utc)
+        (done / "FILE_1_inv.md").write_text(
+            f"---\noriginal_name: inv.pdf\ntype: invoice\nsource: gmail\npayment_state: paid\n"
+            f"processed_at: {now.isoformat()}\n---\nInvoice total: $1,250.50\n"
+        )
+        (done / "FILE_2_memo.md").write_text(
+            f"---\noriginal_name: memo.txt\ntype: other\nprocessed_at: {now.isoformat()}\n---\nTotal: 99\n"
+        )
+        import src.briefing_generator as bg
+
+        reads = []
+        real_read_text = bg._read_text
+        monkeypatch.setattr(bg, "_read_text", lambda path: reads.append(Path(path).name) or real_read_text(path))
+
+        items, revenue = _scan_done(now - timedelta(hours=1))
+
+        assert sorted(reads) == ["FILE_1_inv.md", "FILE_2_memo.md"]
+        assert {i["name"] for i in items} == {"inv.pdf", "memo.txt"}
+        assert revenue["total_revenue"] == 1250.50
+        assert (revenue["paid_count"], revenue["unpaid_count"]) == (1, 0)
+        assert revenue["invoices"][0]["name"] == "inv.pdf"
+
+    def test_parallel_scan_matches_serial(self, vault, monkeypatch):
+        import src.briefing_generator as bg
+
+        done = vault["DONE"]
+        now = datetime.now(timezone.utc)
+        for i in range(12):
+            (done / f"FILE_{i:02d}.md").write_text(
+                f"---\noriginal_name: r{i}.pdf\ntype: {'receipt' if i % 3 == 0 else 'other'}\n"
+                f"processed_at: {(now - timedelta(minutes=i)).isoformat()}\n---\nAmount: {i}.00\n"
+            )
+        since = now - timedelta(hours=1)
+        parallel = _scan_done(since)
+        monkeypatch.setattr(bg, "_SCAN_PARALLEL_MIN", 10**6)
+        assert _scan_done(since) == parallel
+        assert len(parallel[0]) == 12
+        assert parallel[1]["total_revenue"] == 0 + 3 + 6 + 9
+
+    def test_unchanged_files_are_not_reread(self, vault, monkeypatch):
+        import os
+        import src.briefing_generator as bg
+
+        bg._done_record.cache_clear()
+        done = vault["DONE"]
+        now = datetime.now(timezone.utc)
+        for name in ("a", "b"):
+            (done / f"FILE_{name}.md").write_text(
+                f"---\noriginal_name: {name}.pdf\ntype: other\nprocessed_at: {now.isoformat()}\n---\n"
+            )
+        reads = []
+        real_read_text = bg._read_text
+        monkeypatch.setattr(bg, "_read_text", lambda path: reads.append(os.path.basename(path)) or real_read_text(path))
+        since = now - timedelta(hours=1)
+
+        first = _scan_done(since)
+        first[0][0]["name"] = "mutated"
+        second = _scan_done(since)
+        assert sorted(reads) == ["FILE_a.md", "FILE_b.md"]
+        assert {i["name"] for i in second[0]} == {"a.pdf", "b.pdf"}
+
+        edited = done / "FILE_a.md"
+        edited.write_text(edited.read_text().replace("a.pdf", "a2.pdf"))
+        os.utime(edited, ns=(edited.stat().st_mtime_ns + 10**9,) * 2)
+        third = _scan_done(since)
+        assert sorted(reads) == ["FILE_a.md", "FILE_a.md", "FILE_b.md"]
+        assert {i["name"] for i in third[0]} == {"a2.pdf", "b.pdf"}
+
+    def test_processed_at_formats(self):
+        import src.briefing_generator as bg
+
+        utc = timezone.utc
+        assert bg._parse_processed_at("2026-03-02T11:00:00Z") == datetime(2026, 3, 2, 11, tzinfo=utc)
+        assert bg._parse_processed_at("2026-03-02T11:00:00") == datetime(2026, 3, 2, 11, tzinfo=utc)
+        assert bg._parse_processed_at("2026-03-02T16:00:00+05:00") == datetime(2026, 3, 2, 11, tzinfo=utc)
+        assert bg._parse_processed_at("yesterday") is None
+
+
+class TestExtractDeadlines:
+    def test_caps_per_file_and_total_and_stops_reading(self, vault, monkeypatch):
+        import os
+        import src.briefing_generator as bg
+
+        done = vault["DONE"]
+        for i in range(6):
+            f = done / f"FILE_{i}.md"
+            f.write_text("".join(f"- [ ] task {i}.{n} due friday\n" for n in range(5)))
+            os.utime(f, (1_000_000 + i, 1_000_000 + i))
+        reads = []
+        real_read_text = bg._read_text
+        monkeypatch.setattr(bg, "_read_text", lambda path: reads.append(os.path.basename(path)) or real_read_text(path))
+
+        deadlines = bg._extract_deadlines_from_done(datetime.now(timezone.utc))
+
+        assert len(deadlines) == 10
+        assert deadlines[:3] == [f"- [ ] task 5.{n} due friday" for n in range(3)]
+        assert deadlines[-1] == "- [ ] task 2.0 due friday"
+        assert reads == ["FILE_5.md", "FILE_4.md", "FILE_3.md", "FILE_2.md"]
+
+
 class TestCollectPending:
     def test_empty_needs_action(self, vault):
         result = _collect_pending()
@@ -112,6 +278,12 @@ class TestCollectQuarantine:
         assert len(items) == 1
         assert "bad.pdf" in items[0]["name"]
 
+    def test_skips_directories_and_non_md(self, vault):
+        q = vault["QUARANTINE"]
+        (q / "sub.md").mkdir()
+        (q / "bad.pdf").write_bytes(b"%PDF")
+        assert _collect_quarantine() == []
+
     def test_ignores_reason_files(self, vault):
         q = vault["QUARANTINE"]
         (q / "bad.pdf.reason.md").write_text("reason file")
@@ -142,6 +314,13 @@ class TestBreakdowns:
         assert counts["invoice"] == 2
         assert counts["contract"] == 1
 
+    def test_breakdown_defaults(self):
+        assert _source_breakdown([]) == {"file_drop": 0, "gmail": 0, "whatsapp": 0}
+        assert _source_breakdown([{}, {"source": "discord"}]) == {
+            "file_drop": 1, "gmail": 0, "whatsapp": 0, "discord": 1,
+        }
+        assert _type_breakdown([{}, {"type": "invoice"}, {}]) == {"other": 2, "invoice": 1}
+
 
 class TestHealthScore:
     def test_perfect_health(self):
@@ -186,6 +365,24 @@ class TestGenerateBriefing:
         assert "Daily Briefing" in content
         assert "health_score" in content
 
+    def test_each_folder_listed_once(self, vault, monkeypatch):
+        import src.briefing_generator as bg
+
+        now = datetime.now(timezone.utc).isoformat()
+        (vault["DONE"] / "FILE_1.md").write_text(f"---\ntype: other\nprocessed_at: {now}\n---\n- [ ] pay by monday\n")
+        (vault["NEEDS_ACTION"] / "FILE_2.md").write_text("---\nstatus: pending\n---\n")
+        listed = []
+        real_listing = bg._listing
+        monkeypatch.setattr(bg, "_listing", lambda folder: listed.append(folder.name) or real_listing(folder))
+
+        content = generate_briefing("weekly").read_text()
+
+        assert sorted(listed) == sorted(set(listed))
+        assert len(listed) == 10
+        assert "| Total in Done/ | 1 |" in content
+        assert "| Pending in queue | 1 |" in content
+        assert "- [ ] pay by monday" in content
+
     def test_generates_weekly_briefing(self, vault):
         path = generate_briefing("weekly")
         assert path.exists()
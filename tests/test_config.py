@@ -75,3 +75,19 @@ class TestOrchestratorSettings:
 
     def test_max_retries_positive(self):
         assert MAX_RETRIES >= 1
+
+
+class TestValidateConfig:
+    def test_reports_missing_vault_folders(self, vault):
+        import shutil
+
+        from src.config import validate_config
+
+        assert "Missing vault folder: Done" not in validate_config()
+        shutil.rmtree(vault["DONE"])
+        (vault["VAULT_PATH"] / "Inbox").rmdir()
+        (vault["VAULT_PATH"] / "Inbox").write_text("not a folder")
+        missing = [i for i in validate_config() if i.startswith("Missing vault folder")]
+        assert "Missing vault folder: Done" in missing
+        assert "Missing vault folder: Inbox" in missing
+        assert "Missing vault folder: Logs" not in missing
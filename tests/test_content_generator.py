@@ -2,10 +2,16 @@
 
 from pathlib import Path
 
+import os
+
+import src.automations.content_generator as content_gen
 from src.automations.content_generator import (
     TEMPLATES,
     generate_post,
+    generate_posts,
     _generate_fallback,
+    _get_recent_activity,
+    _load_business_context,
 )
 
 
@@ -52,3 +58,75 @@ class TestGeneratePost:
     def test_works_with_context(self):
         result = generate_post("Launch", context="Q1 was great")
         assert isinstance(result, str)
+
+
+class TestContextCaching:
+    def test_business_context_refreshes_on_change(self, tmp_path, monkeypatch):
+        handbook = tmp_path / "Company_Handbook.md"
+        monkeypatch.setattr(content_gen, "HANDBOOK", handbook)
+        assert _load_business_context().startswith("Zoya")
+        handbook.write_text("Acme handbook", encoding="utf-8")
+        assert _load_business_context() == "Acme handbook"
+        handbook.write_text("Acme handbook v2", encoding="utf-8")
+        os.utime(handbook, ns=(1, 10**18))
+        assert _load_business_context() == "Acme handbook v2"
+
+    def test_recent_activity_refreshes_when_done_changes(self, tmp_path, monkeypatch):
+        done = tmp_path / "Done"
+        done.mkdir()
+        monkeypatch.setattr(content_gen, "DONE", done)
+        assert _get_recent_activity() == ""
+        (done / "FILE_a.md").write_text("---\noriginal_name: invoice.pdf\n---\n")
+        assert _get_recent_activity() == "Recent activity: invoice.pdf"
+        assert _get_recent_activity() == "Recent activity: invoice.pdf"
+
+    def test_recent_activity_newest_five_only(self, tmp_path, monkeypatch):
+        done = tmp_path / "Done"
+        done.mkdir()
+        monkeypatch.setattr(content_gen, "DONE", done)
+        for i in range(7):
+            f = done / f"FILE_{i}.md"
+            f.write_text(f"---\noriginal_name: doc{i}.pdf\n---\n" + "x" * 4096)
+            os.utime(f, (1_000_000 + i, 1_000_000 + i))
+        (done / "TWITTER_x.md").write_text("---\noriginal_name: tweet\n---\n")
+        assert _get_recent_activity() == (
+            "Recent activity: doc6.pdf, doc5.pdf, doc4.pdf, doc3.pdf, doc2.pdf"
+        )
+
+
+class TestClientReuse:
+    def _fake_openai(self, monkeypatch, created):
+        import openai
+
+        class FakeCompletions:
+            def create(self, model, messages, **kwargs):
+                topic = messages[1]["content"].split("Topic: ", 1)[1].split("\n", 1)[0]
+                message = type("M", (), {"content": f"<think>hm</think>Post about {topic}"})
+                return type("R", (), {"choices": [type("C", (), {"message": message})]})
+
+        class FakeOpenAI:
+            def __init__(self, api_key, base_url):
+                created.append(base_url)
+                self.chat = type("Chat", (), {"completions": FakeCompletions()})
+
+        monkeypatch.setattr(openai, "OpenAI", FakeOpenAI)
+        monkeypatch.setattr(content_gen, "AI_PROVIDER", "ollama")
+        monkeypatch.setattr(content_gen, "_CLIENTS", {})
+
+    def test_client_created_once(self, monkeypatch):
+        created = []
+        self._fake_openai(monkeypatch, created)
+        assert generate_post("Launch") == "Post about Launch"
+        assert generate_post("Hiring") == "Post about Hiring"
+        assert len(created) == 1
+        content_gen._reset_client()
+        generate_post("Again")
+        assert len(created) == 2
+
+    def test_generate_posts_keeps_order(self, monkeypatch):
+        created = []
+        self._fake_openai(monkeypatch, created)
+        topics = [f"topic {i}" for i in range(6)]
+        assert generate_posts(topics) == [f"Post about {t}" for t in topics]
+        assert len(created) == 1
+        assert generate_posts([]) == []
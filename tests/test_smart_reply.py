@@ -0,0 +1,362 @@
+"""Tests for src/automations/smart_reply.py — Gmail smart reply drafter."""
+
+import errno
+import os
+from types import SimpleNamespace
+
+import src.automations.smart_reply as smart_reply
+from src.automations.smart_reply import (
+    HIGH_PRIORITY_BODY_KEYWORDS,
+    HIGH_PRIORITY_SUBJECT_KEYWORDS,
+    _extract_body_from_md,
+    _extract_email_address,
+    generate_reply_with_claude,
+    process_emails_for_smart_reply_batch,
+    _load_known_emails,
+    _read_frontmatter,
+    classify_email,
+)
+
+
+def _contact(folder, name, identity):
+    (folder / f"CONTACT_{name}.md").write_text(f"---\nidentity: {identity}\n---\n", encoding="utf-8")
+
+
+class TestClassifyEmail:
+    def test_every_subject_keyword_hits(self):
+        for kw in HIGH_PRIORITY_SUBJECT_KEYWORDS:
+            assert classify_email("x@y.com", f"Re: {kw.upper()} today", "", set())[1] == "high"
+
+    def test_every_body_keyword_hits(self):
+        for kw in HIGH_PRIORITY_BODY_KEYWORDS:
+            should_draft, priority, _ = classify_email("x@y.com", "Hello", f"Hi, {kw}.", set())
+            assert (should_draft, priority) == (True, "medium")
+
+    def test_vip_without_keywords(self):
+        assert classify_email("Ann <ann@client.com>", "Hello", "Thanks", {"ann@client.com"}) == (
+            True, "medium", "VIP client (ann@client.com)",
+        )
+
+    def test_body_keyword_past_scan_window_ignored(self):
+        body = "x" * 2000 + " urgent"
+        assert classify_email("x@y.com", "Hello", body, set())[0] is False
+
+    def test_non_ascii_text_still_matches(self):
+        assert classify_email("a@b.com", "Café — URGENT", "", set())[1] == "high"
+        assert classify_email("a@b.com", "Grüße", "Bitte: PAYMENT DUE bald", set())[1] == "medium"
+        assert classify_email("a@b.com", "Grüße", "Schöne Woche", set())[0] is False
+
+    def test_mixed_case_subject_and_body_fold(self):
+        assert classify_email("a@b.com", "Invoice Overdue", "", set())[1] == "high"
+        assert classify_email("a@b.com", "hello", "URGENT: call me", set())[1] == "medium"
+
+    def test_trie_pattern_matches_substring_semantics(self):
+        pattern = smart_reply._keyword_re(frozenset({"pay", "payment due", "past due", "issue"}))
+        cases = {
+            "your payment due friday": True, "repay": True, "issues": True,
+            "past": False, "pa": False, "iss": False, "": False,
+        }
+        for text, hit in cases.items():
+            assert (pattern.search(text) is not None) is hit, text
+
+
+class TestLoadKnownEmails:
+    def test_cached_until_contacts_or_handbook_change(self, tmp_path, monkeypatch):
+        contacts = tmp_path / "Contacts"
+        contacts.mkdir()
+        handbook = tmp_path / "Company_Handbook.md"
+        monkeypatch.setattr(smart_reply, "CONTACTS_DIR", contacts)
+        monkeypatch.setattr(smart_reply, "HANDBOOK", handbook)
+        _contact(contacts, "ann", "Ann@Client.com")
+        (contacts / "notes.md").write_text("---\nidentity: skip@me.com\n---\n")
+        assert _load_known_emails() == {"ann@client.com"}
+
+        reads = []
+        real_identity = smart_reply._contact_identity
+        monkeypatch.setattr(smart_reply, "_contact_identity",
+                            lambda p: reads.append(p) or real_identity(p))
+        assert _load_known_emails() == {"ann@client.com"}
+        assert reads == []
+
+        handbook.write_text("Escalations: Boss@Company.co.uk\n", encoding="utf-8")
+        _contact(contacts, "bob", "bob@vendor.io")
+        os.utime(contacts, ns=(1, 10**18))
+        assert _load_known_emails() == {"ann@client.com", "bob@vendor.io", "boss@company.co.uk"}
+
+    def test_contact_frontmatter_past_head(self, tmp_path, monkeypatch):
+        contacts = tmp_path / "Contacts"
+        contacts.mkdir()
+        monkeypatch.setattr(smart_reply, "CONTACTS_DIR", contacts)
+        monkeypatch.setattr(smart_reply, "HANDBOOK", tmp_path / "missing.md")
+        (contacts / "CONTACT_long.md").write_text(
+            "---\nnotes: " + "n" * 5000 + "\nidentity: Late@Client.com\n---\n", encoding="utf-8",
+        )
+        (contacts / "CONTACT_plain.md").write_text("identity: no@frontmatter.com\n", encoding="utf-8")
+        (contacts / "CONTACT_dir.md").mkdir()
+        assert _load_known_emails() == {"late@client.com"}
+
+
+class TestMetadataReads:
+    def test_frontmatter_ignores_large_body(self, tmp_path):
+        md = tmp_path / "EMAIL_1.md"
+        md.write_text("---\nfrom: Ann <ann@client.com>\nsubject: Hi\n---\n" + "x" * 100_000 + "\nfake: no\n")
+        assert _read_frontmatter(md) == {"from": "Ann <ann@client.com>", "subject": "Hi"}
+
+    def test_frontmatter_longer_than_head(self, tmp_path):
+        md = tmp_path / "EMAIL_2.md"
+        md.write_text("---\nnotes: " + "y" * 10_000 + "\nsubject: Late\n---\nbody\n")
+        assert _read_frontmatter(md)["subject"] == "Late"
+
+    def test_frontmatter_missing(self, tmp_path):
+        md = tmp_path / "EMAIL_3.md"
+        md.write_text("no frontmatter here\n")
+        assert _read_frontmatter(md) == {}
+
+    def test_body_section_and_fallback(self, tmp_path):
+        md = tmp_path / "EMAIL_4.md"
+        md.write_text("---\na: b\n---\n## Email Content\n\nHéllo there\n\n## Actions\n- reply\n")
+        assert _extract_body_from_md(md) == "Héllo there"
+        plain = tmp_path / "EMAIL_5.md"
+        plain.write_text("z" * 500 + "body" + "w" * 5000)
+        assert _extract_body_from_md(plain) == ("body" + "w" * 5000)[:3000]
+
+
+class _FakeMessages:
+    def __init__(self, text):
+        self.text = text
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text=self.text)])
+
+
+class TestGenerateReply:
+    def _no_cli(self, *args, **kwargs):
+        raise AssertionError("claude CLI should not be spawned")
+
+    def test_api_client_reused_across_drafts(self, monkeypatch):
+        messages = _FakeMessages("  Thanks, on it.  ")
+        monkeypatch.setattr(smart_reply, "ANTHROPIC_API_KEY", "key")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_USE_CLI", False)
+        monkeypatch.setitem(smart_reply._CLIENTS, "anthropic", SimpleNamespace(messages=messages))
+        monkeypatch.setattr("subprocess.run", self._no_cli)
+
+        for _ in range(2):
+            assert generate_reply_with_claude("a@b.com", "Invoice", "Pay me", "Warm", "high") == "Thanks, on it."
+        assert len(messages.calls) == 2
+        assert messages.calls[0]["model"] == smart_reply.SMART_REPLY_MODEL
+        assert "Subject: Invoice" in messages.calls[0]["messages"][0]["content"]
+
+    def test_prompt_keeps_braces_in_email_text(self, monkeypatch):
+        messages = _FakeMessages("ok")
+        monkeypatch.setattr(smart_reply, "ANTHROPIC_API_KEY", "key")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_USE_CLI", False)
+        monkeypatch.setitem(smart_reply._CLIENTS, "anthropic", SimpleNamespace(messages=messages))
+        generate_reply_with_claude("a@b.com", "Quote {ref}", "Total: {amount}" + "x" * 3000, "Warm", "high")
+        prompt = messages.calls[0]["messages"][0]["content"]
+        assert "Subject: Quote {ref}\n" in prompt
+        assert "Body:\nTotal: {amount}" + "x" * (2000 - len("Total: {amount}")) + "\n\n---" in prompt
+
+    def test_cli_flag_uses_subprocess(self, monkeypatch):
+        monkeypatch.setattr(smart_reply, "ANTHROPIC_API_KEY", "key")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_USE_CLI", True)
+        monkeypatch.setattr(
+            "subprocess.run",
+            lambda cmd, **kw: SimpleNamespace(returncode=0, stdout="CLI draft\n"),
+        )
+        assert generate_reply_with_claude("a@b.com", "Hi", "", "Warm", "medium") == "CLI draft"
+
+    def test_api_error_falls_back_to_template(self, monkeypatch):
+        class Boom:
+            def create(self, **kwargs):
+                raise RuntimeError("overloaded")
+
+        monkeypatch.setattr(smart_reply, "ANTHROPIC_API_KEY", "key")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_USE_CLI", False)
+        monkeypatch.setitem(smart_reply._CLIENTS, "anthropic", SimpleNamespace(messages=Boom()))
+        draft = generate_reply_with_claude("a@b.com", "Quote", "", "Warm", "high")
+        assert "time-sensitive" in draft
+
+
+def _email_md(folder, name, sender, subject, body):
+    path = folder / name
+    path.write_text(
+        f"---\nsource: gmail\nfrom: {sender}\nsubject: {subject}\ngmail_id: {name}\n---\n"
+        f"## Email Content\n{body}\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestBatchSmartReply:
+    def test_one_call_for_all_drafts(self, vault, monkeypatch):
+        pending = vault["PENDING_APPROVAL"]
+        root = vault["VAULT_PATH"]
+        monkeypatch.setattr(smart_reply, "PENDING_APPROVAL", pending)
+        monkeypatch.setattr(smart_reply, "CONTACTS_DIR", vault["CONTACTS"])
+        monkeypatch.setattr(smart_reply, "HANDBOOK", root / "Company_Handbook.md")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_ENABLED", True)
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_DRY_RUN", False)
+        monkeypatch.setattr(smart_reply, "ANTHROPIC_API_KEY", "key")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_USE_CLI", False)
+        messages = _FakeMessages(
+            'Sure:\n```json\n[{"id": "0", "reply": "Paid today."}, {"id": "1", "reply": "See you."}]\n```'
+        )
+        monkeypatch.setitem(smart_reply._CLIENTS, "anthropic", SimpleNamespace(messages=messages))
+
+        paths = [
+            _email_md(root, "E1.md", "a@x.com", "Invoice overdue", "Please pay"),
+            _email_md(root, "E2.md", "b@x.com", "Weekly digest", "News"),
+            _email_md(root, "E3.md", "c@x.com", "Meeting request", "Tuesday?"),
+        ]
+        created = process_emails_for_smart_reply_batch(paths)
+
+        assert len(messages.calls) == 1
+        assert [p.parent for p in created] == [pending, pending]
+        # One shared timestamp; the index keeps same-second names distinct
+        stamps = {p.name[len("REPLY_"):len("REPLY_YYYYmmdd_HHMMSS")] for p in created}
+        assert len(stamps) == 1
+        assert [p.name.split("_")[3] for p in created] == ["000", "001"]
+        assert "Paid today." in created[0].read_text(encoding="utf-8")
+        assert "See you." in created[1].read_text(encoding="utf-8")
+
+    def test_skip_audit_flag(self, vault, monkeypatch):
+        root = vault["VAULT_PATH"]
+        audited = []
+        monkeypatch.setattr(smart_reply, "audit_log", lambda action, target, **kw: audited.append(action))
+        monkeypatch.setattr(smart_reply, "CONTACTS_DIR", vault["CONTACTS"])
+        monkeypatch.setattr(smart_reply, "HANDBOOK", root / "Company_Handbook.md")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_ENABLED", True)
+        path = _email_md(root, "E1.md", "news@x.com", "Weekly digest", "News")
+
+        assert smart_reply.process_email_for_smart_reply(path) is None
+        assert audited == ["smart_reply_skipped"]
+
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_AUDIT_SKIPS", False)
+        assert smart_reply.process_email_for_smart_reply(path) is None
+        assert audited == ["smart_reply_skipped"]
+
+    def test_missing_reply_drafted_individually(self, monkeypatch):
+        monkeypatch.setattr(smart_reply, "ANTHROPIC_API_KEY", "key")
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_USE_CLI", False)
+        messages = _FakeMessages('[{"id": "0", "reply": "First."}]')
+        monkeypatch.setitem(smart_reply._CLIENTS, "anthropic", SimpleNamespace(messages=messages))
+        emails = [
+            {"id": str(i), "from": "a@x.com", "subject": "Quote", "body": "", "priority": "high"}
+            for i in range(2)
+        ]
+        drafts = smart_reply.generate_replies_with_claude(emails, "Warm")
+        # The single-email retry gets the same fake answer, which is not a draft for id 1
+        assert drafts["0"] == "First."
+        assert drafts["1"] == '[{"id": "0", "reply": "First."}]'
+        assert len(messages.calls) == 2
+
+
+class TestDraftSection:
+    def test_extracts_until_next_heading(self):
+        text = (
+            "---\nto: a@b.com\n---\n\n# Email Reply Draft\n\n### Drafted Reply notes\n\n"
+            "## Drafted Reply\n\nHello,\n\nThanks!\n\n## Instructions\n\n- approve\n"
+        )
+        assert smart_reply._DRAFT_SECTION_RE.search(text).group(1).strip() == "Hello,\n\nThanks!"
+
+    def test_last_section(self):
+        m = smart_reply._DRAFT_SECTION_RE.search("## Drafted Reply\nOnly body\n")
+        assert m.group(1).strip() == "Only body"
+
+
+class TestProcessApprovedReplies:
+    def test_each_file_read_once_and_archived(self, vault, monkeypatch):
+        approved = vault["APPROVED"]
+        monkeypatch.setattr(smart_reply, "DONE", vault["DONE"])
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_DRY_RUN", True)
+        reply = approved / "REPLY_20260101_000000_Invoice.md"
+        reply.write_text(
+            "---\nto: a@b.com\nsubject: Re: Invoice\n---\n\n## Drafted Reply\n\nPaid.\n\n## Instructions\n",
+            encoding="utf-8",
+        )
+        # The frontmatter comes from the text already read, not a second open()
+        monkeypatch.setattr(smart_reply, "_read_frontmatter", None)
+
+        assert smart_reply.process_approved_replies(approved) == 1
+        assert (vault["DONE"] / reply.name).exists()
+        assert not reply.exists()
+
+    def test_each_reply_is_archived_before_the_next_send(self, vault, monkeypatch):
+        approved = vault["APPROVED"]
+        monkeypatch.setattr(smart_reply, "DONE", vault["DONE"])
+        monkeypatch.setattr(smart_reply, "SMART_REPLY_DRY_RUN", False)
+        for i in range(3):
+            (approved / f"REPLY_2026010{i}_000000_S{i}.md").write_text(
+                f"---\nto: c{i}@b.com\nsubject: Re: S{i}\n---\n\n## Drafted Reply\n\nBody {i}\n",
+                encoding="utf-8",
+            )
+        events = []
+
+        def send(to, subject, body):
+            events.append(("send", to, len(list(approved.glob("REPLY_*.md")))))
+            return to != "c1@b.com"
+
+        monkeypatch.setattr(smart_reply, "_send_reply", send)
+        monkeypatch.setattr(
+            smart_reply, "audit_log", lambda action, target, **kw: events.append((action, target)),
+        )
+
+        assert smart_reply.process_approved_replies(approved) == 3
+        assert [e[0] for e in events] == [
+            "send", "smart_reply_sent",
+            "send", "smart_reply_send_failed",
+            "send", "smart_reply_sent",
+        ]
+        # Earlier replies are already in Done/ when the next one is sent
+        assert [e[2] for e in events if e[0] == "send"] == [3, 2, 1]
+        assert len(list(vault["DONE"].glob("REPLY_*.md"))) == 3
+
+    def test_archive_falls_back_to_copy_across_devices(self, tmp_path, monkeypatch):
+        src = tmp_path / "REPLY_x.md"
+        src.write_text("hi")
+        done = tmp_path / "Done"
+        done.mkdir()
+
+        def cross_device(self, target):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(type(src), "rename", cross_device)
+        assert smart_reply._archive(src, done) == done / "REPLY_x.md"
+        assert (done / "REPLY_x.md").read_text() == "hi"
+        assert not src.exists()
+
+
+class TestExtractEmailAddress:
+    def test_matches_parseaddr(self):
+        from email.utils import parseaddr
+
+        for raw in (
+            " Ann@Client.com ", "Ann <Ann@Client.com>", '"Doe, J" <j@d.io>',
+            "j@d.io (John)", "a@b@c", "", "no-at-sign", "Ann a@b.com",
+            "user@x.com;", "mailto:user@x.com", "user@x.com:", "[user@x.com]",
+        ):
+            assert _extract_email_address(raw) == parseaddr(raw)[1].lower().strip(), raw
+
+    def test_punctuated_sender_still_matches_known_client(self):
+        assert _extract_email_address("user@x.com;") == "user@x.com"
+        assert _extract_email_address("mailto:User@X.com") == "user@x.com"
+
+
+class TestWriteReplyApprovalFile:
+    def test_same_subject_in_one_batch_does_not_collide(self, tmp_path, monkeypatch):
+        from datetime import datetime, timezone
+
+        monkeypatch.setattr(smart_reply, "PENDING_APPROVAL", tmp_path)
+        now = datetime(2026, 3, 1, 9, 30, tzinfo=timezone.utc)
+        paths = [
+            smart_reply._write_reply_approval_file(
+                "g", "a@b.com", "Invoice", f"draft {i}", tmp_path / "e.md", "high", "kw", now=now, index=i,
+            )
+            for i in range(2)
+        ]
+        assert [p.name for p in paths] == [
+            "REPLY_20260301_093000_000_Invoice.md", "REPLY_20260301_093000_001_Invoice.md",
+        ]
+        assert "created_at: 2026-03-01T09:30:00+00:00" in paths[1].read_text(encoding="utf-8")